@@ -43,7 +43,10 @@ from fidesops.ops.service.connectors.saas.connector_registry_service import (
     update_saas_configs,
 )
 from fidesops.ops.tasks.scheduled.scheduler import scheduler
-from fidesops.ops.tasks.scheduled.tasks import initiate_scheduled_request_intake
+from fidesops.ops.tasks.scheduled.tasks import (
+    initiate_scheduled_cache_purge,
+    initiate_scheduled_request_intake,
+)
 from fidesops.ops.util.cache import get_cache
 from fidesops.ops.util.logger import Pii, get_fides_log_record_factory
 from fidesops.ops.util.oauth_util import verify_oauth_client
@@ -276,6 +279,10 @@ def start_webserver() -> None:
         logger.info("Starting scheduled request intake...")
         initiate_scheduled_request_intake()
 
+    if config.database.enabled and config.redis.enabled:
+        logger.info("Starting scheduled cache purge...")
+        initiate_scheduled_cache_purge()
+
     asyncio.run(
         send_analytics_event(
             AnalyticsEvent(
@@ -59,7 +59,10 @@ from fidesops.ops.schemas.connection_configuration.connection_secrets import (
     TestStatusMessage,
 )
 from fidesops.ops.schemas.shared_schemas import FidesOpsKey
+from fidesops.ops.service.authentication.oauth2_token_cache import oauth2_token_cache
 from fidesops.ops.service.connectors import get_connector
+from fidesops.ops.service.connectors.engine_registry import engine_registry
+from fidesops.ops.service.connectors.saas.session_pool import session_pool
 from fidesops.ops.service.privacy_request.request_runner_service import (
     queue_privacy_request,
 )
@@ -249,6 +252,9 @@ def delete_connection(
     connection_type = connection_config.connection_type
     logger.info("Deleting connection config with key '%s'.", connection_key)
     connection_config.delete(db)
+    engine_registry.invalidate(connection_key)
+    session_pool.invalidate(connection_key)
+    oauth2_token_cache.invalidate(connection_key)
 
     # Access Manual Webhooks are cascade deleted if their ConnectionConfig is deleted,
     # so we queue any privacy requests that are no longer blocked by webhooks
@@ -345,6 +351,10 @@ async def put_connection_config_secrets(
     # Save validated secrets, regardless of whether they've been verified.
     logger.info("Updating connection config secrets for '%s'", connection_key)
     connection_config.save(db=db)
+    # Connections opened with the previous secrets shouldn't be reused
+    engine_registry.invalidate(connection_key)
+    session_pool.invalidate(connection_key)
+    oauth2_token_cache.invalidate(connection_key)
 
     msg = f"Secrets updated for ConnectionConfig with key: {connection_key}."
     if verify:
@@ -12,7 +12,7 @@ from fidesops.ops.common_exceptions import RedisConnectionError
 from fidesops.ops.core.config import config
 from fidesops.ops.db.database import get_alembic_config
 from fidesops.ops.util.api_router import APIRouter
-from fidesops.ops.util.cache import get_cache
+from fidesops.ops.util.cache import check_cache_connection
 from fidesops.ops.util.logger import Pii
 
 router = APIRouter(tags=["Public"])
@@ -58,7 +58,7 @@ def get_cache_health() -> str:
     if not config.redis.enabled:
         return "no cache configured"
     try:
-        get_cache()
+        check_cache_connection()
         return "healthy"
     except (RedisConnectionError, ResponseError) as e:
         logger.error("Unable to reach cache: %s", Pii(str(e)))
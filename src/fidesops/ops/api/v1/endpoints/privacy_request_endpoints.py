@@ -5,7 +5,7 @@ import io
 import logging
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Union
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
 
 import sqlalchemy
 from fastapi import Body, Depends, HTTPException, Security
@@ -98,8 +98,11 @@ from fidesops.ops.schemas.privacy_request import (
     BulkPostPrivacyRequests,
     BulkReviewResponse,
     CheckpointActionRequired,
+    CollectionProfileResponse,
+    CriticalPathResponse,
     DenyPrivacyRequests,
     ExecutionLogDetailResponse,
+    ExecutionProfileResponse,
     ManualWebhookData,
     PrivacyRequestCreate,
     PrivacyRequestResponse,
@@ -109,6 +112,7 @@ from fidesops.ops.schemas.privacy_request import (
     VerificationCode,
 )
 from fidesops.ops.service._verification import send_verification_code_to_user
+from fidesops.ops.service.dataset_graph_cache import get_dataset_graph
 from fidesops.ops.service.email.email_dispatch_service import dispatch_email_task
 from fidesops.ops.service.privacy_request.request_runner_service import (
     queue_privacy_request,
@@ -117,6 +121,7 @@ from fidesops.ops.service.privacy_request.request_service import (
     build_required_privacy_request_kwargs,
     cache_data,
 )
+from fidesops.ops.task.execution_profile import NodeProfile, find_critical_path
 from fidesops.ops.task.graph_task import EMPTY_REQUEST, collect_queries
 from fidesops.ops.task.task_resources import TaskResources
 from fidesops.ops.tasks import EMAIL_QUEUE_NAME
@@ -710,6 +715,72 @@ def get_request_status_logs(
     )
 
 
+@router.get(
+    urls.REQUEST_PROFILE,
+    dependencies=[Security(verify_oauth_client, scopes=[scopes.PRIVACY_REQUEST_READ])],
+    response_model=ExecutionProfileResponse,
+)
+def get_request_profile(
+    privacy_request_id: str,
+    *,
+    db: Session = Depends(deps.get_db),
+) -> ExecutionProfileResponse:
+    """Returns the time spent running each collection of a given privacy request, and the critical path:
+    the chain of dependent collections that took the longest, for each action type.
+
+    If a collection was run more than once, for example when the privacy request was restarted,
+    only the most recent run is included."""
+
+    get_privacy_request_or_error(db, privacy_request_id)
+
+    logger.info("Building execution profile for privacy request %s", privacy_request_id)
+
+    logs: Dict[Tuple[ActionType, str], ExecutionLog] = {}
+    for log in (
+        ExecutionLog.query(db=db)
+        .filter(
+            ExecutionLog.privacy_request_id == privacy_request_id,
+            ExecutionLog.profile.isnot(None),
+        )
+        .order_by(ExecutionLog.created_at.asc())
+    ):
+        address = CollectionAddress(log.dataset_name, log.collection_name).value
+        logs[(log.action_type, address)] = log
+
+    profiles_by_action: DefaultDict[ActionType, Dict[str, NodeProfile]] = defaultdict(
+        dict
+    )
+    collections: List[CollectionProfileResponse] = []
+    for (action_type, address), log in logs.items():
+        profiles_by_action[action_type][address] = log.profile
+        collections.append(
+            CollectionProfileResponse(
+                dataset_name=log.dataset_name,
+                collection_name=log.collection_name,
+                action_type=action_type,
+                status=log.status,
+                total=log.profile.get("total", 0.0),
+                stages=log.profile.get("stages", {}),
+                upstream=log.profile.get("upstream", []),
+            )
+        )
+
+    critical_paths: List[CriticalPathResponse] = []
+    for action_type in [ActionType.access, ActionType.erasure]:
+        if action_type not in profiles_by_action:
+            continue
+        duration, path = find_critical_path(profiles_by_action[action_type])
+        critical_paths.append(
+            CriticalPathResponse(
+                action_type=action_type, duration=duration, collections=path
+            )
+        )
+
+    return ExecutionProfileResponse(
+        collections=collections, critical_paths=critical_paths
+    )
+
+
 @router.put(
     REQUEST_PREVIEW,
     status_code=HTTP_200_OK,
@@ -885,9 +956,7 @@ async def resume_privacy_request_with_manual_input(
             f"'{PRIVACY_REQUEST_MANUAL_ERASURE if paused_step == CurrentStep.erasure else PRIVACY_REQUEST_MANUAL_INPUT}' to resume.",
         )
 
-    datasets = DatasetConfig.all(db=db)
-    dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-    dataset_graph = DatasetGraph(*dataset_graphs)
+    dataset_graph: DatasetGraph = get_dataset_graph(db)
 
     if not paused_collection:
         raise HTTPException(
@@ -169,6 +169,10 @@ class ClientUnsuccessfulException(FidesopsException):
         super().__init__(message=f"Client call failed with status code '{status_code}'")
 
 
+class RateLimitExceededException(FidesopsException):
+    """Exception for when a request would wait too long for a SaaS API's rate limit"""
+
+
 class NoSuchStrategyException(ValueError):
     """Exception for when a masking strategy does not exist"""
 
@@ -39,6 +39,25 @@ class ExecutionSettings(FidesSettings):
     task_retry_count: int = 0
     task_retry_delay: int = 0  # In seconds
     task_retry_backoff: int = 0
+    # By default Fidesops runs one graph node at a time
+    task_max_workers: int = 1
+    task_max_workers_per_connection: int = 1
+    # Engines for SQL connections are kept between privacy requests, with these pool options
+    connector_pool_size: int = 5
+    connector_max_overflow: int = 10
+    connector_pool_pre_ping: bool = True
+    connector_idle_timeout: int = 600  # In seconds
+    # The most input values bound to a SQL query, and the most rows masked by a single update
+    sql_query_batch_size: int = 1000
+    sql_update_batch_size: int = 500
+    # The most update operations sent in a single MongoDB bulk write
+    mongo_update_batch_size: int = 1000
+    # HTTP sessions to SaaS APIs are also kept between privacy requests, closed after connector_idle_timeout
+    saas_max_connections_per_host: int = 10
+    saas_connect_timeout: float = 10  # In seconds
+    saas_read_timeout: float = 120  # In seconds
+    # Requests that would wait longer than this for a SaaS rate limit fail instead
+    saas_rate_limit_max_wait: float = 300  # In seconds
     subject_identity_verification_required: bool = False
     require_manual_request_approval: bool = False
     masking_strict: bool = True
@@ -60,6 +79,10 @@ class RedisSettings(FidesSettings):
     decode_responses: bool = True
     default_ttl_seconds: int = 604800
     identity_verification_code_ttl_seconds: int = 600
+    cache_purge_interval_seconds: int = 3600
+    max_connections: int = 50
+    connection_pool_timeout: int = 20
+    health_check_interval: int = 30
     db_index: Optional[int]
     enabled: bool = True
     ssl: bool = False
@@ -243,6 +266,10 @@ CONFIG_KEY_ALLOWLIST = {
         "charset",
         "decode_responses",
         "default_ttl_seconds",
+        "cache_purge_interval_seconds",
+        "max_connections",
+        "connection_pool_timeout",
+        "health_check_interval",
         "db_index",
     ],
     "security": [
@@ -255,6 +282,19 @@ CONFIG_KEY_ALLOWLIST = {
         "task_retry_count",
         "task_retry_delay",
         "task_retry_backoff",
+        "task_max_workers",
+        "task_max_workers_per_connection",
+        "connector_pool_size",
+        "connector_max_overflow",
+        "connector_pool_pre_ping",
+        "connector_idle_timeout",
+        "sql_query_batch_size",
+        "sql_update_batch_size",
+        "mongo_update_batch_size",
+        "saas_max_connections_per_host",
+        "saas_connect_timeout",
+        "saas_read_timeout",
+        "saas_rate_limit_max_wait",
         "require_manual_request_approval",
         "subject_identity_verification_required",
     ],
@@ -80,9 +80,21 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from fidesops.ops.common_exceptions import FidesopsException
 from fidesops.ops.graph.data_type import (
@@ -231,7 +243,7 @@ class FieldAddress:
 
 
 class Field(BaseModel, ABC):
-    """A single piece of data"""
+    """A single piece of data. Fields can't be changed once built, use `copy(update=...)` instead."""
 
     name: str
     primary_key: bool = False
@@ -257,6 +269,7 @@ class Field(BaseModel, ABC):
         """for pydantic incorporation of custom non-pydantic types"""
 
         arbitrary_types_allowed = True
+        allow_mutation = False
 
     @abstractmethod
     def cast(self, value: Any) -> Optional[Any]:
@@ -409,8 +422,22 @@ class MaskingOverride:
     length: Optional[int]
 
 
+class CollectionIndexes(NamedTuple):
+    """Read-only indexes of the fields of a Collection"""
+
+    field_dict: Mapping[FieldPath, Field]
+    top_level_field_dict: Mapping[FieldPath, Field]
+    primary_key_field_paths: Mapping[FieldPath, Field]
+    field_paths_by_category: Mapping[FidesOpsKey, List[FieldPath]]
+    # Data categories starting with each prefix looked up, mapped to their FieldPaths
+    category_prefix_matches: Dict[str, Mapping[FidesOpsKey, List[FieldPath]]]
+
+
 class Collection(BaseModel):
-    """A single grouping of individual data points that are accessed together"""
+    """A single grouping of individual data points that are accessed together.
+
+    The fields are indexed when the collection is built, so collections and their fields can't be
+    changed afterwards. Use `copy(update=...)` to get a collection with other fields."""
 
     name: str
     fields: List[Field]
@@ -419,18 +446,73 @@ class Collection(BaseModel):
     # An optional set of dependent fields that need to be queried together
     grouped_inputs: Set[str] = set()
 
+    _indexes: CollectionIndexes = PrivateAttr()
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._indexes = self._build_indexes()
+
+    def copy(self, **kwargs: Any) -> Collection:  # type: ignore[override]
+        """Copies the collection, indexing the copy's fields, which may have been updated"""
+        copied: Collection = super().copy(**kwargs)
+        copied._indexes = copied._build_indexes()  # pylint: disable=protected-access
+        return copied
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the read-only indexes can't be pickled, they're rebuilt when unpickled
+        return {**super().__getstate__(), "__private_attribute_values__": {}}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._indexes = self._build_indexes()
+
     @property
-    def field_dict(self) -> Dict[FieldPath, Field]:
+    def indexes(self) -> CollectionIndexes:
+        """Indexes of this collection's fields, built with the collection"""
+        return self._indexes
+
+    def _build_indexes(self) -> CollectionIndexes:
+        field_dict: Dict[FieldPath, Field] = self.recursively_collect_matches(
+            lambda f: True
+        )
+        categories: Dict[FidesOpsKey, List[FieldPath]] = defaultdict(list)
+        for field_path, field in field_dict.items():
+            for category in field.data_categories or []:
+                categories[category].append(field_path)
+
+        return CollectionIndexes(
+            field_dict=MappingProxyType(field_dict),
+            top_level_field_dict=MappingProxyType(
+                {FieldPath(field.name): field for field in self.fields}
+            ),
+            primary_key_field_paths=MappingProxyType(
+                {
+                    field_path: field
+                    for field_path, field in field_dict.items()
+                    if field.primary_key
+                }
+            ),
+            field_paths_by_category=MappingProxyType(dict(categories)),
+            category_prefix_matches={},
+        )
+
+    @property
+    def field_dict(self) -> Mapping[FieldPath, Field]:
         """Maps FieldPaths to Fields
 
         Flattens all the Fields so they are on one level: all nested fields are brought to the top.
         """
-        return self.recursively_collect_matches(lambda f: True)
+        return self.indexes.field_dict
 
     @property
-    def top_level_field_dict(self) -> Dict[FieldPath, Field]:
+    def top_level_field_dict(self) -> Mapping[FieldPath, Field]:
         """Returns a map of top-level FieldPaths mapped to fields"""
-        return {FieldPath(field.name): field for field in self.fields}
+        return self.indexes.top_level_field_dict
+
+    @property
+    def primary_key_field_paths(self) -> Mapping[FieldPath, Field]:
+        """Maps the FieldPaths of the fields marked as primary keys to their Fields"""
+        return self.indexes.primary_key_field_paths
 
     def recursively_collect_matches(
         self, func: Callable[[Field], bool]
@@ -463,10 +545,10 @@ class Collection(BaseModel):
 
     def field(self, field_path: FieldPath) -> Optional[Field]:
         """Return Field (looked up by FieldPath) if on Collection or None if not found"""
-        return self.field_dict[field_path] if field_path in self.field_dict else None
+        return self.field_dict.get(field_path)
 
     @property
-    def field_paths_by_category(self) -> Dict[FidesOpsKey, List[FieldPath]]:
+    def field_paths_by_category(self) -> Mapping[FidesOpsKey, List[FieldPath]]:
         """Returns mapping of data categories to a list of FieldPaths, flips FieldPaths -> categories
         to be categories -> FieldPaths.
 
@@ -479,16 +561,36 @@ class Collection(BaseModel):
                 "user.contact.address.postal_code": ["zip"]
             }
         """
-        categories = defaultdict(list)
-        for field_path, field in self.field_dict.items():
-            for category in field.data_categories or []:
-                categories[category].append(field_path)
-        return categories
+        return self.indexes.field_paths_by_category
+
+    def field_paths_by_category_prefix(
+        self, prefix: str
+    ) -> Mapping[FidesOpsKey, List[FieldPath]]:
+        """Returns the subset of `field_paths_by_category` whose data categories start with the prefix,
+        such as a rule's target data category, so "user.contact" matches "user.contact.address.city".
+
+        Matches are kept for each prefix, so each rule target is only compared against this
+        collection's data categories once."""
+        indexes: CollectionIndexes = self.indexes
+        matches: Optional[
+            Mapping[FidesOpsKey, List[FieldPath]]
+        ] = indexes.category_prefix_matches.get(prefix)
+        if matches is None:
+            matches = MappingProxyType(
+                {
+                    category: field_paths
+                    for category, field_paths in indexes.field_paths_by_category.items()
+                    if category.startswith(prefix)
+                }
+            )
+            indexes.category_prefix_matches[prefix] = matches
+        return matches
 
     class Config:
         """for pydantic incorporation of custom non-pydantic types"""
 
         arbitrary_types_allowed = True
+        allow_mutation = False
 
 
 class Dataset(BaseModel):
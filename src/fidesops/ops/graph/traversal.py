@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import Any, Callable, Dict, List, Set, Tuple, cast
-
-import pydash.collections
+import threading
+from collections import defaultdict
+from copy import copy
+from itertools import count
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
 
 from fidesops.ops.common_exceptions import TraversalError
 from fidesops.ops.graph.config import (
@@ -17,7 +21,6 @@ from fidesops.ops.graph.config import (
 )
 from fidesops.ops.graph.graph import DatasetGraph, Edge, Node
 from fidesops.ops.util.collection_util import Row, append
-from fidesops.ops.util.matching_queue import MatchingQueue
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,9 @@ class TraversalNode:
             CollectionAddress, List[Tuple[TraversalNode, FieldPath, FieldPath]]
         ] = {}
         self.is_terminal_node = False
+        # incoming edges are derived from the parents, so are cached until another parent is linked
+        self._incoming_edges: Optional[Set[Edge]] = None
+        self._query_field_paths: Optional[Set[FieldPath]] = None
 
     def add_child(self, child_node: TraversalNode, edge: Edge) -> None:
         """Add other as a child to this traversal_node along the provided edge."""
@@ -62,17 +68,23 @@ class TraversalNode:
                 self_field_address.collection_address(),
                 (self, self_field_address.field_path, other_field_address.field_path),
             )
+            child_node._incoming_edges = None  # pylint: disable=W0212
+            child_node._query_field_paths = None  # pylint: disable=W0212
 
     def incoming_edges(self) -> Set[Edge]:
-        """Return the incoming edges to this traversal_node,in (other.address -> self.address) order."""
-        return {
-            Edge(
-                p_collection_address.field_address(parent_field_path),
-                self.address.field_address(self_field_path),
-            )
-            for p_collection_address, tuples in self.parents.items()
-            for _, parent_field_path, self_field_path in tuples
-        }
+        """Return the incoming edges to this traversal_node,in (other.address -> self.address) order.
+
+        The returned set is cached and shared between callers, so must not be modified."""
+        if self._incoming_edges is None:
+            self._incoming_edges = {
+                Edge(
+                    p_collection_address.field_address(parent_field_path),
+                    self.address.field_address(self_field_path),
+                )
+                for p_collection_address, tuples in self.parents.items()
+                for _, parent_field_path, self_field_path in tuples
+            }
+        return self._incoming_edges
 
     def incoming_edges_from_same_dataset(self) -> Set[Edge]:
         """Return the incoming edges from the same dataset"""
@@ -103,7 +115,11 @@ class TraversalNode:
         All of the possible field paths that we can query for possible filter values.
         These are field paths that are the ends of incoming edges.
         """
-        return {edge.f2.field_path for edge in self.incoming_edges()}
+        if self._query_field_paths is None:
+            self._query_field_paths = {
+                edge.f2.field_path for edge in self.incoming_edges()
+            }
+        return self._query_field_paths
 
     def typed_filtered_values(self, input_data: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
@@ -177,7 +193,7 @@ def artificial_traversal_node(address: CollectionAddress) -> TraversalNode:
     return TraversalNode(node)
 
 
-class Traversal:
+class Traversal:  # pylint: disable=too-many-instance-attributes
     """Handling for a single reified traversal of a graph based on input (seed) data."""
 
     def extract_seed_field_addresses(
@@ -213,52 +229,42 @@ class Traversal:
                 )
             )
 
-        self.__verify_traversal()
+        # edges indexed by the collections at either end
+        self.edges_by_collection: Dict[CollectionAddress, Set[Edge]] = defaultdict(set)
+        for edge in self.edges:
+            self.edges_by_collection[edge.f1.collection_address()].add(edge)
+            self.edges_by_collection[edge.f2.collection_address()].add(edge)
 
-    def __verify_traversal(self) -> None:
-        """Verify that a valid traversal exists. This method simply assembles a traversal
-        and raises an error on any traversal failure conditions."""
-        self.traverse(
-            {self.root_node.address: [self.seed_data]},
-            lambda n, m: logger.info("Traverse %s", n.address),
-        )
+        # the order traversal_nodes are visited in, and the nodes the traversal ends on
+        self.plan: List[TraversalNode] = []
+        self.end_nodes: List[CollectionAddress] = []
+        self.__plan_traversal()
 
-    def traversal_map(
+    def __after_dependencies(
         self,
-    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[CollectionAddress]]:
-        """Generate a descriptive map of the traversal generated.
-
-        For each traversal_node N, list
-         { N.address:
-             {"from": {traversal_node address:
-                       [field in "from", field in N for all edges from "from" to N]}}
-             {"to": {traversal_node address,
-                       [field in N, field in "to"" for all edges from N to "to"]}}
-
-        """
-
-        def traversal_dict_fn(
-            tn: TraversalNode, data: Dict[CollectionAddress, Dict[str, Any]]
-        ) -> None:
-            data[tn.address] = tn.debug()
-
-        db = {ROOT_COLLECTION_ADDRESS: [self.seed_data]}
-        traversal_ends = self.traverse(db, traversal_dict_fn)
-
-        return {str(k): v for k, v in db.items()}, traversal_ends
-
-    def traverse(  # pylint: disable=R0914
-        self,
-        environment: Dict[CollectionAddress, Any],
-        node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
-    ) -> List[CollectionAddress]:
-        """Traverse and call run() on each traversal_node in turn. T represents an environment that
-        can provide or collect values as each traversal_node is run.
-
-        Returns a list of termination traversal_node addresses so that we can take action on completed
-        traversal.
-
+    ) -> Dict[CollectionAddress, Set[CollectionAddress]]:
+        """Map each traversal_node to the traversal_nodes it is configured to run `after`, whether directly
+        or because they are in a dataset it must run after."""
+        addresses_by_dataset: Dict[str, Set[CollectionAddress]] = defaultdict(set)
+        for address in self.traversal_node_dict:
+            addresses_by_dataset[address.dataset].add(address)
+
+        waits_on: Dict[CollectionAddress, Set[CollectionAddress]] = {}
+        for address, tn in self.traversal_node_dict.items():
+            waits_on[address] = tn.node.collection.after.intersection(
+                self.traversal_node_dict
+            ).union(
+                *(
+                    addresses_by_dataset.get(dataset, set())
+                    for dataset in tn.node.dataset.after
+                )
+            )
+        return waits_on
 
+    def __plan_traversal(self) -> None:  # pylint: disable=R0912,R0914,R0915
+        """Work out the order in which traversal_nodes are visited, linking each to its parents and children
+        along the way. This also verifies that a valid traversal exists, raising an error on any traversal
+        failure conditions.
 
         We define the root traversal_node as a traversal_node whose children are any nodes that have identity (seed)
         data.
@@ -266,90 +272,117 @@ class Traversal:
         - a queue holding only the root traversal_node.
         - a (copied) set of all of the edges in the graph.
 
-        - Pop the first eligible traversal_node from the queue.
-        - call the passed in callable node_run_function on this traversal_node. Mark this traversal_node as "finished"
+        - Pop the first eligible traversal_node from the queue, and add it to the plan. Mark this traversal_node
+          as "finished"
         - Delete all edges from any finished nodes to this traversal_node.
         - put all of this nodes children in the queue.
 
-        Some nodes have conditions, like "don't run me until after traversal_node X". When we pop a value from
-        the queue, we are taking this into account. If the queue contains nodes, but none of them are
-        eligible (e.g. Node A can't run until after B, and traversal_node B that can't run until after A)
-        raise a TraversalError.
+        Some nodes have conditions, like "don't run me until after traversal_node X". Each traversal_node keeps
+        a count of the unfinished nodes it is waiting on, and is only eligible to be popped once that count
+        reaches zero. Eligible nodes are popped in the order they were queued. If the queue contains nodes, but
+        none of them are eligible (e.g. Node A can't run until after B, and traversal_node B that can't run until
+        after A) raise a TraversalError.
 
         We also raise a TraversalError if the queue is empty but some nodes have not been visited. In
         that case they are unreachable.
-
         """
-        if environment:
-            logger.info(
-                "starting traversal",
-            )
         remaining_node_keys: Set[CollectionAddress] = set(
             self.traversal_node_dict.keys()
         )
-        finished_nodes: dict[CollectionAddress, TraversalNode] = {}
-        running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
+        finished_nodes: Dict[CollectionAddress, TraversalNode] = {}
         remaining_edges: Set[Edge] = self.edges.copy()
-        while not running_node_queue.is_empty():
-
-            # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
-            n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
-            )
-
-            if n:
-                node_run_fn(n, environment)
-                # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,
-                    )
-                    # append edges that end in this traversal_node
-                    for edge in filter(
-                        lambda _edge: _edge.ends_with_collection(
-                            cast(TraversalNode, n).address
-                        ),
-                        completed_edges,
-                    ):
-                        # note, this will not work for self-reference
-                        finished_node.add_child(n, edge)
-                # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
-                # in the form (field_address_this, field_address_foreign)
 
-                edges_to_children = pydash.collections.filter_(
-                    [
-                        e.split_by_address(cast(TraversalNode, n).address)
-                        for e in remaining_edges
-                        if e.contains(n.address)
-                    ]
-                )
-                if not edges_to_children:
-                    n.is_terminal_node = True
-
-                # child traversal_node addresses are the address portion of the above
-                child_node_addresses = {
-                    a[1].collection_address() for a in edges_to_children if a
-                }
-                for nxt_address in child_node_addresses:
-                    # only add the next traversal_node to the queue if it is not already there (no duplicates)
-                    running_node_queue.push_if_new(
-                        self.traversal_node_dict[nxt_address]
-                    )
-                finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
+        # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
+        waits_on = self.__after_dependencies()
+        waiting_count: Dict[CollectionAddress, int] = {
+            address: len(blockers) for address, blockers in waits_on.items()
+        }
+        dependents: Dict[CollectionAddress, List[CollectionAddress]] = defaultdict(list)
+        for address, blockers in waits_on.items():
+            for blocker in blockers:
+                dependents[blocker].append(address)
+
+        # queued traversal_nodes are either eligible to run, in a heap ordered by when they were queued,
+        # or blocked waiting on other nodes to finish.
+        queued_order: Dict[CollectionAddress, int] = {}
+        eligible: List[Tuple[int, CollectionAddress]] = []
+        blocked: Dict[CollectionAddress, int] = {}
+        counter = count()
+
+        def push_if_new(tn: TraversalNode) -> None:
+            if tn.address in queued_order:
+                return
+            order = next(counter)
+            queued_order[tn.address] = order
+            if waiting_count.get(tn.address, 0):
+                blocked[tn.address] = order
             else:
+                heapq.heappush(eligible, (order, tn.address))
+
+        def node_for(address: CollectionAddress) -> TraversalNode:
+            if address == ROOT_COLLECTION_ADDRESS:
+                return self.root_node
+            return self.traversal_node_dict[address]
+
+        push_if_new(self.root_node)
+        while queued_order:
+            if not eligible:
+                queued = [
+                    str(address) for address in sorted(blocked, key=blocked.__getitem__)
+                ]
                 # traversal traversal_node dict diff finished nodes
                 logger.error(
                     "Node could not be reached given specified ordering [%s]",
-                    ",".join([str(tn.address) for tn in running_node_queue.data]),
+                    ",".join(queued),
                 )
                 raise TraversalError(
                     f"""Node could not be reached given the specified ordering:
-                    [{','.join([str(tn.address) for tn in running_node_queue.data])}]"""
+                    [{','.join(queued)}]"""
                 )
 
+            _, address = heapq.heappop(eligible)
+            del queued_order[address]
+            n = node_for(address)
+            self.plan.append(n)
+
+            # delete all edges between the traversal_node that's just run and any completed nodes
+            edges_to_children: List[Tuple[FieldAddress, FieldAddress]] = []
+            for edge in self.edges_by_collection[address].intersection(remaining_edges):
+                other_address = (
+                    edge.f2.collection_address()
+                    if edge.f1.collection_address() == address
+                    else edge.f1.collection_address()
+                )
+                if other_address in finished_nodes and edge.spans(
+                    other_address, address
+                ):
+                    remaining_edges.discard(edge)
+                    # append edges that end in this traversal_node
+                    if edge.ends_with_collection(address):
+                        finished_nodes[other_address].add_child(n, edge)
+                    continue
+                # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
+                # in the form (field_address_this, field_address_foreign)
+                split = edge.split_by_address(address)
+                if split:
+                    edges_to_children.append(split)
+
+            if not edges_to_children:
+                n.is_terminal_node = True
+
+            # child traversal_node addresses are the address portion of the above
+            for nxt_address in {a[1].collection_address() for a in edges_to_children}:
+                # only add the next traversal_node to the queue if it is not already there (no duplicates)
+                push_if_new(self.traversal_node_dict[nxt_address])
+
+            finished_nodes[address] = n
+            if address in remaining_node_keys:
+                remaining_node_keys.remove(address)
+                for dependent in dependents[address]:
+                    waiting_count[dependent] -= 1
+                    if not waiting_count[dependent] and dependent in blocked:
+                        heapq.heappush(eligible, (blocked.pop(dependent), dependent))
+
         # error if there are nodes that have not been visited
         if remaining_node_keys:
             logger.error(
@@ -369,9 +402,84 @@ class Traversal:
                 f"Some edges were not reachable: {','.join([str(x) for x in remaining_edges])}"
             )
 
-        end_nodes = [
+        self.end_nodes = [
             tn.address for tn in finished_nodes.values() if tn.is_terminal_node
         ]
+
+    def traversal_map(
+        self,
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[CollectionAddress]]:
+        """Generate a descriptive map of the traversal generated.
+
+        For each traversal_node N, list
+         { N.address:
+             {"from": {traversal_node address:
+                       [field in "from", field in N for all edges from "from" to N]}}
+             {"to": {traversal_node address,
+                       [field in N, field in "to"" for all edges from N to "to"]}}
+
+        """
+
+        def traversal_dict_fn(
+            tn: TraversalNode, data: Dict[CollectionAddress, Dict[str, Any]]
+        ) -> None:
+            data[tn.address] = tn.debug()
+
+        db = {ROOT_COLLECTION_ADDRESS: [self.seed_data]}
+        traversal_ends = self.traverse(db, traversal_dict_fn)
+
+        return {str(k): v for k, v in db.items()}, traversal_ends
+
+    def traverse(
+        self,
+        environment: Dict[CollectionAddress, Any],
+        node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
+    ) -> List[CollectionAddress]:
+        """Traverse and call run() on each traversal_node in turn. T represents an environment that
+        can provide or collect values as each traversal_node is run.
+
+        Returns a list of termination traversal_node addresses so that we can take action on completed
+        traversal.
+
+        The order traversal_nodes are visited in is worked out once, when the Traversal is created, so
+        traversing again only replays that plan.
+        """
+        if environment:
+            logger.info(
+                "starting traversal",
+            )
+        for tn in self.plan:
+            node_run_fn(tn, environment)
+
+        end_nodes = list(self.end_nodes)
         if environment:
             logger.debug("Found %s end nodes: %s", len(end_nodes), end_nodes)
         return end_nodes
+
+
+# Planned traversals of each DatasetGraph, keyed by the identity keys they were seeded with
+_traversal_plans: WeakKeyDictionary[
+    DatasetGraph, Dict[FrozenSet[str], Traversal]
+] = WeakKeyDictionary()
+_traversal_plans_lock = threading.Lock()
+
+
+def get_traversal(graph: DatasetGraph, data: Dict[str, Any]) -> Traversal:
+    """Return a Traversal of the graph seeded with the given data.
+
+    A traversal only depends on which identity keys are in the seed data, not on their values, so the
+    plan of an earlier Traversal of the same graph with the same keys is reused. The returned Traversal
+    shares its traversal_nodes with other traversals of that plan, and they must not be modified.
+
+    Plans are held for as long as the graph is, so passing in the shared DatasetGraph, which is
+    rebuilt whenever dataset or connection configs change, ties plans to that version of the graph.
+    """
+    seed_keys: FrozenSet[str] = frozenset(data.keys())
+    with _traversal_plans_lock:
+        plans = _traversal_plans.setdefault(graph, {})
+        if seed_keys not in plans:
+            plans[seed_keys] = Traversal(graph, {key: None for key in seed_keys})
+        traversal: Traversal = copy(plans[seed_keys])
+
+    traversal.seed_data = data
+    return traversal
@@ -0,0 +1,27 @@
+"""add execution log profile
+
+Revision ID: 8f3b1a6c2d45
+Revises: c4df5d585029
+Create Date: 2022-10-03 17:42:15.108364
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "8f3b1a6c2d45"
+down_revision = "c4df5d585029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "executionlog",
+        sa.Column("profile", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("executionlog", "profile")
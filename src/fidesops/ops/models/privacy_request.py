@@ -1,4 +1,4 @@
-# pylint: disable=R0401
+# pylint: disable=R0401,too-many-lines
 
 from __future__ import annotations
 
@@ -66,6 +66,7 @@ from fidesops.ops.util.cache import (
     get_encryption_cache_key,
     get_identity_cache_key,
     get_masking_secret_cache_key,
+    get_privacy_request_cache_index,
 )
 from fidesops.ops.util.collection_util import Row
 from fidesops.ops.util.constants import API_DATE_FORMAT
@@ -253,24 +254,37 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         deleting this object from the database
         """
         cache: FidesopsRedis = get_cache()
-        all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
-        for key in all_keys:
-            cache.delete(key)
+        cache.delete_keys(
+            get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
+        )
 
         for provided_identity in self.provided_identities:
             provided_identity.delete(db=db)
         super().delete(db=db)
 
+    @property
+    def cache_index(self) -> str:
+        """The key of the index of everything cached for this privacy request"""
+        return get_privacy_request_cache_index(self.id)
+
+    def create_cache_index(self) -> None:
+        """Start indexing everything cached for this privacy request, so it can be read
+        back without scanning the cache. Should be called before anything is cached."""
+        cache: FidesopsRedis = get_cache()
+        cache.create_index(self.cache_index)
+
     def cache_identity(self, identity: Identity) -> None:
         """Sets the identity's values at their specific locations in the Fidesops app cache"""
         cache: FidesopsRedis = get_cache()
         identity_dict: Dict[str, Any] = dict(identity)
-        for key, value in identity_dict.items():
-            if value is not None:
-                cache.set_with_autoexpire(
-                    get_identity_cache_key(self.id, key),
-                    value,
-                )
+        cache.set_many_with_autoexpire(
+            {
+                get_identity_cache_key(self.id, key): value
+                for key, value in identity_dict.items()
+                if value is not None
+            },
+            index=self.cache_index,
+        )
 
     def persist_identity(self, db: Session, identity: Identity) -> None:
         """
@@ -360,11 +374,13 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         repr(value),
+                        index=self.cache_index,
                     )
                 else:
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         value,
+                        index=self.cache_index,
                     )
 
     def cache_encryption(self, encryption_key: Optional[str] = None) -> None:
@@ -376,6 +392,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         cache.set_with_autoexpire(
             get_encryption_cache_key(self.id, "key"),
             encryption_key,
+            index=self.cache_index,
         )
 
     def cache_masking_secret(self, masking_secret: MaskingSecretCache) -> None:
@@ -390,20 +407,27 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
                 secret_type=masking_secret.secret_type,
             ),
             FidesopsRedis.encode_obj(masking_secret.secret),
+            index=self.cache_index,
         )
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache"""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
-        return {key.split("-")[-1]: cache.get(key) for key in keys}
+        keys = cache.get_keys_by_prefix(prefix, index=self.cache_index)
+        return {
+            key.split("-")[-1]: value
+            for key, value in cache.get_values(keys).items()
+            if value is not None
+        }
 
     def get_results(self) -> Dict[str, Any]:
         """Retrieves all cached identity data associated with this Privacy Request"""
         cache: FidesopsRedis = get_cache()
         result_prefix = f"{self.id}__*"
-        return cache.get_encoded_objects_by_prefix(result_prefix)
+        return cache.get_encoded_objects_by_prefix(
+            result_prefix, index=self.cache_index
+        )
 
     def cache_email_connector_template_contents(
         self,
@@ -418,6 +442,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
             step=step,
             collection=collection,
             action_needed=action_needed,
+            index=self.cache_index,
         )
 
     def get_email_connector_template_contents_by_dataset(
@@ -426,7 +451,8 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         """Retrieve the raw details to populate an email template for collections on a given dataset."""
         cache: FidesopsRedis = get_cache()
         email_contents: Dict[str, Optional[Any]] = cache.get_encoded_objects_by_prefix(
-            f"EMAIL_INFORMATION__{self.id}__{step.value}__{dataset}"
+            f"EMAIL_INFORMATION__{self.id}__{step.value}__{dataset}",
+            index=self.cache_index,
         )
 
         actions: List[CheckpointActionRequired] = []
@@ -449,6 +475,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
             step=step,
             collection=collection,
             action_needed=action_needed,
+            index=self.cache_index,
         )
 
     def get_paused_collection_details(
@@ -478,6 +505,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
             step=step,
             collection=collection,
             action_needed=None,
+            index=self.cache_index,
         )
 
     def get_failed_checkpoint_details(
@@ -504,6 +532,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            index=self.cache_index,
         )
 
     def get_manual_webhook_input_strict(
@@ -558,6 +587,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_INPUT__{self.id}__{collection.value}",
             manual_rows,
+            index=self.cache_index,
         )
 
     def get_manual_input(self, collection: CollectionAddress) -> Optional[List[Row]]:
@@ -570,7 +600,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         cached_results: Optional[
             Dict[str, Optional[List[Row]]]
         ] = cache.get_encoded_objects_by_prefix(
-            f"MANUAL_INPUT__{self.id}__{collection.value}"
+            f"MANUAL_INPUT__{self.id}__{collection.value}", index=self.cache_index
         )
         return list(cached_results.values())[0] if cached_results else None
 
@@ -585,6 +615,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_MASK__{self.id}__{collection.value}",
             count,
+            index=self.cache_index,
         )
 
     def get_manual_erasure_count(self, collection: CollectionAddress) -> Optional[int]:
@@ -596,21 +627,25 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
         cache: FidesopsRedis = get_cache()
         prefix = f"MANUAL_MASK__{self.id}__{collection.value}"
         value_dict: Optional[Dict[str, int]] = cache.get_encoded_objects_by_prefix(  # type: ignore
-            prefix
+            prefix, index=self.cache_index
         )
         return list(value_dict.values())[0] if value_dict else None
 
     def cache_access_graph(self, value: GraphRepr) -> None:
         """Cache a representation of the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
-        cache.set_encoded_object(f"ACCESS_GRAPH__{self.id}", value)
+        cache.set_encoded_object(
+            f"ACCESS_GRAPH__{self.id}", value, index=self.cache_index
+        )
 
     def get_cached_access_graph(self) -> Optional[GraphRepr]:
         """Fetch the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
         value_dict: Optional[
             Dict[str, Optional[GraphRepr]]
-        ] = cache.get_encoded_objects_by_prefix(f"ACCESS_GRAPH__{self.id}")
+        ] = cache.get_encoded_objects_by_prefix(
+            f"ACCESS_GRAPH__{self.id}", index=self.cache_index
+        )
         return list(value_dict.values())[0] if value_dict else None
 
     def cache_identity_verification_code(self, value: str) -> None:
@@ -620,6 +655,7 @@ class PrivacyRequest(Base):  # pylint: disable=R0904
             f"IDENTITY_VERIFICATION_CODE__{self.id}",
             value,
             config.redis.identity_verification_code_ttl_seconds,
+            index=self.cache_index,
         )
 
     def get_cached_verification_code(self) -> Optional[str]:
@@ -746,7 +782,8 @@ def _get_manual_input_from_cache(
     cached_results: Optional[
         Optional[Dict[str, Any]]
     ] = cache.get_encoded_objects_by_prefix(
-        f"WEBHOOK_MANUAL_INPUT__{privacy_request.id}__{manual_webhook.id}"
+        f"WEBHOOK_MANUAL_INPUT__{privacy_request.id}__{manual_webhook.id}",
+        index=privacy_request.cache_index,
     )
     if cached_results:
         return list(cached_results.values())[0]
@@ -859,10 +896,14 @@ class ConsentRequest(Base):
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache."""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
-        return {key.split("-")[-1]: cache.get(key) for key in keys}
+        keys = cache.get_keys_by_prefix(prefix)
+        return {
+            key.split("-")[-1]: value
+            for key, value in cache.get_values(keys).items()
+            if value is not None
+        }
 
     def get_cached_verification_code(self) -> Optional[str]:
         """Retrieve the generated identity verification code if it exists"""
@@ -896,6 +937,7 @@ def cache_action_required(
     step: Optional[CurrentStep] = None,
     collection: Optional[CollectionAddress] = None,
     action_needed: Optional[List[ManualAction]] = None,
+    index: Optional[str] = None,
 ) -> None:
     """Generic method to cache information about additional action required for a collection.
 
@@ -903,6 +945,7 @@ def cache_action_required(
     user might need to retrieve an "email" field and an "address" field where the customer_id is 22 to resume the request.
 
     The "step" describes whether action is needed in the access or the erasure portion of the request.
+    If an index is given, the cache key is added to it.
     """
     cache: FidesopsRedis = get_cache()
     action_required: Optional[CheckpointActionRequired] = None
@@ -914,6 +957,7 @@ def cache_action_required(
     cache.set_encoded_object(
         cache_key,
         action_required.dict() if action_required else None,
+        index=index,
     )
 
 
@@ -963,6 +1007,8 @@ class ExecutionLog(Base):
     fields_affected = Column(MutableList.as_mutable(JSONB), nullable=True)
     # Contains info, warning, or error messages
     message = Column(String)
+    # Time spent in each stage of running the collection, recorded once it has finished
+    profile = Column(MutableDict.as_mutable(JSONB), nullable=True)
     action_type = Column(
         EnumColumn(ActionType),
         index=True,
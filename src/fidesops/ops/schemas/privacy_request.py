@@ -108,6 +108,43 @@ class ExecutionLogDetailResponse(ExecutionLogResponse):
     dataset_name: Optional[str]
 
 
+class CollectionProfileResponse(BaseSchema):
+    """Schema for the time spent running a single collection of a PrivacyRequest, in seconds"""
+
+    dataset_name: Optional[str]
+    collection_name: Optional[str]
+    action_type: ActionType
+    status: ExecutionLogStatus
+    total: float
+    stages: Dict[str, float]
+    upstream: List[str]
+
+    class Config:
+        """Set use_enum_values"""
+
+        use_enum_values = True
+
+
+class CriticalPathResponse(BaseSchema):
+    """Schema for the chain of dependent collections that took the longest to run for an action type"""
+
+    action_type: ActionType
+    duration: float
+    collections: List[str]
+
+    class Config:
+        """Set use_enum_values"""
+
+        use_enum_values = True
+
+
+class ExecutionProfileResponse(BaseSchema):
+    """Schema for the timing profile of a PrivacyRequest"""
+
+    collections: List[CollectionProfileResponse]
+    critical_paths: List[CriticalPathResponse]
+
+
 class ExecutionAndAuditLogResponse(BaseSchema):
     """Schema for the combined ExecutionLogs and Audit Logs
     associated with a PrivacyRequest"""
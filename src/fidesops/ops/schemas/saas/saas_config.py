@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Set, Union
 
-from pydantic import BaseModel, Extra, root_validator, validator
+from pydantic import BaseModel, Extra, PositiveInt, root_validator, validator
 
 from fidesops.ops.graph.config import (
     Collection,
@@ -67,6 +67,45 @@ class ClientConfig(BaseModel):
     protocol: str
     host: str
     authentication: Optional[Strategy]
+    # In seconds, defaulting to the saas_connect_timeout and saas_read_timeout settings
+    connect_timeout: Optional[float]
+    read_timeout: Optional[float]
+    # The number of independent requests of a collection that may be sent at the same time
+    max_concurrent_requests: Optional[PositiveInt]
+
+
+class RateLimitPeriod(str, Enum):
+    """The period over which a rate limit's requests are counted"""
+
+    second = "second"
+    minute = "minute"
+    hour = "hour"
+
+
+RATE_LIMIT_PERIOD_SECONDS: Dict[RateLimitPeriod, int] = {
+    RateLimitPeriod.second: 1,
+    RateLimitPeriod.minute: 60,
+    RateLimitPeriod.hour: 3600,
+}
+
+
+class RateLimit(BaseModel):
+    """
+    A limit on the rate of requests sent to a SaaS API: `rate` requests per `period`, with up to `burst`
+    requests sent at once after a quiet period. The burst defaults to the rate.
+    """
+
+    rate: PositiveInt
+    period: RateLimitPeriod = RateLimitPeriod.second
+    burst: Optional[PositiveInt]
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.rate / RATE_LIMIT_PERIOD_SECONDS[self.period]
+
+    @property
+    def capacity(self) -> int:
+        return self.burst or self.rate
 
 
 class Header(BaseModel):
@@ -100,6 +139,7 @@ class SaaSRequest(BaseModel):
     pagination: Optional[Strategy]
     grouped_inputs: Optional[List[str]] = []
     ignore_errors: Optional[bool] = False
+    stream_response: Optional[bool] = False
 
     class Config:
         """Populate models with the raw value of enum fields, rather than the enum itself"""
@@ -196,6 +236,8 @@ class Endpoint(BaseModel):
     name: str
     requests: Dict[Literal["read", "update", "delete"], SaaSRequest]
     after: List[FidesCollectionKey] = []
+    # Overrides the rate limit of the SaaS config for this endpoint's requests
+    rate_limit: Optional[RateLimit]
 
 
 class ConnectorParam(BaseModel):
@@ -313,6 +355,7 @@ class SaaSConfig(SaaSConfigBase):
     endpoints: List[Endpoint]
     test_request: SaaSRequest
     data_protection_request: Optional[SaaSRequest] = None  # GDPR Delete
+    rate_limit: Optional[RateLimit]
 
     @property
     def top_level_endpoint_dict(self) -> Dict[str, Endpoint]:
@@ -57,10 +57,10 @@ class OAuth2AuthorizationCodeAuthenticationStrategy(OAuth2AuthenticationStrategy
         #
         # https://datatracker.ietf.org/doc/html/rfc6749#section-5.1
 
-        access_token = self._refresh_token(connection_config)
+        access_token = self._get_valid_access_token(connection_config)
 
         # add access_token to request
-        request.headers["Authorization"] = "Bearer " + access_token
+        request.headers["Authorization"] = "Bearer " + access_token  # type: ignore
         return request
 
     @property
@@ -2,15 +2,22 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Literal, Optional
 
-from sqlalchemy.orm import Session
+from fideslib.db.session import get_db_session
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 
 from fidesops.ops.common_exceptions import FidesopsException, OAuth2TokenException
+from fidesops.ops.core.config import config
 from fidesops.ops.models.connectionconfig import ConnectionConfig
 from fidesops.ops.schemas.saas.saas_config import ClientConfig, SaaSRequest
 from fidesops.ops.schemas.saas.strategy_configuration import OAuth2BaseConfiguration
 from fidesops.ops.service.authentication.authentication_strategy import (
     AuthenticationStrategy,
 )
+from fidesops.ops.service.authentication.oauth2_token_cache import (
+    CachedToken,
+    oauth2_token_cache,
+)
 from fidesops.ops.service.connectors.saas.authenticated_client import (
     AuthenticatedClient,
 )
@@ -176,18 +183,52 @@ class OAuth2AuthenticationStrategyBase(AuthenticationStrategy):
             data["expires_at"] = int(datetime.utcnow().timestamp()) + expires_in
 
         # persist new tokens to the database
-        # ideally we use a passed in database session but we can
-        # get the session from the connection_config as a fallback
-        if not db:
-            db = Session.object_session(connection_config)
+        previous_token = connection_config.secrets.get("access_token")  # type: ignore
         updated_secrets = {**connection_config.secrets, **data}  # type: ignore
-        connection_config.update(db, data={"secrets": updated_secrets})
+        self._save_secrets(connection_config, updated_secrets, db)
+        oauth2_token_cache.set(
+            connection_config.key,
+            CachedToken(access_token, data.get("expires_at"), previous_token),
+        )
         logger.info(
             "Successfully updated the OAuth2 token(s) for %s", connection_config.key
         )
 
         return access_token
 
+    @staticmethod
+    def _save_secrets(
+        connection_config: ConnectionConfig,
+        secrets: Dict[str, Any],
+        db: Optional[Session] = None,
+    ) -> None:
+        """
+        Saves the updated secrets of the connection config, using the given database session if any.
+
+        Otherwise the session the connection config was loaded with may be in use by other threads
+        executing the same privacy request, so the secrets are saved with a short-lived session of
+        this thread's own, and only the in-memory value of the connection config is updated.
+        """
+        if db:
+            connection_config.update(db, data={"secrets": secrets})
+            return
+
+        owner: Optional[Session] = Session.object_session(connection_config)
+        SessionLocal = (
+            sessionmaker(bind=owner.get_bind()) if owner else get_db_session(config)
+        )
+        with SessionLocal() as session:
+            stored: Optional[ConnectionConfig] = ConnectionConfig.get(
+                session, object_id=connection_config.id
+            )
+            if stored is None:
+                raise FidesopsException(
+                    f"Unable to save the OAuth2 token(s) for {connection_config.key}, "
+                    "the connection config was not found"
+                )
+            stored.update(session, data={"secrets": secrets})
+        set_committed_value(connection_config, "secrets", secrets)
+
     def get_access_token(
         self, connection_config: ConnectionConfig, db: Optional[Session] = None
     ) -> str:
@@ -203,19 +244,66 @@ class OAuth2AuthenticationStrategyBase(AuthenticationStrategy):
         )
         return self._validate_and_store_response(access_response, connection_config, db)
 
-    def _refresh_token(self, connection_config: ConnectionConfig) -> str:
+    def _get_valid_access_token(
+        self, connection_config: ConnectionConfig, fetch_if_missing: bool = False
+    ) -> Optional[str]:
         """
-        Persists and returns a refreshed access_token if the token is close to expiring.
-        Otherwise just returns the existing access_token.
+        Returns the access token for the connection, refreshed first if it's close to expiring.
+
+        The token is taken from the OAuth2TokenCache when possible. Only one thread fetches or
+        refreshes the token of a connection at a time, while the others keep using the current
+        token until it expires. If no access token is stored, one is requested if fetch_if_missing
+        is set, otherwise None is returned.
         """
 
-        if self.refresh_request:
-            expires_at = connection_config.secrets.get("expires_at")  # type: ignore
-            if self._close_to_expiration(expires_at, connection_config):
+        stored_token = connection_config.secrets.get("access_token")  # type: ignore
+        cached = oauth2_token_cache.get(connection_config.key, stored_token)
+        if cached and not self._needs_refresh(cached, connection_config):
+            return cached.access_token
+
+        refresh_lock = oauth2_token_cache.refresh_lock(connection_config.key)
+        usable = cached is not None and not cached.is_expired()
+        if not refresh_lock.acquire(blocking=not usable):
+            # another thread is already refreshing the token
+            return cached.access_token  # type: ignore
+
+        try:
+            # the token may have been refreshed while waiting for the lock
+            cached = oauth2_token_cache.get(connection_config.key, stored_token)
+            if cached is None:
+                if not stored_token:
+                    return (
+                        self.get_access_token(connection_config)
+                        if fetch_if_missing
+                        else None
+                    )
+                # a connection config loaded before an earlier refresh mustn't bring back its older token
+                cached = oauth2_token_cache.set_unless_newer(
+                    connection_config.key,
+                    CachedToken(
+                        stored_token, connection_config.secrets.get("expires_at")  # type: ignore
+                    ),
+                )
+
+            if self.refresh_request and self._close_to_expiration(
+                cached.expires_at, connection_config  # type: ignore
+            ):
                 refresh_response = self._call_token_request(
                     "refresh", self.refresh_request, connection_config
                 )
                 return self._validate_and_store_response(
                     refresh_response, connection_config
                 )
-        return connection_config.secrets.get("access_token")  # type: ignore
+            return cached.access_token
+        finally:
+            refresh_lock.release()
+
+    def _needs_refresh(
+        self, token: CachedToken, connection_config: ConnectionConfig
+    ) -> bool:
+        """Whether the token must be refreshed before it's used"""
+        return (
+            self.refresh_request is not None
+            and token.expires_at is not None
+            and self._close_to_expiration(token.expires_at, connection_config)
+        )
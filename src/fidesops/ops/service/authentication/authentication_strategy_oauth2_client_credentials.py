@@ -28,12 +28,10 @@ class OAuth2ClientCredentialsAuthenticationStrategy(OAuth2AuthenticationStrategy
         The existing/updated access token is then added to the request as a bearer token.
         """
 
-        access_token = connection_config.secrets.get("access_token")  # type: ignore
-        if not access_token:
-            access_token = self.get_access_token(connection_config)
-        else:
-            access_token = self._refresh_token(connection_config)
+        access_token = self._get_valid_access_token(
+            connection_config, fetch_if_missing=True
+        )
 
         # add access_token to request
-        request.headers["Authorization"] = "Bearer " + access_token
+        request.headers["Authorization"] = "Bearer " + access_token  # type: ignore
         return request
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+
+class CachedToken(NamedTuple):
+    """An OAuth2 access token held by the OAuth2TokenCache"""
+
+    access_token: str
+    expires_at: Optional[int]
+    # the access token this one was refreshed from, which may still be stored in
+    # the secrets of ConnectionConfigs loaded before the refresh
+    replaced_token: Optional[str] = None
+
+    def matches(self, stored_token: Optional[str]) -> bool:
+        """Whether this token was derived from the access token stored in the connection secrets"""
+        return bool(stored_token) and stored_token in (
+            self.access_token,
+            self.replaced_token,
+        )
+
+    def is_newer_than(self, other: "CachedToken") -> bool:
+        """Whether this token expires after the other one"""
+        return (
+            self.expires_at is not None
+            and other.expires_at is not None
+            and self.expires_at > other.expires_at
+        )
+
+    def is_expired(self) -> bool:
+        """Whether the token can no longer be used"""
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+
+class OAuth2TokenCache:
+    """
+    Worker-wide cache of the OAuth2 access tokens of SaaS connections.
+
+    Tokens are kept per ConnectionConfig key, so requests don't have to check the stored token and its
+    expiration on every call. A cached token is only used while the access token in the connection secrets
+    is the one it was derived from, so tokens saved by another worker or through the API replace it.
+    Each connection has a refresh lock, so only one thread refreshes a token while the others keep using
+    the current one until it expires.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, CachedToken] = {}
+        self._refresh_locks: Dict[str, threading.Lock] = {}
+
+    def get(
+        self, connection_key: str, stored_token: Optional[str]
+    ) -> Optional[CachedToken]:
+        """Return the cached token for the connection if it's derived from the given stored access token"""
+        token: Optional[CachedToken] = self._tokens.get(connection_key)
+        return token if token and token.matches(stored_token) else None
+
+    def set(self, connection_key: str, token: CachedToken) -> None:
+        """Cache the token for the connection"""
+        self._tokens[connection_key] = token
+
+    def set_unless_newer(self, connection_key: str, token: CachedToken) -> CachedToken:
+        """
+        Cache the token for the connection, unless the cached token is newer.
+        Returns the token now cached.
+        """
+        with self._lock:
+            cached: Optional[CachedToken] = self._tokens.get(connection_key)
+            if cached and cached.is_newer_than(token):
+                return cached
+            self._tokens[connection_key] = token
+            return token
+
+    def refresh_lock(self, connection_key: str) -> threading.Lock:
+        """The lock held while the token for the connection is fetched or refreshed"""
+        with self._lock:
+            return self._refresh_locks.setdefault(connection_key, threading.Lock())
+
+    def invalidate(self, connection_key: str) -> None:
+        """Drop the cached token for the connection"""
+        self._tokens.pop(connection_key, None)
+
+    def clear(self) -> None:
+        """Drop all cached tokens"""
+        self._tokens = {}
+
+
+oauth2_token_cache = OAuth2TokenCache()
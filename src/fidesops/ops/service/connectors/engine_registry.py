@@ -0,0 +1,124 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from fidesops.ops.core.config import config
+from fidesops.ops.models.connectionconfig import ConnectionConfig
+
+logger = logging.getLogger(__name__)
+
+
+def hash_secrets(secrets: Optional[Dict[str, Any]]) -> str:
+    """Return a stable hash of a ConnectionConfig's secrets, so engines built from stale secrets aren't reused"""
+    return hashlib.sha256(
+        json.dumps(secrets or {}, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def connections_in_use(engine: Engine) -> int:
+    """Return the number of the Engine's pooled connections that are checked out"""
+    checkedout: Optional[Callable[[], int]] = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+class RegisteredEngine(NamedTuple):
+    """An Engine held by the EngineRegistry, with the secrets it was built from and when it was last used"""
+
+    secrets_hash: str
+    engine: Engine
+    last_used: float
+
+
+class EngineRegistry:
+    """
+    Worker-wide registry of the SQLAlchemy Engines used to connect to each ConnectionConfig.
+
+    Engines are kept, along with their pooled connections, between privacy requests, so each request
+    doesn't pay for connecting and authenticating to every database again. An Engine is rebuilt when the
+    secrets of its ConnectionConfig change, and disposed of once none of its connections have been used
+    for `connector_idle_timeout` seconds.
+    """
+
+    def __init__(self) -> None:
+        # reentrant, as connections can be returned to a pool when they're garbage collected
+        self._lock = threading.RLock()
+        self._engines: Dict[str, RegisteredEngine] = {}
+
+    def get(
+        self, connection_config: ConnectionConfig, create: Callable[[], Engine]
+    ) -> Engine:
+        """Return the Engine for the given ConnectionConfig, calling `create` to build it if there is
+        no Engine for its current secrets"""
+        key: str = connection_config.key
+        secrets_hash: str = hash_secrets(connection_config.secrets)
+        now: float = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+
+            registered: Optional[RegisteredEngine] = self._engines.get(key)
+            if registered is not None and registered.secrets_hash != secrets_hash:
+                logger.info("Secrets changed for %s, rebuilding engine", key)
+                registered.engine.dispose()
+                registered = None
+
+            engine: Engine = (
+                registered.engine if registered else self._create(key, create)
+            )
+            self._engines[key] = RegisteredEngine(secrets_hash, engine, now)
+            return engine
+
+    def _create(self, key: str, create: Callable[[], Engine]) -> Engine:
+        """Build an Engine, marking it as used whenever one of its connections is checked out or returned,
+        so it's not disposed of while a long running task is still using it"""
+        engine: Engine = create()
+
+        def on_use(*_: Any) -> None:
+            self._touch(key, engine)
+
+        event.listen(engine, "checkout", on_use)
+        event.listen(engine, "checkin", on_use)
+        return engine
+
+    def _touch(self, key: str, engine: Engine) -> None:
+        """Mark the Engine held for the given ConnectionConfig key as used"""
+        with self._lock:
+            registered: Optional[RegisteredEngine] = self._engines.get(key)
+            if registered is not None and registered.engine is engine:
+                self._engines[key] = registered._replace(last_used=time.monotonic())
+
+    def invalidate(self, key: str) -> None:
+        """Dispose of the Engine for the given ConnectionConfig key, so it's rebuilt on next use"""
+        with self._lock:
+            registered: Optional[RegisteredEngine] = self._engines.pop(key, None)
+        if registered is not None:
+            logger.info("Disposing of engine for %s", key)
+            registered.engine.dispose()
+
+    def clear(self) -> None:
+        """Dispose of all held Engines"""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines = {}
+        for registered in engines:
+            registered.engine.dispose()
+
+    def _evict_idle(self, now: float) -> None:
+        """Dispose of Engines that haven't been used within the idle timeout, unless their connections
+        are still checked out. Must hold the lock."""
+        idle_timeout: int = config.execution.connector_idle_timeout
+        for key, registered in list(self._engines.items()):
+            if now - registered.last_used > idle_timeout and not connections_in_use(
+                registered.engine
+            ):
+                logger.debug("Disposing of idle engine for %s", key)
+                registered.engine.dispose()
+                del self._engines[key]
+
+
+engine_registry = EngineRegistry()
@@ -1,7 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
 
 from fidesops.ops.common_exceptions import ConnectionException
@@ -13,7 +13,7 @@ from fidesops.ops.schemas.connection_configuration.connection_secrets_mongodb im
     MongoDBSchema,
 )
 from fidesops.ops.service.connectors.base_connector import BaseConnector
-from fidesops.ops.service.connectors.query_config import MongoQueryConfig, QueryConfig
+from fidesops.ops.service.connectors.query_config import MongoQueryConfig
 from fidesops.ops.util.logger import Pii
 
 logger = logging.getLogger(__name__)
@@ -50,7 +50,7 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         except ValueError:
             raise ConnectionException("Value Error connecting to MongoDB.")
 
-    def query_config(self, node: TraversalNode) -> QueryConfig[Any]:
+    def query_config(self, node: TraversalNode) -> MongoQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
         return MongoQueryConfig(node)
 
@@ -118,27 +118,38 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         input_data: Dict[str, List[Any]],
     ) -> int:
         # pylint: disable=too-many-locals
-        """Execute a masking request"""
+        """Execute a masking request.
+
+        Rows are masked with unordered bulk writes of up to `update_batch_size` update operations each.
+        """
         query_config = self.query_config(node)
         collection_name = node.address.collection
         client = self.client()
+        collection = client[node.address.dataset][collection_name]
+
+        operations: List[UpdateOne] = []
+        for query, update in query_config.generate_update_stmts(
+            rows, policy, privacy_request
+        ):
+            operations.append(UpdateOne(query, update, upsert=False))
+            logger.info(
+                "db.%s.update_one(%s, %s, upsert=False)",
+                collection_name,
+                Pii(query),
+                Pii(update),
+            )
+
         update_ct = 0
-        for row in rows:
-            update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
+        batch_size: int = query_config.update_batch_size
+        for i in range(0, len(operations), batch_size):
+            batch = operations[i : i + batch_size]
+            bulk_result = collection.bulk_write(batch, ordered=False)
+            update_ct += bulk_result.modified_count
+            logger.info(
+                "db.%s.bulk_write(%s operations, ordered=False)",
+                collection_name,
+                len(batch),
             )
-            if update_stmt is not None:
-                query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
-                logger.info(
-                    "db.%s.update_one(%s, %s, upsert=False)",
-                    collection_name,
-                    Pii(query),
-                    Pii(update),
-                )
 
         return update_ct
 
@@ -1,14 +1,16 @@
+# pylint: disable=too-many-lines
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+from typing import Any, Dict, Generic, List, Mapping, Optional, Tuple, TypeVar
 
 import pydash
-from sqlalchemy import MetaData, Table, text
+from sqlalchemy import MetaData, Table, and_, bindparam, case, literal, null, or_, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.sql import Executable, Update  # type: ignore
 from sqlalchemy.sql.elements import ColumnElement, TextClause
 
+from fidesops.ops.core.config import config
 from fidesops.ops.graph.config import (
     ROOT_COLLECTION_ADDRESS,
     CollectionAddress,
@@ -41,12 +43,13 @@ class QueryConfig(Generic[T], ABC):
 
     def __init__(self, node: TraversalNode):
         self.node = node
+        self._masking_strategies: Dict[Rule, MaskingStrategy] = {}
 
-    def field_map(self) -> Dict[FieldPath, Field]:
+    def field_map(self) -> Mapping[FieldPath, Field]:
         """Flattened FieldPaths of interest from this traversal_node."""
         return self.node.node.collection.field_dict
 
-    def top_level_field_map(self) -> Dict[FieldPath, Field]:
+    def top_level_field_map(self) -> Mapping[FieldPath, Field]:
         """Top level FieldPaths on this traversal_node."""
         return self.node.node.collection.top_level_field_dict
 
@@ -67,25 +70,21 @@ class QueryConfig(Generic[T], ABC):
                 continue
 
             targeted_field_paths = []
-            collection_categories: Dict[
-                str, List[FieldPath]
-            ] = self.node.node.collection.field_paths_by_category  # type: ignore
             for rule_cat in rule_categories:
-                for collection_cat, field_paths in collection_categories.items():
-                    if collection_cat.startswith(rule_cat):
-                        targeted_field_paths.extend(field_paths)
+                for (
+                    field_paths
+                ) in self.node.node.collection.field_paths_by_category_prefix(
+                    rule_cat
+                ).values():
+                    targeted_field_paths.extend(field_paths)
             rule_updates[rule] = targeted_field_paths
 
         return rule_updates
 
     @property
-    def primary_key_field_paths(self) -> Dict[FieldPath, Field]:
+    def primary_key_field_paths(self) -> Mapping[FieldPath, Field]:
         """Mapping of FieldPaths to Fields that are marked as PK's"""
-        return {
-            field_path: field
-            for field_path, field in self.field_map().items()
-            if field.primary_key
-        }
+        return self.node.node.collection.primary_key_field_paths
 
     def query_sources(self) -> Dict[str, List[CollectionAddress]]:
         """Display the input collection(s) for each query key for display purposes.
@@ -123,7 +122,7 @@ class QueryConfig(Generic[T], ABC):
 
         return data
 
-    def update_value_map(  # pylint: disable=R0914
+    def update_value_map(
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Dict[str, Any]:
         """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
@@ -134,27 +133,35 @@ class QueryConfig(Generic[T], ABC):
         workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
         with null values.
 
+        """
+        return self.update_value_maps([row], policy, request)[0]
+
+    def update_value_maps(  # pylint: disable=R0914
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Dict[str, Any]]:
+        """Map the relevant fields to be updated on each of the rows with their masked values, as in `update_value_map`.
+
+        The values of each field targeted by a rule are collected across all of the rows and masked with a
+        single call to the rule's masking strategy, then scattered back to the rows they came from.
         """
         rule_to_collection_field_paths: Dict[
             Rule, List[FieldPath]
         ] = self.build_rule_target_field_paths(policy)
+        field_map: Mapping[FieldPath, Field] = self.field_map()
 
-        value_map: Dict[str, Any] = {}
+        value_maps: List[Dict[str, Any]] = [{} for _ in rows]
         for rule, field_paths in rule_to_collection_field_paths.items():
-            strategy_config = rule.masking_strategy
-            if not strategy_config:
+            strategy: Optional[MaskingStrategy] = self.get_masking_strategy(rule)
+            if not strategy:
                 continue
-            strategy: MaskingStrategy = MaskingStrategy.get_strategy(
-                strategy_config["strategy"], strategy_config["configuration"]
+            strategy_config = rule.masking_strategy
+            null_masking: bool = (
+                strategy_config.get("strategy") == NullMaskingStrategy.name
             )
             for rule_field_path in field_paths:
-                masking_override: MaskingOverride = [
-                    MaskingOverride(field.data_type_converter, field.length)
-                    for field_path, field in self.field_map().items()
-                    if field_path == rule_field_path
-                ][0]
-                null_masking: bool = (
-                    strategy_config.get("strategy") == NullMaskingStrategy.name
+                field: Field = field_map[rule_field_path]
+                masking_override = MaskingOverride(
+                    field.data_type_converter, field.length
                 )
                 if not self._supported_data_type(
                     masking_override, null_masking, strategy
@@ -167,22 +174,41 @@ class QueryConfig(Generic[T], ABC):
                     )
                     continue
 
-                paths_to_mask: List[str] = [
-                    join_detailed_path(path)
+                # The index of the row and the detailed path of each value to be masked
+                targets: List[Tuple[int, str]] = []
+                values: List[Any] = []
+                for i, row in enumerate(rows):
                     for path in build_refined_target_paths(
                         row, query_paths={rule_field_path: None}
-                    )
-                ]
-                for detailed_path in paths_to_mask:
-                    value_map[detailed_path] = self._generate_masked_value(
-                        request_id=request.id,
-                        strategy=strategy,
-                        val=pydash.objects.get(row, detailed_path),
-                        masking_override=masking_override,
-                        null_masking=null_masking,
-                        str_field_path=detailed_path,
-                    )
-        return value_map
+                    ):
+                        detailed_path: str = join_detailed_path(path)
+                        targets.append((i, detailed_path))
+                        values.append(pydash.objects.get(row, detailed_path))
+                if not values:
+                    continue
+
+                masked_values: List[Any] = self._generate_masked_values(
+                    request_id=request.id,
+                    strategy=strategy,
+                    values=values,
+                    masking_override=masking_override,
+                    null_masking=null_masking,
+                    str_field_path=rule_field_path.string_path,
+                )
+                for (i, detailed_path), masked_val in zip(targets, masked_values):
+                    value_maps[i][detailed_path] = masked_val
+        return value_maps
+
+    def get_masking_strategy(self, rule: Rule) -> Optional[MaskingStrategy]:
+        """Return the masking strategy of the rule, building it the first time it's used"""
+        strategy_config = rule.masking_strategy
+        if not strategy_config:
+            return None
+        if rule not in self._masking_strategies:
+            self._masking_strategies[rule] = MaskingStrategy.get_strategy(
+                strategy_config["strategy"], strategy_config["configuration"]
+            )
+        return self._masking_strategies[rule]
 
     @staticmethod
     def _supported_data_type(
@@ -200,26 +226,25 @@ class QueryConfig(Generic[T], ABC):
         return True
 
     @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
+    def _generate_masked_values(  # pylint: disable=R0913
         request_id: str,
         strategy: MaskingStrategy,
-        val: Any,
+        values: List[Any],
         masking_override: MaskingOverride,
         null_masking: bool,
         str_field_path: str,
-    ) -> T:
-        # masking API takes and returns lists, but here we are only leveraging single elements
-        masked_val = strategy.mask([val], request_id)[0]  # type: ignore
+    ) -> List[Any]:
+        masked_values: List[Any] = strategy.mask(values, request_id)  # type: ignore
 
         logger.debug(
-            "Generated the following masked val for field %s: %s",
+            "Generated the following masked vals for field %s: %s",
             str_field_path,
-            masked_val,
+            masked_values,
         )
 
         # special case for null masking
         if null_masking:
-            return masked_val
+            return masked_values
 
         if masking_override.length:
             logger.warning(
@@ -227,10 +252,13 @@ class QueryConfig(Generic[T], ABC):
                 str_field_path,
             )
             #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_override.data_type_converter.truncate(  # type: ignore
-                masking_override.length, masked_val
-            )
-        return masked_val
+            masked_values = [
+                masking_override.data_type_converter.truncate(  # type: ignore
+                    masking_override.length, masked_val
+                )
+                for masked_val in masked_values
+            ]
+        return masked_values
 
     @abstractmethod
     def generate_query(
@@ -340,6 +368,16 @@ class ManualQueryConfig(QueryConfig[Executable]):
 class SQLQueryConfig(QueryConfig[Executable]):
     """Query config that translates parameters into SQL statements."""
 
+    @property
+    def update_batch_size(self) -> int:
+        """The most rows a single batched update statement will match on primary key"""
+        return config.execution.sql_update_batch_size
+
+    @property
+    def query_batch_size(self) -> int:
+        """The most input values bound as parameters of a single retrieval query"""
+        return config.execution.sql_query_batch_size
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -411,33 +449,78 @@ class SQLQueryConfig(QueryConfig[Executable]):
         )
         return None
 
+    def chunk_input_data(
+        self, input_data: Dict[str, List[Any]]
+    ) -> List[Dict[str, List[Any]]]:
+        """Splits the filtered input data into chunks of up to `query_batch_size` distinct values in total.
+
+        The clauses of a retrieval query are OR-ed together, so the rows matching any of the chunks
+        are the rows matching all of the input data.
+        """
+        chunks: List[Dict[str, List[Any]]] = []
+        chunk: Dict[str, List[Any]] = {}
+        chunk_size = 0
+        for string_path, data in self.node.typed_filtered_values(input_data).items():
+            for value in dict.fromkeys(data):
+                if chunk_size == self.query_batch_size:
+                    chunks.append(chunk)
+                    chunk, chunk_size = {}, 0
+                chunk.setdefault(string_path, []).append(value)
+                chunk_size += 1
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def generate_queries(
+        self,
+        input_data: Dict[str, List[Any]],
+        policy: Optional[Policy] = None,
+    ) -> List[TextClause]:
+        """Generate retrieval queries for the input data, each binding up to `query_batch_size` values"""
+        queries: List[TextClause] = []
+        for chunk in self.chunk_input_data(input_data):
+            query: Optional[TextClause] = self.generate_query(chunk, policy)
+            if query is not None:
+                queries.append(query)
+        if not queries:
+            logger.warning(
+                "There is not enough data to generate a valid query for %s",
+                self.node.address,
+            )
+        return queries
+
     def format_key_map_for_update_stmt(self, fields: List[str]) -> List[str]:
         """Adds the appropriate formatting for update statements in this datastore."""
         fields.sort()
         return [f"{k} = :{k}" for k in fields]
 
-    def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
-    ) -> Optional[TextClause]:
-        """Returns an update statement in generic SQL dialect."""
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
-        update_clauses: list[str] = self.format_key_map_for_update_stmt(
-            list(update_value_map.keys())
-        )
-        non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
+    def format_key_in_clause_for_update_stmt(self, field: str) -> str:
+        """Adds the appropriate formatting for matching a field against a list of values in update
+        statements in this datastore. The values are bound as an expanding parameter of the same name.
+        """
+        return f"{field} IN :{field}"
+
+    def primary_key_values(self, row: Row) -> Dict[str, Any]:
+        """Returns the non-empty primary key values of the row, cast to their field types"""
+        return filter_nonempty_values(
             {
                 fpath.string_path: fld.cast(row[fpath.string_path])
                 for fpath, fld in self.primary_key_field_paths.items()
                 if fpath.string_path in row
             }
         )
+
+    def format_update_stmt(
+        self, update_value_map: Dict[str, Any], primary_key_values: Dict[str, Any]
+    ) -> Optional[TextClause]:
+        """Returns an update statement setting the masked values on the row matching the primary key values."""
+        update_clauses: list[str] = self.format_key_map_for_update_stmt(
+            list(update_value_map.keys())
+        )
         pk_clauses: list[str] = self.format_key_map_for_update_stmt(
-            list(non_empty_primary_keys.keys())
+            list(primary_key_values.keys())
         )
 
-        for k, v in non_empty_primary_keys.items():
-            update_value_map[k] = v
-
         valid = len(pk_clauses) > 0 and len(update_clauses) > 0
         if not valid:
             logger.warning(
@@ -450,8 +533,121 @@ class SQLQueryConfig(QueryConfig[Executable]):
             update_clauses,
             pk_clauses,
         )
-        logger.info("query = %s, params = %s", Pii(query_str), Pii(update_value_map))
-        return text(query_str).params(update_value_map)
+        params: Dict[str, Any] = {**update_value_map, **primary_key_values}
+        logger.info("query = %s, params = %s", Pii(query_str), Pii(params))
+        return text(query_str).params(params)
+
+    def format_batched_update_stmt(
+        self,
+        update_value_map: Dict[str, Any],
+        primary_key: str,
+        primary_key_values: List[Any],
+    ) -> TextClause:
+        """Returns an update statement setting the same masked values on every row matching one of
+        the primary key values."""
+        update_clauses: list[str] = self.format_key_map_for_update_stmt(
+            list(update_value_map.keys())
+        )
+        query_str = self.get_formatted_update_stmt(
+            update_clauses,
+            [self.format_key_in_clause_for_update_stmt(primary_key)],
+        )
+        params: Dict[str, Any] = {**update_value_map, primary_key: primary_key_values}
+        logger.info("query = %s, params = %s", Pii(query_str), Pii(params))
+        return (
+            text(query_str)
+            .bindparams(bindparam(primary_key, expanding=True))
+            .params(params)
+        )
+
+    def generate_update_stmt(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[TextClause]:
+        """Returns an update statement in generic SQL dialect."""
+        return self.format_update_stmt(
+            self.update_value_map(row, policy, request), self.primary_key_values(row)
+        )
+
+    def batch_update_rows(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Tuple[Dict[str, Any], Dict[str, List[Any]]]]:
+        """Groups the given rows into batches that can be masked with a single update each.
+
+        Returns the masked values of each batch, with its primary keys mapped to the values of
+        the rows it matches. Rows that are masked to identical values, as with null or string
+        rewrite masking, are batched together in up to `update_batch_size` rows. Rows with distinct
+        masked values, and rows in collections with a composite primary key, are a batch each.
+        """
+        update_batches: List[Tuple[Dict[str, Any], Dict[str, List[Any]]]] = []
+        primary_keys: List[str] = [
+            fpath.string_path for fpath in self.primary_key_field_paths
+        ]
+        # the masked values of each batch, mapped to the primary key values of its rows
+        batches: Dict[Tuple[Tuple[str, Any], ...], Dict[Any, None]] = {}
+
+        for row, update_value_map in zip(
+            rows, self.update_value_maps(rows, policy, request)
+        ):
+            primary_key_values: Dict[str, Any] = self.primary_key_values(row)
+            if not update_value_map or not primary_key_values:
+                logger.warning(
+                    "There is not enough data to generate a valid update statement for %s",
+                    self.node.address,
+                )
+                continue
+
+            if len(primary_keys) == 1:
+                try:
+                    batches.setdefault(
+                        tuple(sorted(update_value_map.items(), key=lambda i: i[0])),
+                        {},
+                    )[primary_key_values[primary_keys[0]]] = None
+                    continue
+                except TypeError:
+                    # Unhashable values can't be batched, so fall back to updating the row on its own
+                    pass
+
+            update_batches.append(
+                (update_value_map, {k: [v] for k, v in primary_key_values.items()})
+            )
+
+        for masked_values, batched_key_values in batches.items():
+            key_values: List[Any] = list(batched_key_values)
+            for i in range(0, len(key_values), self.update_batch_size):
+                update_batches.append(
+                    (
+                        dict(masked_values),
+                        {primary_keys[0]: key_values[i : i + self.update_batch_size]},
+                    )
+                )
+        return update_batches
+
+    def generate_update_stmts(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[TextClause]:
+        """Returns update statements masking all of the given rows.
+
+        Batches of more than one row are updated with `WHERE <primary key> IN (...)` statements.
+        """
+        update_stmts: List[TextClause] = []
+        for update_value_map, primary_key_values in self.batch_update_rows(
+            rows, policy, request
+        ):
+            update_stmt: Optional[TextClause]
+            if len(primary_key_values) == 1 and any(
+                len(values) > 1 for values in primary_key_values.values()
+            ):
+                primary_key, values = next(iter(primary_key_values.items()))
+                update_stmt = self.format_batched_update_stmt(
+                    update_value_map, primary_key, values
+                )
+            else:
+                update_stmt = self.format_update_stmt(
+                    update_value_map, {k: v[0] for k, v in primary_key_values.items()}
+                )
+            if update_stmt is not None:
+                update_stmts.append(update_stmt)
+        return update_stmts
 
     def query_to_str(self, t: TextClause, input_data: Dict[str, List[Any]]) -> str:
         """string representation of a query for logging/dry-run"""
@@ -532,15 +728,10 @@ class QueryStringWithoutTuplesOverrideQueryConfig(SQLQueryConfig):
                     )
                     query_data[string_path] = data.pop()
                 elif len(data) > 1:
-                    data_vals = list(data)
                     query_data_keys: List[str] = []
-                    for val in data_vals:
+                    for i, val in enumerate(data):
                         # appending "_in_stmt_generated_" (can be any arbitrary str) so that this name has less change of conflicting with pre-existing column in table
-                        query_data_name = (
-                            string_path
-                            + "_in_stmt_generated_"
-                            + str(data_vals.index(val))
-                        )
+                        query_data_name = string_path + "_in_stmt_generated_" + str(i)
                         query_data[query_data_name] = val
                         query_data_keys.append(":" + query_data_name)
                     operand = ", ".join(query_data_keys)
@@ -563,6 +754,16 @@ class MicrosoftSQLServerQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig)
     Generates SQL valid for SQLServer.
     """
 
+    @property
+    def query_batch_size(self) -> int:
+        """SQL Server accepts at most 2100 parameters per statement"""
+        return min(super().query_batch_size, 2000)
+
+    @property
+    def update_batch_size(self) -> int:
+        """SQL Server accepts at most 2100 parameters per statement, leaving room for the masked values"""
+        return min(super().update_batch_size, 2000)
+
 
 class SnowflakeQueryConfig(SQLQueryConfig):
     """Generates SQL in Snowflake's custom dialect."""
@@ -599,6 +800,10 @@ class SnowflakeQueryConfig(SQLQueryConfig):
         fields.sort()
         return [f'"{k}" = :{k}' for k in fields]
 
+    def format_key_in_clause_for_update_stmt(self, field: str) -> str:
+        """Adds the appropriate formatting for IN clauses in update statements in this datastore."""
+        return f'"{field}" IN :{field}'
+
     def get_formatted_update_stmt(
         self,
         update_clauses: List[str],
@@ -642,30 +847,85 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         Using TextClause to insert 'None' values into BigQuery throws an exception, so we use update clause instead.
         Returns a SQLAlchemy Update object. Does not actually execute the update object.
         """
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
-        non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
-            {
-                fpath.string_path: fld.cast(row[fpath.string_path])
-                for fpath, fld in self.primary_key_field_paths.items()
-                if fpath.string_path in row
-            }
-        )
+        updates: List[Update] = self.generate_updates([row], policy, request, client)
+        return updates[0] if updates else None
 
-        valid = len(non_empty_primary_keys) > 0 and update_value_map
-        if not valid:
-            logger.warning(
-                "There is not enough data to generate a valid update statement for %s",
-                self.node.address,
-            )
-            return None
+    def generate_updates(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest, client: Engine
+    ) -> List[Update]:
+        """
+        Returns SQLAlchemy Update objects masking all of the given rows, batched as in `batch_update_rows`.
+        Rows masked to distinct values are also updated up to `update_batch_size` at a time, with CASE
+        expressions picking the values of each row, so masking them doesn't take a job per row.
+
+        The table is reflected from BigQuery once for all of the rows, rather than once per row.
+        """
+        update_batches: List[
+            Tuple[Dict[str, Any], Dict[str, List[Any]]]
+        ] = self.batch_update_rows(rows, policy, request)
+        if not update_batches:
+            return []
 
         table = Table(
             self.node.address.collection, MetaData(bind=client), autoload=True
         )
+        updates: List[Update] = []
+        # the masked values and primary key values of rows updated on their own
+        single_rows: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for update_value_map, primary_key_values in update_batches:
+            if all(len(v) == 1 for v in primary_key_values.values()):
+                single_rows.append(
+                    (update_value_map, {k: v[0] for k, v in primary_key_values.items()})
+                )
+                continue
+            pk_clauses: List[ColumnElement] = [
+                getattr(table.c, k).in_(v) for k, v in primary_key_values.items()
+            ]
+            updates.append(table.update().where(*pk_clauses).values(**update_value_map))
+
+        for i in range(0, len(single_rows), self.update_batch_size):
+            updates.append(
+                self.generate_case_update(
+                    table, single_rows[i : i + self.update_batch_size]
+                )
+            )
+        return updates
+
+    @staticmethod
+    def generate_case_update(
+        table: Table, rows: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> Update:
+        """
+        Returns an Update masking each of the rows with its own values. With more than one row, each
+        masked column is set to a CASE expression picking the value of the row by its primary key values.
+        """
         pk_clauses: List[ColumnElement] = [
-            getattr(table.c, k) == v for k, v in non_empty_primary_keys.items()
+            and_(*[getattr(table.c, k) == v for k, v in primary_key_values.items()])
+            for _, primary_key_values in rows
         ]
-        return table.update().where(*pk_clauses).values(**update_value_map)
+        if len(rows) == 1:
+            return table.update().where(pk_clauses[0]).values(**rows[0][0])
+
+        columns: Dict[str, None] = dict.fromkeys(
+            column for update_value_map, _ in rows for column in update_value_map
+        )
+        values: Dict[str, ColumnElement] = {}
+        for column in columns:
+            column_type = getattr(table.c, column).type
+            values[column] = case(
+                *[
+                    (
+                        pk_clause,
+                        null()
+                        if update_value_map[column] is None
+                        else literal(update_value_map[column], column_type),
+                    )
+                    for pk_clause, (update_value_map, _) in zip(pk_clauses, rows)
+                    if column in update_value_map
+                ],
+                else_=getattr(table.c, column),
+            )
+        return table.update().where(or_(*pk_clauses)).values(**values)
 
 
 MongoStatement = Tuple[Dict[str, Any], Dict[str, Any]]
@@ -684,6 +944,11 @@ MongoStatement = Tuple[Dict[str, Any], Dict[str, Any]]
 class MongoQueryConfig(QueryConfig[MongoStatement]):
     """Query config that translates parameters into mongo statements"""
 
+    @property
+    def update_batch_size(self) -> int:
+        """The most update operations submitted in a single bulk write"""
+        return config.execution.mongo_update_batch_size
+
     def generate_query(
         self, input_data: Dict[str, List[Any]], policy: Optional[Policy] = None
     ) -> Optional[MongoStatement]:
@@ -727,8 +992,27 @@ class MongoQueryConfig(QueryConfig[MongoStatement]):
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Optional[MongoStatement]:
         """Generate a SQL update statement in the form of Mongo update statement components"""
-        update_clauses = self.update_value_map(row, policy, request)
+        return self.format_update_stmt(row, self.update_value_map(row, policy, request))
+
+    def generate_update_stmts(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[MongoStatement]:
+        """Generate the update statements masking all of the given rows, masking their values in batches"""
+        update_stmts: List[MongoStatement] = []
+        for row, update_clauses in zip(
+            rows, self.update_value_maps(rows, policy, request)
+        ):
+            update_stmt: Optional[MongoStatement] = self.format_update_stmt(
+                row, update_clauses
+            )
+            if update_stmt is not None:
+                update_stmts.append(update_stmt)
+        return update_stmts
 
+    def format_update_stmt(
+        self, row: Row, update_clauses: Dict[str, Any]
+    ) -> Optional[MongoStatement]:
+        """Returns the Mongo update statement components setting the masked values on the row"""
         pk_clauses: Dict[str, Any] = filter_nonempty_values(
             {
                 field_path.string_path: field.cast(row[field_path.string_path])
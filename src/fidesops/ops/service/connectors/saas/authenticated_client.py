@@ -6,26 +6,32 @@ import re
 import time
 from functools import wraps
 from time import sleep
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
 
-from requests import PreparedRequest, Request, Response, Session
+from requests import PreparedRequest, Request, Response
 
 from fidesops.ops.common_exceptions import (
     ClientUnsuccessfulException,
     ConnectionException,
     FidesopsException,
+    RateLimitExceededException,
 )
 from fidesops.ops.core.config import config
+from fidesops.ops.service.connectors.saas.session_pool import session_pool
 
 if TYPE_CHECKING:
     from fidesops.ops.models.connectionconfig import ConnectionConfig
     from fidesops.ops.schemas.saas.saas_config import ClientConfig
     from fidesops.ops.schemas.saas.shared_schemas import SaaSRequestParams
+    from fidesops.ops.service.authentication.authentication_strategy import (
+        AuthenticationStrategy,
+    )
+    from fidesops.ops.service.connectors.saas.rate_limiter import RateLimitBucket
 
 logger = logging.getLogger(__name__)
 
 
-class AuthenticatedClient:
+class AuthenticatedClient:  # pylint: disable=too-many-instance-attributes
     """
     A helper class to build authenticated HTTP requests based on
     authentication and parameter configurations. Optionally allows
@@ -40,7 +46,7 @@ class AuthenticatedClient:
     ):
         saas_config = configuration.get_saas_config()
         self.configuration = configuration
-        self.session = Session()
+        self.session = session_pool.get(configuration.key, uri)
         self.uri = uri
         self.key = configuration.key
         self.client_config = (
@@ -49,6 +55,37 @@ class AuthenticatedClient:
             else saas_config.client_config  # type: ignore
         )
         self.secrets = configuration.secrets
+        # if set, each request waits for a token from the bucket before it's sent
+        self.rate_limit_bucket: Optional[RateLimitBucket] = None
+        self._auth_strategy: Optional[AuthenticationStrategy] = None
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """The connect and read timeouts for requests, from the client config or the defaults"""
+        connect_timeout: Optional[float] = self.client_config.connect_timeout
+        read_timeout: Optional[float] = self.client_config.read_timeout
+        return (
+            connect_timeout
+            if connect_timeout is not None
+            else config.execution.saas_connect_timeout,
+            read_timeout
+            if read_timeout is not None
+            else config.execution.saas_read_timeout,
+        )
+
+    @property
+    def auth_strategy(self) -> Optional[AuthenticationStrategy]:
+        """The strategy authenticating requests, built once from the client config"""
+        if self._auth_strategy is None and self.client_config.authentication:
+            from fidesops.ops.service.authentication.authentication_strategy import (  # pylint: disable=R0401
+                AuthenticationStrategy,
+            )
+
+            self._auth_strategy = AuthenticationStrategy.get_strategy(
+                self.client_config.authentication.strategy,
+                self.client_config.authentication.configuration,
+            )
+        return self._auth_strategy
 
     def get_authenticated_request(
         self, request_params: SaaSRequestParams
@@ -58,10 +95,6 @@ class AuthenticatedClient:
         incoming path, headers, query, and body params.
         """
 
-        from fidesops.ops.service.authentication.authentication_strategy import (  # pylint: disable=R0401
-            AuthenticationStrategy,
-        )
-
         req: PreparedRequest = Request(
             method=request_params.method,
             url=f"{self.uri}{request_params.path}",
@@ -71,12 +104,8 @@ class AuthenticatedClient:
         ).prepare()
 
         # add authentication if provided
-        if self.client_config.authentication:
-            auth_strategy = AuthenticationStrategy.get_strategy(
-                self.client_config.authentication.strategy,
-                self.client_config.authentication.configuration,
-            )
-            return auth_strategy.add_authentication(req, self.configuration)
+        if self.auth_strategy:
+            return self.auth_strategy.add_authentication(req, self.configuration)
 
         # otherwise just return the prepared request
         return req
@@ -122,6 +151,10 @@ class AuthenticatedClient:
                         sleep_time = (
                             retry_after_time if retry_after_time else sleep_time
                         )
+                    except RateLimitExceededException as exc:
+                        # left to the retries of the graph node
+                        last_exception = exc
+                        break
                     except Exception as exc:  # pylint: disable=W0703
                         dev_mode_log = f" with error: {exc}" if config.dev_mode else ""
                         last_exception = ConnectionException(
@@ -145,16 +178,25 @@ class AuthenticatedClient:
 
     @retry_send(retry_count=3, backoff_factor=1.0)  # pylint: disable=E1124
     def send(
-        self, request_params: SaaSRequestParams, ignore_errors: Optional[bool] = False
+        self,
+        request_params: SaaSRequestParams,
+        ignore_errors: Optional[bool] = False,
+        stream: Optional[bool] = False,
     ) -> Response:
         """
         Builds and executes an authenticated request.
-        Optionally ignores non-200 responses if ignore_errors is set to True
+        Optionally ignores non-200 responses if ignore_errors is set to True.
+        If stream is set to True, the response body is only downloaded as it's read,
+        and the response must be closed by the caller.
         """
         prepared_request: PreparedRequest = self.get_authenticated_request(
             request_params
         )
-        response = self.session.send(prepared_request)
+        if self.rate_limit_bucket:
+            self.rate_limit_bucket.acquire()
+        response = self.session.send(
+            prepared_request, timeout=self.timeout, stream=stream
+        )
 
         log_request_and_response_for_debugging(
             prepared_request, response
@@ -167,6 +209,8 @@ class AuthenticatedClient:
                     response.status_code,
                 )
                 return response
+            if stream:
+                response.close()
             raise RequestFailureResponseException(response=response)
         return response
 
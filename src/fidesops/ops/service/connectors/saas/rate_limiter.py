@@ -0,0 +1,96 @@
+import logging
+import time
+from typing import Optional
+
+from redis.client import Script
+
+from fidesops.ops.common_exceptions import RateLimitExceededException
+from fidesops.ops.core.config import config
+from fidesops.ops.schemas.saas.saas_config import RateLimit
+from fidesops.ops.util.cache import FidesopsRedis, get_cache
+
+logger = logging.getLogger(__name__)
+
+# Takes a token from the bucket stored at KEYS[1], refilled at ARGV[1] tokens per second up to a capacity of
+# ARGV[2] tokens. If the bucket is empty, the token is reserved anyway and the script returns how many seconds
+# the caller must wait before using it, so concurrent callers queue up instead of all retrying at once.
+# If that wait would be longer than ARGV[3] seconds, the token isn't taken and the wait is still returned.
+# The time is taken from Redis so that all workers share the same clock.
+TOKEN_BUCKET_SCRIPT = """
+redis.replicate_commands()
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local redis_time = redis.call("TIME")
+local now = tonumber(redis_time[1]) + tonumber(redis_time[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "timestamp")
+local tokens = tonumber(bucket[1]) or capacity
+local timestamp = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * rate) - 1
+if -tokens / rate > tonumber(ARGV[3]) then
+    return tostring(-tokens / rate)
+end
+
+redis.call("HMSET", KEYS[1], "tokens", tostring(tokens), "timestamp", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+if tokens >= 0 then
+    return "0"
+end
+return tostring(-tokens / rate)
+"""
+
+_token_bucket_script: Optional[Script] = None
+
+
+def get_rate_limit_cache_key(
+    connection_key: str, endpoint: Optional[str] = None
+) -> str:
+    """The cache key of the token bucket of a SaaS connection, or of one of its endpoints"""
+    if endpoint:
+        return f"rate_limit__{connection_key}__{endpoint}"
+    return f"rate_limit__{connection_key}"
+
+
+class RateLimitBucket:
+    """
+    A token bucket enforcing a RateLimit on the requests sent to a SaaS API.
+
+    The bucket is stored in Redis, so it's shared by all threads and workers sending requests
+    for the same connection or endpoint.
+    """
+
+    def __init__(self, key: str, rate_limit: RateLimit):
+        self.key = key
+        self.rate_limit = rate_limit
+
+    def acquire(self) -> float:
+        """Take a token from the bucket, sleeping until it may be used. Returns the number of seconds slept.
+
+        Raises a RateLimitExceededException without taking a token if the wait would be longer than
+        `saas_rate_limit_max_wait` seconds."""
+        global _token_bucket_script  # pylint: disable=W0603
+        cache: FidesopsRedis = get_cache()
+        if _token_bucket_script is None:
+            _token_bucket_script = cache.register_script(TOKEN_BUCKET_SCRIPT)
+
+        max_wait: float = config.execution.saas_rate_limit_max_wait
+        wait: float = float(
+            _token_bucket_script(
+                keys=[self.key],
+                args=[
+                    self.rate_limit.requests_per_second,
+                    self.rate_limit.capacity,
+                    max_wait,
+                ],
+                client=cache,
+            )
+        )
+        if wait > max_wait:
+            raise RateLimitExceededException(
+                f"Rate limit for {self.key} would need a wait of {wait:.2f}s, "
+                f"longer than the maximum of {max_wait}s"
+            )
+        if wait > 0:
+            logger.info("Rate limit reached for %s, waiting %.2fs", self.key, wait)
+            time.sleep(wait)
+        return wait
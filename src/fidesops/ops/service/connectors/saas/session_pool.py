@@ -0,0 +1,97 @@
+import logging
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from fidesops.ops.core.config import config
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str]  # (ConnectionConfig key, base URI)
+
+
+class PooledSession(NamedTuple):
+    """A Session held by the SessionPool, with when it was last used"""
+
+    session: Session
+    last_used: float
+
+
+def create_session() -> Session:
+    """
+    Create a Session whose connections are kept alive, up to `saas_max_connections_per_host` per host.
+
+    The Session doesn't keep cookies, since it's shared by every privacy request run against the connection.
+    """
+    session = Session()
+    # No domains are allowed, so cookies set by responses are rejected
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=config.execution.saas_max_connections_per_host,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SessionPool:
+    """
+    Worker-wide pool of the HTTP Sessions used to send requests to SaaS APIs.
+
+    A Session is kept for each ConnectionConfig and base URI, so its keep-alive connections are reused
+    across pages, nodes and privacy requests instead of setting up a new TCP and TLS connection for each
+    request. Sessions don't keep cookies, so nothing set by a response for one privacy request is sent on
+    behalf of another. A Session is closed once it hasn't been used for `connector_idle_timeout`
+    seconds.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: Dict[SessionKey, PooledSession] = {}
+
+    def get(self, connection_key: str, uri: str) -> Session:
+        """Return the Session for the given ConnectionConfig key and base URI, creating it if needed"""
+        key: SessionKey = (connection_key, uri)
+        now: float = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+
+            pooled: Optional[PooledSession] = self._sessions.get(key)
+            if pooled is None:
+                logger.info("Creating HTTP session for %s", connection_key)
+            session: Session = pooled.session if pooled else create_session()
+            self._sessions[key] = PooledSession(session, now)
+            return session
+
+    def invalidate(self, connection_key: str) -> None:
+        """Close the Sessions for the given ConnectionConfig key, so they're recreated on next use"""
+        with self._lock:
+            keys = [key for key in self._sessions if key[0] == connection_key]
+            sessions = [self._sessions.pop(key).session for key in keys]
+        for session in sessions:
+            session.close()
+
+    def clear(self) -> None:
+        """Close all held Sessions"""
+        with self._lock:
+            sessions = [pooled.session for pooled in self._sessions.values()]
+            self._sessions = {}
+        for session in sessions:
+            session.close()
+
+    def _evict_idle(self, now: float) -> None:
+        """Close Sessions that haven't been used within the idle timeout. Must hold the lock."""
+        idle_timeout: int = config.execution.connector_idle_timeout
+        for key, pooled in list(self._sessions.items()):
+            if now - pooled.last_used > idle_timeout:
+                logger.debug("Closing idle HTTP session for %s", key[0])
+                pooled.session.close()
+                del self._sessions[key]
+
+
+session_pool = SessionPool()
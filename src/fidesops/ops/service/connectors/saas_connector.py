@@ -1,21 +1,31 @@
+import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from json import JSONDecodeError
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import pydash
-from requests import Response
+from requests import RequestException, Response
 
-from fidesops.ops.common_exceptions import FidesopsException, PostProcessingException
+from fidesops.ops.common_exceptions import (
+    ConnectionException,
+    FidesopsException,
+    PostProcessingException,
+)
 from fidesops.ops.graph.traversal import Row, TraversalNode
 from fidesops.ops.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
 from fidesops.ops.models.policy import Policy
 from fidesops.ops.models.privacy_request import PrivacyRequest
-from fidesops.ops.schemas.saas.saas_config import ClientConfig, SaaSRequest
+from fidesops.ops.schemas.saas.saas_config import ClientConfig, Endpoint, SaaSRequest
 from fidesops.ops.schemas.saas.shared_schemas import SaaSRequestParams
 from fidesops.ops.service.connectors.base_connector import BaseConnector
 from fidesops.ops.service.connectors.saas.authenticated_client import (
     AuthenticatedClient,
 )
+from fidesops.ops.service.connectors.saas.rate_limiter import (
+    RateLimitBucket,
+    get_rate_limit_cache_key,
+)
 from fidesops.ops.service.connectors.saas_query_config import SaaSQueryConfig
 from fidesops.ops.service.pagination.pagination_strategy import PaginationStrategy
 from fidesops.ops.service.processors.post_processor_strategy.post_processor_strategy import (
@@ -25,10 +35,40 @@ from fidesops.ops.service.saas_request.saas_request_override_factory import (
     SaaSRequestOverrideFactory,
     SaaSRequestType,
 )
+from fidesops.ops.util.json_stream import JSONItemStream
 from fidesops.ops.util.saas_util import assign_placeholders, map_param_values
 
 logger = logging.getLogger(__name__)
 
+# size of the chunks of bytes read from streamed responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def run_concurrently(
+    func: Callable[[T], U], items: List[T], max_concurrent: int
+) -> List[U]:
+    """
+    Calls func on each item, with up to max_concurrent calls running at the same time.
+
+    Results are returned in the order of the items. If any call raises, calls that haven't started yet
+    are cancelled, and the exception of the first failing item in order is raised, as if the items had
+    been processed one at a time.
+    """
+    if max_concurrent <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrent, len(items))) as executor:
+        futures: List[Future] = [executor.submit(func, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
 
 class SaaSConnector(BaseConnector[AuthenticatedClient]):
     """A connector type to integrate with third-party SaaS APIs"""
@@ -91,17 +131,49 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         return client
 
     def create_client_from_request(
-        self, saas_request: SaaSRequest
+        self, saas_request: SaaSRequest, endpoint_name: Optional[str] = None
     ) -> AuthenticatedClient:
         """
         Permits authentication to be overridden at the request-level.
         Use authentication on the request if specified, otherwise, just use
         the authentication configured for the overall SaaS connector.
+
+        Requests sent by the client are rate limited by the given endpoint's
+        rate limit, or the rate limit of the overall SaaS connector.
         """
-        if saas_request.client_config:
-            return self._build_client_with_config(saas_request.client_config)
+        client: AuthenticatedClient = self._build_client_with_config(
+            saas_request.client_config or self.saas_config.client_config  # type: ignore
+        )
+        client.rate_limit_bucket = self.get_rate_limit_bucket(endpoint_name)
+        return client
+
+    def get_rate_limit_bucket(
+        self, endpoint_name: Optional[str] = None
+    ) -> Optional[RateLimitBucket]:
+        """Returns the token bucket for requests to the given endpoint, which has its own bucket if it
+        overrides the rate limit of the SaaS config"""
+        endpoint: Optional[Endpoint] = (
+            self.endpoints.get(endpoint_name) if endpoint_name else None
+        )
+        if endpoint and endpoint.rate_limit:
+            return RateLimitBucket(
+                get_rate_limit_cache_key(self.configuration.key, endpoint.name),
+                endpoint.rate_limit,
+            )
+        if self.saas_config.rate_limit:  # type: ignore
+            return RateLimitBucket(
+                get_rate_limit_cache_key(self.configuration.key),
+                self.saas_config.rate_limit,  # type: ignore
+            )
+        return None
 
-        return self._build_client_with_config(self.saas_config.client_config)  # type: ignore
+    def get_max_concurrent_requests(self, saas_request: SaaSRequest) -> int:
+        """The number of independent requests that may be sent at the same time, from the client config
+        of the request, or of the overall SaaS connector"""
+        client_config: ClientConfig = (
+            saas_request.client_config or self.saas_config.client_config  # type: ignore
+        )
+        return client_config.max_concurrent_requests or 1
 
     def retrieve_data(
         self,
@@ -137,18 +209,32 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
             input_data, policy
         )
 
-        # Iterates through initial list of prepared requests and through subsequent
-        # requests generated by pagination. The results are added to the output
-        # list of rows after each request.
-        rows: List[Row] = []
-        for next_request in prepared_requests:
+        identity_data: Dict[str, Any] = privacy_request.get_cached_identity_data()
+
+        def execute_request_chain(prepared_request: SaaSRequestParams) -> List[Row]:
+            """Executes the prepared request and the subsequent requests generated by
+            pagination, in order, returning the rows of all pages."""
+            chain_rows: List[Row] = []
+            next_request: Optional[SaaSRequestParams] = prepared_request
             while next_request:
-                processed_rows, next_request = self.execute_prepared_request(  # type: ignore
+                processed_rows, next_request = self.execute_prepared_request(
                     next_request,
-                    privacy_request.get_cached_identity_data(),
-                    read_request,
+                    identity_data,
+                    read_request,  # type: ignore
+                    node.address.collection,
                 )
-                rows.extend(processed_rows)
+                chain_rows.extend(processed_rows)
+            return chain_rows
+
+        # Independent requests, each with its pagination chain, may be executed at the same time.
+        # The results are added to the output list of rows in the order of the prepared requests.
+        rows: List[Row] = []
+        for chain_rows in run_concurrently(
+            execute_request_chain,
+            prepared_requests,
+            self.get_max_concurrent_requests(read_request),
+        ):
+            rows.extend(chain_rows)
         return rows
 
     def execute_prepared_request(
@@ -156,23 +242,37 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         prepared_request: SaaSRequestParams,
         identity_data: Dict[str, Any],
         saas_request: SaaSRequest,
+        endpoint_name: Optional[str] = None,
     ) -> Tuple[List[Row], Optional[SaaSRequestParams]]:
         """
         Executes the prepared request and handles response postprocessing and pagination.
         Returns processed data and request_params for next page of data if available.
         """
 
-        client: AuthenticatedClient = self.create_client_from_request(saas_request)
-        response: Response = client.send(prepared_request, saas_request.ignore_errors)
-        response = self._handle_errored_response(saas_request, response)
-        response_data = self._unwrap_response_data(saas_request, response)
-
-        # process response and add to rows
-        rows = self.process_response_data(
-            response_data,
-            identity_data,
-            saas_request.postprocessors,  # type: ignore
+        client: AuthenticatedClient = self.create_client_from_request(
+            saas_request, endpoint_name
         )
+        response: Response = client.send(
+            prepared_request, saas_request.ignore_errors, saas_request.stream_response
+        )
+        rows: List[Row]
+        if saas_request.stream_response and response.ok:
+            rows, response = self._process_streamed_response(
+                saas_request, response, identity_data
+            )
+        else:
+            if saas_request.stream_response:
+                # an ignored error isn't streamed, its body is replaced below
+                response.close()
+            response = self._handle_errored_response(saas_request, response)
+            response_data = self._unwrap_response_data(saas_request, response)
+
+            # process response and add to rows
+            rows = self.process_response_data(
+                response_data,
+                identity_data,
+                saas_request.postprocessors,  # type: ignore
+            )
 
         logger.info(
             "%s row(s) returned after postprocessing '%s' collection.",
@@ -212,9 +312,43 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
 
         The final result is returned as a list of processed objects.
         """
+        return self._postprocess(
+            response_data,
+            identity_data,
+            self._get_postprocessor_strategies(postprocessors),
+        )
 
+    def process_response_items(
+        self,
+        items: Iterable[Any],
+        identity_data: Dict[str, Any],
+        postprocessors: Optional[List[PostProcessorStrategy]],
+    ) -> List[Row]:
+        """
+        Runs each item of a streamed response through the postprocessors for the request
+        as it's parsed, so the raw items don't all have to be held in memory.
+
+        Postprocessors handle the elements of a list independently, and each processed item
+        is checked as an element of the processed list, so the result is the same as
+        processing the list of items at once.
+        """
+        strategies: List[PostProcessorStrategy] = self._get_postprocessor_strategies(
+            postprocessors
+        )
         rows: List[Row] = []
-        processed_data = response_data
+        for item in items:
+            processed_item = self._run_postprocessors(item, identity_data, strategies)
+            if isinstance(processed_item, dict):
+                rows.append(processed_item)
+            else:
+                rows.extend(self._rows_from_list(processed_item))
+        return rows
+
+    def _get_postprocessor_strategies(
+        self, postprocessors: Optional[List[PostProcessorStrategy]]
+    ) -> List[PostProcessorStrategy]:
+        """Builds the postprocessor strategies configured for a request"""
+        strategies: List[PostProcessorStrategy] = []
         for postprocessor in postprocessors or []:
             strategy: PostProcessorStrategy = PostProcessorStrategy.get_strategy(
                 postprocessor.strategy, postprocessor.configuration  # type: ignore
@@ -224,21 +358,25 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
                 self.collection_name,
                 postprocessor.strategy,  # type: ignore
             )
-            try:
-                processed_data = strategy.process(processed_data, identity_data)
-            except Exception as exc:
-                raise PostProcessingException(
-                    f"Exception occurred during the '{postprocessor.strategy}' postprocessor "  # type: ignore
-                    f"on the '{self.collection_name}' collection: {exc}"
-                )
+            strategies.append(strategy)
+        return strategies
+
+    def _postprocess(
+        self,
+        data: Any,
+        identity_data: Dict[str, Any],
+        strategies: List[PostProcessorStrategy],
+    ) -> List[Row]:
+        """
+        Forwards the data through the given postprocessors, returning the result as a list of rows
+        """
+
+        rows: List[Row] = []
+        processed_data = self._run_postprocessors(data, identity_data, strategies)
         if not processed_data:
             return rows
         if isinstance(processed_data, list):
-            if not all(isinstance(item, dict) for item in processed_data):
-                raise PostProcessingException(
-                    "The list returned after postprocessing did not contain elements of the same type."
-                )
-            rows.extend(processed_data)
+            rows.extend(self._rows_from_list(processed_data))
         elif isinstance(processed_data, dict):
             rows.append(processed_data)
         else:
@@ -249,6 +387,35 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
 
         return rows
 
+    def _run_postprocessors(
+        self,
+        data: Any,
+        identity_data: Dict[str, Any],
+        strategies: List[PostProcessorStrategy],
+    ) -> Any:
+        """Forwards the data through the given postprocessors, returning the output of the last one"""
+        processed_data = data
+        for strategy in strategies:
+            try:
+                processed_data = strategy.process(processed_data, identity_data)
+            except Exception as exc:
+                raise PostProcessingException(
+                    f"Exception occurred during the '{strategy.name}' postprocessor "
+                    f"on the '{self.collection_name}' collection: {exc}"
+                )
+        return processed_data
+
+    @staticmethod
+    def _rows_from_list(processed_data: Any) -> List[Row]:
+        """Returns the postprocessed list as rows, checking that it only contains dicts"""
+        if not isinstance(processed_data, list) or not all(
+            isinstance(item, dict) for item in processed_data
+        ):
+            raise PostProcessingException(
+                "The list returned after postprocessing did not contain elements of the same type."
+            )
+        return processed_data
+
     def mask_data(
         self,
         node: TraversalNode,
@@ -298,12 +465,17 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
             query_config.generate_update_stmt(row, policy, privacy_request)
             for row in rows
         ]
-        rows_updated = 0
-        client = self.create_client_from_request(masking_request)
-        for prepared_request in prepared_requests:
-            client.send(prepared_request, masking_request.ignore_errors)
-            rows_updated += 1
-        return rows_updated
+        client = self.create_client_from_request(
+            masking_request, node.address.collection
+        )
+        run_concurrently(
+            lambda prepared_request: client.send(
+                prepared_request, masking_request.ignore_errors  # type: ignore
+            ),
+            prepared_requests,
+            self.get_max_concurrent_requests(masking_request),
+        )
+        return len(prepared_requests)
 
     def close(self) -> None:
         """Not required for this type"""
@@ -325,6 +497,43 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
             response._content = b"{}"  # pylint: disable=W0212
         return response
 
+    def _process_streamed_response(
+        self,
+        saas_request: SaaSRequest,
+        response: Response,
+        identity_data: Dict[str, Any],
+    ) -> Tuple[List[Row], Response]:
+        """
+        Parses the items at the data_path of a streamed response one at a time, running
+        each of them through the postprocessors for the request.
+
+        Returns the processed rows, along with the response for the pagination strategy,
+        whose body is the rest of the page with the items reduced to the last one.
+        """
+        with response:
+            items = JSONItemStream(
+                response.iter_content(STREAM_CHUNK_SIZE),
+                saas_request.data_path,
+                response.encoding,
+            )
+            try:
+                rows = self.process_response_items(
+                    items,
+                    identity_data,
+                    saas_request.postprocessors,  # type: ignore
+                )
+            except (JSONDecodeError, UnicodeDecodeError):
+                raise FidesopsException(
+                    f"Unable to parse JSON response from {saas_request.path}"
+                )
+            except RequestException as exc:
+                raise ConnectionException(
+                    f"Operational Error reading the response from '{self.configuration.key}': {exc}"
+                )
+
+        response._content = json.dumps(items.skeleton).encode()  # pylint: disable=W0212
+        return rows, response
+
     @staticmethod
     def _unwrap_response_data(saas_request: SaaSRequest, response: Response) -> Any:
         """
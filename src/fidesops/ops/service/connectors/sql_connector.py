@@ -17,6 +17,7 @@ from sqlalchemy.sql import Executable  # type: ignore
 from sqlalchemy.sql.elements import TextClause
 
 from fidesops.ops.common_exceptions import ConnectionException
+from fidesops.ops.core.config import config as fides_config
 from fidesops.ops.graph.traversal import Row, TraversalNode
 from fidesops.ops.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
 from fidesops.ops.models.policy import Policy
@@ -38,6 +39,7 @@ from fidesops.ops.schemas.connection_configuration.connection_secrets_mysql impo
     MySQLSchema,
 )
 from fidesops.ops.service.connectors.base_connector import BaseConnector
+from fidesops.ops.service.connectors.engine_registry import engine_registry
 from fidesops.ops.service.connectors.query_config import (
     BigQueryQueryConfig,
     MicrosoftSQLServerQueryConfig,
@@ -45,6 +47,7 @@ from fidesops.ops.service.connectors.query_config import (
     SnowflakeQueryConfig,
     SQLQueryConfig,
 )
+from fidesops.ops.util.collection_util import unique_rows
 
 logger = logging.getLogger(__name__)
 
@@ -122,17 +125,28 @@ class SQLConnector(BaseConnector[Engine]):
         privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Retrieve sql data"""
+        """Retrieve sql data.
+
+        Large inputs are queried in chunks of up to `query_batch_size` values, run in turn on one connection.
+        """
         query_config = self.query_config(node)
         client = self.client()
-        stmt: Optional[TextClause] = query_config.generate_query(input_data, policy)
-        if stmt is None:
+        stmts: List[TextClause] = query_config.generate_queries(input_data, policy)
+        if not stmts:
             return []
-        logger.info("Starting data retrieval for %s", node.address)
+        logger.info(
+            "Starting data retrieval for %s in %s queries", node.address, len(stmts)
+        )
+        rows: List[Row] = []
         with client.connect() as connection:
             self.set_schema(connection)
-            results = connection.execute(stmt)
-            return self.cursor_result_to_rows(results)
+            for stmt in stmts:
+                results = connection.execute(stmt)
+                rows.extend(self.cursor_result_to_rows(results))
+        if len(stmts) == 1:
+            return rows
+        # A row can match more than one chunk when it's queried on more than one field
+        return unique_rows(rows)
 
     def mask_data(
         self,
@@ -142,26 +156,44 @@ class SQLConnector(BaseConnector[Engine]):
         rows: List[Row],
         input_data: Dict[str, List[Any]],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        All rows are masked in a single transaction, batching rows that are masked to the same values
+        into a single update statement where possible."""
         query_config = self.query_config(node)
+        update_stmts: List[TextClause] = query_config.generate_update_stmts(
+            rows, policy, privacy_request
+        )
+        if not update_stmts:
+            return 0
+
         update_ct = 0
         client = self.client()
-        for row in rows:
-            update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+        with client.begin() as connection:
+            self.set_schema(connection)
+            for update_stmt in update_stmts:
+                results: LegacyCursorResult = connection.execute(update_stmt)
+                update_ct = update_ct + results.rowcount
         return update_ct
 
+    def client(self) -> Engine:
+        """Return the worker-wide Engine for this connection, shared between privacy requests"""
+        if not self.db_client:
+            self.db_client = engine_registry.get(self.configuration, self.create_client)
+        return self.db_client
+
     def close(self) -> None:
-        """Close any held resources"""
-        if self.db_client:
-            logger.debug(" disposing of %s", self.__class__)
-            self.db_client.dispose()
+        """Release the Engine. It's left open in the engine registry for use by later requests."""
+        self.db_client = None
+
+    @staticmethod
+    def engine_pool_kwargs() -> Dict[str, Any]:
+        """Connection pool options for Engines, which are kept between privacy requests"""
+        return {
+            "pool_size": fides_config.execution.connector_pool_size,
+            "max_overflow": fides_config.execution.connector_max_overflow,
+            "pool_pre_ping": fides_config.execution.connector_pool_pre_ping,
+        }
 
     def create_client(self) -> Engine:
         """Returns a SQLAlchemy Engine that can be used to interact with a database"""
@@ -171,6 +203,7 @@ class SQLConnector(BaseConnector[Engine]):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.engine_pool_kwargs(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -323,6 +356,7 @@ class BigQueryConnector(SQLConnector):
             credentials_info=config.keyfile_creds.dict(),
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.engine_pool_kwargs(),
         )
 
     # Overrides SQLConnector.query_config
@@ -342,14 +376,16 @@ class BigQueryConnector(SQLConnector):
         query_config = self.query_config(node)
         update_ct = 0
         client = self.client()
-        for row in rows:
-            update_stmt: Optional[Executable] = query_config.generate_update(
-                row, policy, privacy_request, client
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+        update_stmts: List[Executable] = query_config.generate_updates(
+            rows, policy, privacy_request, client
+        )
+        if not update_stmts:
+            return update_ct
+
+        with client.connect() as connection:
+            for update_stmt in update_stmts:
+                results: LegacyCursorResult = connection.execute(update_stmt)
+                update_ct = update_ct + results.rowcount
         return update_ct
 
 
@@ -0,0 +1,85 @@
+import logging
+import threading
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import Text, cast, func
+from sqlalchemy.orm import Session
+
+from fidesops.ops.graph.graph import DatasetGraph
+from fidesops.ops.models.connectionconfig import ConnectionConfig
+from fidesops.ops.models.datasetconfig import DatasetConfig
+
+logger = logging.getLogger(__name__)
+
+GraphVersion = Tuple[Any, ...]
+
+
+def get_graph_version(db: Session) -> GraphVersion:
+    """
+    Return a version stamp for the DatasetConfigs and ConnectionConfigs the DatasetGraph is built from.
+
+    This is the count and most recent `updated_at` of the DatasetConfigs, along with the key, type and
+    a hash of the SaaS config of each ConnectionConfig, so creating, updating or deleting any dataset,
+    or changing what the graph takes from a connection - from this process or any other - changes the
+    version. Other connection changes, such as refreshed OAuth2 tokens, leave it as it is.
+    """
+    datasets = tuple(
+        db.query(func.count(DatasetConfig.id), func.max(DatasetConfig.updated_at)).one()
+    )
+    connections = tuple(
+        tuple(row)
+        for row in db.query(
+            ConnectionConfig.id,
+            ConnectionConfig.key,
+            ConnectionConfig.connection_type,
+            func.md5(cast(ConnectionConfig.saas_config, Text)),
+        ).order_by(ConnectionConfig.id)
+    )
+    return datasets, connections
+
+
+def build_dataset_graph(db: Session) -> DatasetGraph:
+    """Build a DatasetGraph from all DatasetConfigs, merging in any SaaS configs"""
+    datasets = DatasetConfig.all(db=db)
+    dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
+    return DatasetGraph(*dataset_graphs)
+
+
+class DatasetGraphCache:
+    """
+    Process-wide cache of the DatasetGraph built from all DatasetConfigs.
+
+    Building the graph re-parses every dataset and SaaS config, so rather than building it for each
+    privacy request, it's rebuilt only when the version of the underlying configs changes. The cached
+    DatasetGraph is shared between privacy requests and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version: Optional[GraphVersion] = None
+        self._graph: Optional[DatasetGraph] = None
+
+    def get(self, db: Session) -> DatasetGraph:
+        """Return the DatasetGraph for the current configs, building it if they have changed"""
+        version: GraphVersion = get_graph_version(db)
+        # Hold the lock while building, so concurrent requests wait for a single build
+        with self._lock:
+            if self._graph is None or self._version != version:
+                logger.info("Building dataset graph for config version %s", version)
+                self._graph = build_dataset_graph(db)
+                self._version = version
+            return self._graph
+
+    def clear(self) -> None:
+        """Drop the cached DatasetGraph, so it's rebuilt on next access"""
+        with self._lock:
+            self._graph = None
+            self._version = None
+
+
+dataset_graph_cache = DatasetGraphCache()
+
+
+def get_dataset_graph(db: Session) -> DatasetGraph:
+    """Return the shared DatasetGraph built from all DatasetConfigs"""
+    return dataset_graph_cache.get(db)
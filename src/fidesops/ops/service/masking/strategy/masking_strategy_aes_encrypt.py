@@ -31,7 +31,11 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
 
     def __init__(self, configuration: AesEncryptionMaskingConfiguration):
         self.mode = configuration.mode
-        self.format_preservation = configuration.format_preservation
+        self.format_preservation: Optional[FormatPreservation] = (
+            FormatPreservation(configuration.format_preservation)
+            if configuration.format_preservation is not None
+            else None
+        )
 
     def mask(
         self, values: Optional[List[str]], request_id: Optional[str]
@@ -50,6 +54,11 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
                 SecretType.key_hmac,
                 masking_meta[SecretType.key_hmac],
             )
+            salt: str | None = SecretsUtil.get_or_generate_secret(
+                request_id,
+                SecretType.salt_hmac,
+                masking_meta[SecretType.salt_hmac],
+            )
 
             # The nonce is generated deterministically such that the same input val will result in same nonce
             # and therefore the same masked val through the aes strategy. This is called convergent encryption, with this
@@ -58,12 +67,11 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
             masked_values: List[str] = []
             for value in values:
                 nonce: bytes | None = self._generate_nonce(
-                    value, key_hmac, request_id, masking_meta  # type: ignore
+                    value, key_hmac, salt  # type: ignore
                 )
                 masked: str = encrypt(value, key, nonce)  # type: ignore
                 if self.format_preservation is not None:
-                    formatter = FormatPreservation(self.format_preservation)
-                    masked = formatter.format(masked)
+                    masked = self.format_preservation.format(masked)
                 masked_values.append(masked)
             return masked_values
 
@@ -104,15 +112,7 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
         return data_type in supported_data_types
 
     @staticmethod
-    def _generate_nonce(
-        value: str,
-        key: str,
-        privacy_request_id: Optional[str],
-        masking_meta: Dict[SecretType, MaskingSecretMeta],
-    ) -> bytes:
-        salt = SecretsUtil.get_or_generate_secret(
-            privacy_request_id, SecretType.salt_hmac, masking_meta[SecretType.salt_hmac]
-        )
+    def _generate_nonce(value: str, key: str, salt: str) -> bytes:
         # Trim to 12 bytes, which is recommended length from aes gcm lib:
         # https://cryptography.io/en/latest/hazmat/primitives/aead/#cryptography.hazmat.primitives.ciphers.aead.AESGCM.encrypt
         return hmac_encrypt_return_bytes(
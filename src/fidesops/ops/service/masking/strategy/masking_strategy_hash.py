@@ -34,7 +34,11 @@ class HashMaskingStrategy(MaskingStrategy):
             self.algorithm_function = self._hash_sha256
         elif self.algorithm == HashMaskingConfiguration.Algorithm.SHA_512:
             self.algorithm_function = self._hash_sha512
-        self.format_preservation = configuration.format_preservation
+        self.format_preservation: Optional[FormatPreservation] = (
+            FormatPreservation(configuration.format_preservation)
+            if configuration.format_preservation is not None
+            else None
+        )
 
     def mask(
         self, values: Optional[List[str]], request_id: Optional[str]
@@ -56,8 +60,7 @@ class HashMaskingStrategy(MaskingStrategy):
         for value in values:
             masked: str = self.algorithm_function(value, salt)  # type: ignore
             if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                masked = formatter.format(masked)
+                masked = self.format_preservation.format(masked)
             masked_values.append(masked)
         return masked_values
 
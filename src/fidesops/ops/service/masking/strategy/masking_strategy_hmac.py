@@ -31,7 +31,11 @@ class HmacMaskingStrategy(MaskingStrategy):
         configuration: HmacMaskingConfiguration,
     ):
         self.algorithm = configuration.algorithm
-        self.format_preservation = configuration.format_preservation
+        self.format_preservation: Optional[FormatPreservation] = (
+            FormatPreservation(configuration.format_preservation)
+            if configuration.format_preservation is not None
+            else None
+        )
 
     def mask(
         self, values: Optional[List[str]], request_id: Optional[str]
@@ -56,8 +60,7 @@ class HmacMaskingStrategy(MaskingStrategy):
         for value in values:
             masked: str = hmac_encrypt_return_str(value, key, salt, self.algorithm)  # type: ignore
             if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                masked = formatter.format(masked)
+                masked = self.format_preservation.format(masked)
             masked_values.append(masked)
         return masked_values
 
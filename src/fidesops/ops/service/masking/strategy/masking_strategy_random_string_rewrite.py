@@ -24,7 +24,11 @@ class RandomStringRewriteMaskingStrategy(MaskingStrategy):
         configuration: RandomStringMaskingConfiguration,
     ):
         self.length = configuration.length
-        self.format_preservation = configuration.format_preservation
+        self.format_preservation: Optional[FormatPreservation] = (
+            FormatPreservation(configuration.format_preservation)
+            if configuration.format_preservation is not None
+            else None
+        )
 
     def mask(
         self, values: Optional[List[str]], request_id: Optional[str]
@@ -41,8 +45,7 @@ class RandomStringRewriteMaskingStrategy(MaskingStrategy):
                 ]
             )
             if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                masked = formatter.format(masked)
+                masked = self.format_preservation.format(masked)
             masked_values.append(masked)
         return masked_values
 
@@ -22,7 +22,11 @@ class StringRewriteMaskingStrategy(MaskingStrategy):
         configuration: StringRewriteMaskingConfiguration,
     ):
         self.rewrite_value = configuration.rewrite_value
-        self.format_preservation = configuration.format_preservation
+        self.format_preservation: Optional[FormatPreservation] = (
+            FormatPreservation(configuration.format_preservation)
+            if configuration.format_preservation is not None
+            else None
+        )
 
     def mask(
         self, values: Optional[List[str]], request_id: Optional[str]
@@ -31,14 +35,10 @@ class StringRewriteMaskingStrategy(MaskingStrategy):
         None"""
         if values is None:
             return None
-        masked_values: List[str] = []
-        for _ in range(len(values)):
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                masked_values.append(formatter.format(self.rewrite_value))
-            else:
-                masked_values.append(self.rewrite_value)
-        return masked_values
+        masked: str = self.rewrite_value
+        if self.format_preservation is not None:
+            masked = self.format_preservation.format(masked)
+        return [masked] * len(values)
 
     def secrets_required(self) -> bool:
         return False
@@ -158,6 +158,7 @@ class OneTrustService:
             db=db,
             identity=Identity(email=identity.email),
         )
+        privacy_request.create_cache_index()
         privacy_request.cache_identity(identity)
         try:
             queue_privacy_request(privacy_request_id=privacy_request.id)
@@ -1,7 +1,7 @@
 import logging
 import random
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
 from celery.utils.log import get_task_logger
 from fideslib.db.session import get_db_session
@@ -25,9 +25,9 @@ from fidesops.ops.graph.analytics_events import (
     failed_graph_analytics_event,
     fideslog_graph_failure,
 )
+from fidesops.ops.graph.config import FieldPath
 from fidesops.ops.graph.graph import DatasetGraph
 from fidesops.ops.models.connectionconfig import ConnectionConfig
-from fidesops.ops.models.datasetconfig import DatasetConfig
 from fidesops.ops.models.manual_webhook import AccessManualWebhook
 from fidesops.ops.models.policy import (
     ActionType,
@@ -48,9 +48,10 @@ from fidesops.ops.schemas.email.email import (
     EmailActionType,
 )
 from fidesops.ops.service.connectors.email_connector import email_connector_erasure_send
+from fidesops.ops.service.dataset_graph_cache import get_dataset_graph
 from fidesops.ops.service.email.email_dispatch_service import dispatch_email
 from fidesops.ops.service.storage.storage_uploader_service import upload
-from fidesops.ops.task.filter_results import filter_data_categories
+from fidesops.ops.task.filter_results import FieldPathExtractor, filter_data_categories
 from fidesops.ops.task.graph_task import (
     get_cached_data_for_erasures,
     run_access_request,
@@ -179,6 +180,8 @@ def upload_access_results(
     download_urls: List[str] = []
     if not access_result:
         logging.info("No results returned for access request %s", privacy_request.id)
+    # Field path extractors compiled for one rule are reused by any other rule targeting the same fields
+    extractors: Dict[FrozenSet[FieldPath], FieldPathExtractor] = {}
     for rule in policy.get_rules_for_action(action_type=ActionType.access):
         if not rule.storage_destination:
             raise common_exceptions.RuleValidationError(
@@ -191,6 +194,7 @@ def upload_access_results(
             access_result,
             target_categories,
             dataset_graph.data_category_field_mapping,
+            extractors,
         )
 
         filtered_results.update(
@@ -308,9 +312,7 @@ async def run_privacy_request(
             )
 
         try:
-            datasets = DatasetConfig.all(db=session)
-            dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-            dataset_graph = DatasetGraph(*dataset_graphs)
+            dataset_graph: DatasetGraph = get_dataset_graph(session)
             identity_data = privacy_request.get_cached_identity_data()
             connection_configs = ConnectionConfig.all(db=session)
             access_result_urls: List[str] = []
@@ -43,6 +43,7 @@ def cache_data(
     """Cache privacy request data"""
     # Store identity and encryption key in the cache
     logger.info("Caching identity for privacy request %s", privacy_request.id)
+    privacy_request.create_cache_index()
     privacy_request.cache_identity(identity)
     privacy_request.cache_encryption(encryption_key)  # handles None already
 
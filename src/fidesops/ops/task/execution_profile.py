@@ -0,0 +1,106 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fidesops.ops.graph.config import CollectionAddress
+
+# Stages of running a single node that are timed separately
+PRE_PROCESS = "pre_process"
+CONNECTOR = "connector"
+POST_PROCESS = "post_process"
+CACHE = "cache"
+
+NodeProfile = Dict[str, Any]
+
+
+class NodeTimer:
+    """Accumulates the wall time spent in each stage of running a single graph node.
+
+    Time spent in a stage is added across retries, and the total is measured from the first
+    attempt, so it includes time spent waiting between retries.
+    """
+
+    def __init__(self) -> None:
+        self.started: Optional[float] = None
+        self.stages: Dict[str, float] = {}
+
+    def start(self) -> None:
+        """Start timing the node from scratch"""
+        self.started = time.perf_counter()
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Add the time spent in the enclosed block to the given stage"""
+        stage_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = (
+                self.stages.get(name, 0.0) + time.perf_counter() - stage_start
+            )
+
+    def profile(self, upstream: List[CollectionAddress]) -> NodeProfile:
+        """Format the timings for storage on the ExecutionLog, in seconds.
+
+        The upstream collections this node waited on are stored alongside, so the
+        critical path can be rebuilt from the ExecutionLogs alone.
+
+        :Example:
+        {
+            "total": 2.5,
+            "stages": {"pre_process": 0.01, "connector": 2.4, "post_process": 0.04, "cache": 0.05},
+            "upstream": ["postgres_example:customer"]
+        }
+        """
+        total: float = (
+            time.perf_counter() - self.started
+            if self.started is not None
+            else sum(self.stages.values())
+        )
+        return {
+            "total": round(total, 6),
+            "stages": {name: round(secs, 6) for name, secs in self.stages.items()},
+            "upstream": [address.value for address in upstream],
+        }
+
+
+def find_critical_path(profiles: Dict[str, NodeProfile]) -> Tuple[float, List[str]]:
+    """Find the chain of dependent nodes that took the longest in total. This is the
+    chain that bounds how long the graph took to run, however many nodes are run concurrently.
+
+    :param profiles: collection addresses mapped to the profile recorded for that node.
+    Upstream collections without a profile (the root, or collections picked up from the
+    cache on restart) are treated as taking no time.
+    :return: the total duration of the critical path and the collections along it, in order.
+    """
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+
+    def visit(address: str) -> float:
+        if address in finish:
+            return finish[address]
+        if address not in profiles:
+            return 0.0
+
+        latest_upstream: Optional[str] = None
+        start: float = 0.0
+        for upstream in profiles[address].get("upstream", []):
+            upstream_finish = visit(upstream)
+            if latest_upstream is None or upstream_finish > start:
+                latest_upstream, start = upstream, upstream_finish
+
+        previous[address] = latest_upstream if latest_upstream in profiles else None
+        finish[address] = start + profiles[address].get("total", 0.0)
+        return finish[address]
+
+    if not profiles:
+        return 0.0, []
+
+    end: str = max(sorted(profiles), key=visit)
+    path: List[str] = []
+    current: Optional[str] = end
+    while current is not None:
+        path.append(current)
+        current = previous[current]
+    return round(finish[end], 6), list(reversed(path))
@@ -1,7 +1,7 @@
 import copy
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple
 
 import pydash
 
@@ -16,6 +16,9 @@ from fidesops.ops.util.logger import Pii
 
 logger = logging.getLogger(__name__)
 
+# Key marking the indices to keep of the array at a level of an element match mask tree
+_PRESERVED_INDICES = object()
+
 
 def filter_element_match(
     row: Row,
@@ -154,3 +157,116 @@ def _expand_array_paths_to_preserve(paths: List[DetailedPath]) -> Dict[str, List
     for path in expanded:
         merge_paths[join_detailed_path(path[0:-1])].append(path[-1])  # type: ignore
     return merge_paths
+
+
+def build_element_match_mask(
+    row: Row, query_paths: FieldPathNodeInput
+) -> Dict[str, List[int]]:
+    """
+    Returns the indices of the array elements in the row that matched the query paths, by dot-separated
+    path to each array. This is the mask `filter_element_match` applies to the row.
+
+    :Example:
+    build_element_match_mask(
+        row={"A": [1, 2, 3], "B": 2, "C": [{"D": 3, "E": 4}, {"D": 5, "E": 6}, {"D": 5, "E": 7}]},
+        query_paths={FieldPath("A"): [2], FieldPath("C, "D"): [5]}
+    )
+
+    {"A": [1], "C": [1, 2]}
+    """
+    return _expand_array_paths_to_preserve(build_refined_target_paths(row, query_paths))
+
+
+def apply_element_match_mask(
+    row: Row, mask: Dict[str, List[int]], delete_elements: bool = True
+) -> Row:
+    """
+    Returns the row with the array elements not preserved by the mask removed, or replaced with placeholder text
+    if delete_elements is False.
+
+    Unlike `filter_element_match`, the row is not modified. Only the dicts and arrays along the masked paths are
+    copied, and all other data is shared with the original row.
+    """
+    if not mask:
+        return row
+
+    tree: Dict[Any, Any] = {}
+    for path, preserve_index_list in mask.items():
+        node: Dict[Any, Any] = tree
+        for level in path.split("."):
+            node = node.setdefault(level, {})
+        node[_PRESERVED_INDICES] = preserve_index_list
+    return _apply_mask_tree(row, tree, delete_elements)
+
+
+def _apply_mask_tree(value: Any, node: Dict[Any, Any], delete_elements: bool) -> Any:
+    """Copy the dicts and arrays along the given level of a mask tree, filtering the arrays with preserved indices.
+    Nested levels are applied first, so indices always refer to the original arrays."""
+    if isinstance(value, dict):
+        copied_dict: Dict[str, Any] = dict(value)
+        for key, child in node.items():
+            if key is not _PRESERVED_INDICES and key in copied_dict:
+                copied_dict[key] = _apply_mask_tree(
+                    copied_dict[key], child, delete_elements
+                )
+        return copied_dict
+
+    if isinstance(value, list):
+        copied_list: List[Any] = list(value)
+        for key, child in node.items():
+            if (
+                key is not _PRESERVED_INDICES
+                and key.isdigit()
+                and int(key) < len(value)
+            ):
+                copied_list[int(key)] = _apply_mask_tree(
+                    copied_list[int(key)], child, delete_elements
+                )
+
+        preserve_indices = set(node.get(_PRESERVED_INDICES, range(len(value))))
+        if delete_elements:
+            return [
+                elem
+                for index, elem in enumerate(copied_list)
+                if index in preserve_indices
+            ]
+        return [
+            elem if index in preserve_indices else FIDESOPS_DO_NOT_MASK_INDEX
+            for index, elem in enumerate(copied_list)
+        ]
+
+    return value
+
+
+class ElementMatchedRows(NamedTuple):
+    """
+    Rows retrieved from a collection, stored once along with a mask per row of the array elements that
+    matched the query.
+
+    The access view, with unmatched array elements removed, and the erasure view, with unmatched array
+    elements replaced with placeholder text, are derived from the rows when needed, copying only the arrays
+    that are filtered and the containers above them.
+    """
+
+    rows: List[Row]
+    masks: List[Dict[str, List[int]]]
+
+    @classmethod
+    def build(
+        cls, rows: List[Row], query_paths: FieldPathNodeInput
+    ) -> "ElementMatchedRows":
+        return cls(rows, [build_element_match_mask(row, query_paths) for row in rows])
+
+    def access_rows(self) -> List[Row]:
+        """Rows with unmatched array elements removed"""
+        return [
+            apply_element_match_mask(row, mask)
+            for row, mask in zip(self.rows, self.masks)
+        ]
+
+    def erasure_rows(self) -> List[Row]:
+        """Rows with unmatched array elements replaced with placeholder text, so the original indices are preserved"""
+        return [
+            apply_element_match_mask(row, mask, delete_elements=False)
+            for row, mask in zip(self.rows, self.masks)
+        ]
@@ -1,7 +1,7 @@
 import itertools
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Union
 
 from fidesops.ops.graph.config import CollectionAddress, FieldPath
 from fidesops.ops.schemas.shared_schemas import FidesOpsKey
@@ -14,6 +14,7 @@ def filter_data_categories(
     access_request_results: Dict[str, List[Dict[str, Optional[Any]]]],
     target_categories: Set[str],
     data_category_fields: Dict[CollectionAddress, Dict[FidesOpsKey, List[FieldPath]]],
+    extractors: Optional[Dict[FrozenSet[FieldPath], "FieldPathExtractor"]] = None,
 ) -> Dict[str, List[Dict[str, Optional[Any]]]]:
     """Filter access request results to only return fields associated with the target data categories
     and subcategories.
@@ -25,12 +26,16 @@ def filter_data_categories(
     :param access_request_results: Dictionary of access request results for each of your collections
     :param target_categories: A set of data categories that we'd like to extract from access_request_results
     :param data_category_fields: Data categories mapped to applicable fields for each collection
+    :param extractors: Optional cache of compiled FieldPathExtractors, keyed by their field paths. Pass the same
+    dict when filtering the same results for each rule of a policy, so field paths are only compiled once.
 
     :return: Filtered access request results that only contain fields matching the desired data categories.
     """
     logger.info(
         "Filtering Access Request results to return fields associated with data categories"
     )
+    if extractors is None:
+        extractors = {}
     filtered_access_results: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for node_address, results in access_request_results.items():
         if not results:
@@ -38,7 +43,7 @@ def filter_data_categories(
 
         # Gets all FieldPaths on this traversal_node associated with the requested data
         # categories and sub data categories
-        target_field_paths: Set[FieldPath] = set(
+        target_field_paths: FrozenSet[FieldPath] = frozenset(
             itertools.chain(
                 *[
                     field_paths
@@ -53,16 +58,70 @@ def filter_data_categories(
         if not target_field_paths:
             continue
 
-        for row in results:
-            filtered_results: Dict[str, Any] = {}
-            for field_path in target_field_paths:
-                select_and_save_field(filtered_results, row, field_path)
-            remove_empty_containers(filtered_results)
-            filtered_access_results[node_address].append(filtered_results)
+        extractor: Optional[FieldPathExtractor] = extractors.get(target_field_paths)
+        if extractor is None:
+            extractor = extractors[target_field_paths] = FieldPathExtractor(
+                target_field_paths
+            )
+
+        filtered_access_results[node_address] = [
+            extractor.extract(row) for row in results
+        ]
 
     return filtered_access_results
 
 
+# Nested dicts of FieldPath levels, with an empty dict marking the end of a path
+FieldPathTrie = Dict[Any, Any]
+
+
+class FieldPathExtractor:
+    """Extracts the data located along a set of FieldPaths from rows.
+
+    The FieldPaths are compiled once into a trie of their levels, so each row is walked a single time
+    no matter how many paths are selected, and only the selected subtree is copied. The result is the same
+    as calling `select_and_save_field` for each FieldPath and then `remove_empty_containers`.
+    """
+
+    def __init__(self, field_paths: Iterable[FieldPath]):
+        self.trie: FieldPathTrie = {}
+        for field_path in field_paths:
+            node: FieldPathTrie = self.trie
+            for level in field_path.levels:
+                node = node.setdefault(level, {})
+
+    def extract(self, row: Row) -> Dict[str, Any]:
+        """Return a new row containing only the data along the compiled FieldPaths, without empty containers"""
+        return _extract(row, self.trie)
+
+
+def _is_empty_container(value: Any) -> bool:
+    return isinstance(value, (dict, list)) and not value
+
+
+def _extract(value: Any, node: FieldPathTrie) -> Any:
+    """Copy the parts of `value` selected by the given trie node. Arrays are descended into with the same node,
+    dicts are narrowed to the node's children, and anything else is selected as is."""
+    if isinstance(value, list):
+        selected_elems: List[Any] = []
+        for elem in value:
+            selected: Any = _extract(elem, node)
+            if not _is_empty_container(selected):
+                selected_elems.append(selected)
+        return selected_elems
+
+    if isinstance(value, dict):
+        selected_fields: Dict[Any, Any] = {}
+        for key, child in node.items():
+            if key in value:
+                selected = _extract(value[key], child)
+                if not _is_empty_container(selected):
+                    selected_fields[key] = selected
+        return selected_fields
+
+    return value
+
+
 def select_and_save_field(saved: Any, row: Row, target_path: FieldPath) -> Dict:
     """Extract the data located along the given `target_path` from the row and add to the "saved" dictionary.
 
@@ -1,12 +1,13 @@
-import copy
 import logging
 import traceback
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from time import sleep
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import dask
+from dask.core import get_dependencies
 from dask.threaded import get
 from sqlalchemy.orm import Session
 
@@ -30,26 +31,31 @@ from fidesops.ops.graph.config import (
 )
 from fidesops.ops.graph.graph import DatasetGraph, Edge, Node
 from fidesops.ops.graph.graph_differences import format_graph_for_caching
-from fidesops.ops.graph.traversal import Traversal, TraversalNode
+from fidesops.ops.graph.traversal import Traversal, TraversalNode, get_traversal
 from fidesops.ops.models.connectionconfig import AccessLevel, ConnectionConfig
 from fidesops.ops.models.policy import ActionType, Policy
 from fidesops.ops.models.privacy_request import ExecutionLogStatus, PrivacyRequest
 from fidesops.ops.service.connectors import BaseConnector
-from fidesops.ops.task.consolidate_query_matches import consolidate_query_matches
-from fidesops.ops.task.filter_element_match import filter_element_match
+from fidesops.ops.task.execution_profile import (
+    CACHE,
+    CONNECTOR,
+    POST_PROCESS,
+    PRE_PROCESS,
+    NodeTimer,
+)
+from fidesops.ops.task.filter_element_match import ElementMatchedRows
+from fidesops.ops.task.input_plan import NodeInputPlan
 from fidesops.ops.task.refine_target_path import FieldPathNodeInput
 from fidesops.ops.task.task_resources import TaskResources
-from fidesops.ops.util.cache import get_cache
-from fidesops.ops.util.collection_util import NodeInput, Row, append, partition
+from fidesops.ops.util.cache import get_cache, get_privacy_request_cache_index
+from fidesops.ops.util.collection_util import NodeInput, Row, partition
 from fidesops.ops.util.logger import Pii
-from fidesops.ops.util.saas_util import FIDESOPS_GROUPED_INPUTS
 
 logger = logging.getLogger(__name__)
 
 dask.config.set(scheduler="threads")
 
 EMPTY_REQUEST = PrivacyRequest()
-COLLECTION_FIELD_PATH_MAP = Dict[CollectionAddress, List[Tuple[FieldPath, FieldPath]]]
 
 
 def retry(
@@ -73,6 +79,7 @@ def retry(
             self = args[0]
 
             raised_ex: Optional[Union[BaseException, Exception]] = None
+            self.timer.start()
             for attempt in range(config.execution.task_retry_count + 1):
                 try:
                     self.skip_if_disabled()
@@ -82,7 +89,10 @@ def retry(
                     else:
                         self.log_start(action_type)
                     # Run access or erasure request
-                    return func(*args, **kwargs)
+                    with self.resources.connection_slot(
+                        self.traversal_node.node.dataset.connection_key
+                    ):
+                        return func(*args, **kwargs)
                 except PrivacyRequestPaused as ex:
                     logger.warning(
                         "Privacy request %s paused %s",
@@ -156,6 +166,11 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
 
         self.key = self.traversal_node.address
 
+        # the collections this task waits on in the dask graph, and time spent running it
+        self.upstream: List[CollectionAddress] = []
+        self.timer = NodeTimer()
+        self._input_plan: Optional[NodeInputPlan] = None
+
         self.execution_log_id = None
         # a local copy of the execution log record written to. If we write multiple status
         # updates, we will use this id to ensure that we're updating rather than creating
@@ -180,37 +195,6 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 return True
         return False
 
-    def build_incoming_field_path_maps(
-        self, group_dependent_fields: bool = False
-    ) -> Tuple[COLLECTION_FIELD_PATH_MAP, COLLECTION_FIELD_PATH_MAP]:
-        """
-        For each collection connected to the current collection, return a list of tuples
-        mapping the foreign field to the local field.  This is used to process data from incoming collections
-        into the current collection.
-
-        :param group_dependent_fields: Whether we should split the incoming fields into two groups: one whose
-        fields are completely independent of one another, and the other whose incoming data needs to stay linked together.
-        If False, all fields are returned in the first tuple, and the second tuple just maps collections to an empty list.
-
-        """
-
-        def field_map(keep: Callable) -> COLLECTION_FIELD_PATH_MAP:
-            return {
-                col_addr: [
-                    (edge.f1.field_path, edge.f2.field_path)
-                    for edge in edge_list
-                    if keep(edge.f2.field_path.string_path)
-                ]
-                for col_addr, edge_list in self.incoming_edges_by_collection.items()
-            }
-
-        if group_dependent_fields:
-            return field_map(
-                lambda string_path: string_path not in self.grouped_fields
-            ), field_map(lambda string_path: string_path in self.grouped_fields)
-
-        return field_map(lambda string_path: True), field_map(lambda string_path: False)
-
     def generate_dry_run_query(self) -> Optional[str]:
         """Type-specific query generated for this traversal_node."""
         return self.connector.dry_run_query(self.traversal_node)
@@ -220,37 +204,26 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         connection_config: ConnectionConfig = self.connector.configuration
         return connection_config.access == AccessLevel.write
 
-    def _combine_seed_data(
-        self,
-        *data: List[Row],
-        grouped_data: Dict[str, Any],
-        dependent_field_mappings: COLLECTION_FIELD_PATH_MAP,
-    ) -> Dict[str, Any]:
-        """Combine the seed data with the other dependent inputs. This is used when the seed data in a collection requires
-        inputs from another collection to generate subsequent queries."""
-        # Get the identity values from the seeds that were passed into this collection.
-        seed_index = self.input_keys.index(ROOT_COLLECTION_ADDRESS)
-        seed_data = data[seed_index]
-
-        for (foreign_field_path, local_field_path) in dependent_field_mappings[
-            ROOT_COLLECTION_ADDRESS
-        ]:
-            dependent_values = consolidate_query_matches(
-                row=seed_data, target_path=foreign_field_path  # type: ignore
+    @property
+    def input_plan(self) -> NodeInputPlan:
+        """The compiled plan for consolidating upstream rows into this node's inputs, built on first use"""
+        if self._input_plan is None:
+            self._input_plan = NodeInputPlan(
+                self.input_keys,
+                self.incoming_edges_by_collection,
+                self.grouped_fields,
+                self.dependent_identity_fields,
             )
-            grouped_data[local_field_path.string_path] = dependent_values
-        return grouped_data
+        return self._input_plan
 
-    def pre_process_input_data(
-        self, *data: List[Row], group_dependent_fields: bool = False
-    ) -> NodeInput:
+    def consolidate_input_data(self, *data: List[Row]) -> Tuple[NodeInput, NodeInput]:
         """
         Consolidates the outputs of queries from potentially multiple collections whose
-        data is needed as input into the current collection.
+        data is needed as input into the current collection, in a single pass over the data.
 
         Each dict in the input list represents the output of a dependent task.
         These outputs should correspond to the input key order.  Any nested fields are
-        converted into dot-separated paths in the return.
+        converted into dot-separated paths in the return, and duplicate values are removed.
 
          table1: [{x:1, y:A}, {x:2, y:B}], table2: [{x:3},{x:4}], table3: [{z: {a: C}, "y": [4, 5]}]
            where table1.x => self.id,
@@ -263,6 +236,8 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
 
          If there are dependent fields from one collection into another, they are separated out as follows:
          {fidesops_grouped_inputs: [{"organization_id": 1, "project_id": "math}, {"organization_id": 5, "project_id": "science"}]
+
+        :return: The inputs with dependent fields grouped as above, and the inputs with all fields consolidated
         """
         if not len(data) == len(self.input_keys):
             logger.warning(
@@ -272,61 +247,23 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 len(data),
             )
 
-        output: Dict[str, List[Any]] = {FIDESOPS_GROUPED_INPUTS: []}
-
-        (
-            independent_field_mappings,
-            dependent_field_mappings,
-        ) = self.build_incoming_field_path_maps(group_dependent_fields)
-
-        for i, rowset in enumerate(data):
-            collection_address = self.input_keys[i]
+        logger.info(
+            "Consolidating incoming data into %s.", self.traversal_node.node.address
+        )
+        return self.input_plan.consolidate(*data)
 
-            if (
-                group_dependent_fields
-                and self.dependent_identity_fields
-                and collection_address == ROOT_COLLECTION_ADDRESS
-            ):
-                # Skip building data for the root collection if the seed data needs to be combined with other inputs
-                continue
+    def pre_process_input_data(
+        self, *data: List[Row], group_dependent_fields: bool = False
+    ) -> NodeInput:
+        """
+        Consolidates the outputs of queries from potentially multiple collections whose
+        data is needed as input into the current collection. See `consolidate_input_data`.
 
-            logger.info(
-                "Consolidating incoming data into %s from %s.",
-                self.traversal_node.node.address,
-                collection_address,
-            )
-            for row in rowset:
-                # Consolidate lists of independent field inputs
-                for foreign_field_path, local_field_path in independent_field_mappings[
-                    collection_address
-                ]:
-                    new_values: List = consolidate_query_matches(
-                        row=row, target_path=foreign_field_path
-                    )
-                    if new_values:
-                        append(output, local_field_path.string_path, new_values)
-
-                # Separately group together dependent inputs if applicable
-                if dependent_field_mappings[collection_address]:
-                    grouped_data: Dict[str, Any] = {}
-                    for (
-                        foreign_field_path,
-                        local_field_path,
-                    ) in dependent_field_mappings[collection_address]:
-                        dependent_values: List = consolidate_query_matches(
-                            row=row, target_path=foreign_field_path
-                        )
-                        grouped_data[local_field_path.string_path] = dependent_values
-
-                    if self.dependent_identity_fields:
-                        grouped_data = self._combine_seed_data(
-                            *data,
-                            grouped_data=grouped_data,
-                            dependent_field_mappings=dependent_field_mappings,
-                        )
-
-                    output[FIDESOPS_GROUPED_INPUTS].append(grouped_data)
-        return output
+        :param group_dependent_fields: Whether to group together the inputs of fields that have been
+        specified as dependent upon one another, under `fidesops_grouped_inputs`
+        """
+        grouped, ungrouped = self.consolidate_input_data(*data)
+        return grouped if group_dependent_fields else ungrouped
 
     def update_status(
         self,
@@ -334,6 +271,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         fields_affected: Any,
         action_type: ActionType,
         status: ExecutionLogStatus,
+        profile: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Update status activities"""
         self.resources.write_execution_log(
@@ -342,6 +280,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             action_type,
             status,
             msg,
+            profile,
         )
 
     def log_start(self, action_type: ActionType) -> None:
@@ -387,7 +326,13 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 self.key,
                 Pii(ex),
             )
-            self.update_status(str(ex), [], action_type, ExecutionLogStatus.error)
+            self.update_status(
+                str(ex),
+                [],
+                action_type,
+                ExecutionLogStatus.error,
+                self.timer.profile(self.upstream),
+            )
         else:
             logger.info("Ending %s, %s", self.resources.request.id, self.key)
             self.update_status(
@@ -397,6 +342,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 ),
                 action_type,
                 ExecutionLogStatus.complete,
+                self.timer.profile(self.upstream),
             )
 
     def post_process_input_data(
@@ -417,8 +363,9 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         {FieldPath("owner", "phone"): None, FieldPath("owner", "identifier"): [1234, 5678, 9102]}
         """
         out: FieldPathNodeInput = {}
+        field_paths: Dict[str, FieldPath] = self.input_plan.field_paths
         for key, values in pre_processed_inputs.items():
-            path: FieldPath = FieldPath.parse(key)
+            path: FieldPath = field_paths.get(key) or FieldPath.parse(key)
             field: Optional[Field] = self.traversal_node.node.collection.field(path)
             if (
                 field
@@ -429,11 +376,13 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                     # All data will be returned
                     out[path] = None
                 else:
-                    # Default behavior - we will filter values to match those in filtered
-                    cast_values = [
-                        field.cast(v) for v in values
-                    ]  # Cast values to expected type where possible
-                    filtered = list(filter(lambda x: x is not None, cast_values))
+                    # Default behavior - we will filter values to match those in filtered.
+                    # Cast values to expected type where possible
+                    filtered = [
+                        cast_value
+                        for cast_value in map(field.cast, values)
+                        if cast_value is not None
+                    ]
                     if filtered:
                         out[path] = filtered
         return out
@@ -449,33 +398,36 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
 
         Caches the data in TWO separate formats: 1) erasure format, *replaces* unmatched array elements with placeholder
         text, and 2) access request format, which *removes* unmatched array elements altogether.  If no data was filtered
-        out, both cached versions will be the same.
+        out, both cached versions will be the same.  Both formats are derived from the retrieved rows without
+        copying them, so only the arrays that are filtered are duplicated.
         """
-        post_processed_node_input_data: FieldPathNodeInput = (
-            self.post_process_input_data(formatted_input_data)
-        )
-
-        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
-        placeholder_output: List[Row] = copy.deepcopy(output)
-        for row in placeholder_output:
-            filter_element_match(
-                row, query_paths=post_processed_node_input_data, delete_elements=False
+        with self.timer.stage(POST_PROCESS):
+            post_processed_node_input_data: FieldPathNodeInput = (
+                self.post_process_input_data(formatted_input_data)
             )
-        self.resources.cache_results_with_placeholders(
-            f"access_request__{self.key}", placeholder_output
-        )
 
-        # For access request results, cache results with non-matching array elements *removed*
-        for row in output:
             logger.info(
-                "Filtering row in %s for matching array elements.",
+                "Filtering rows in %s for matching array elements.",
                 self.traversal_node.node.address,
             )
-            filter_element_match(row, post_processed_node_input_data)
-        self.resources.cache_object(f"access_request__{self.key}", output)
+            matched_rows = ElementMatchedRows.build(
+                output, post_processed_node_input_data
+            )
+            # For erasures: cache results with non-matching array elements *replaced* with placeholder text
+            placeholder_output: List[Row] = matched_rows.erasure_rows()
+        with self.timer.stage(CACHE):
+            self.resources.cache_results_with_placeholders(
+                f"access_request__{self.key}", placeholder_output
+            )
+
+        # For access request results, cache results with non-matching array elements *removed*
+        with self.timer.stage(POST_PROCESS):
+            filtered_output: List[Row] = matched_rows.access_rows()
+        with self.timer.stage(CACHE):
+            self.resources.cache_object(f"access_request__{self.key}", filtered_output)
 
         # Return filtered rows with non-matched array data removed.
-        return output
+        return filtered_output
 
     def skip_if_disabled(self) -> None:
         """Skip execution for the given collection if it is attached to a disabled ConnectionConfig."""
@@ -489,17 +441,22 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
     @retry(action_type=ActionType.access, default_return=[])
     def access_request(self, *inputs: List[Row]) -> List[Row]:
         """Run an access request on a single node."""
-        formatted_input_data: NodeInput = self.pre_process_input_data(
-            *inputs, group_dependent_fields=True
-        )
-        output: List[Row] = self.connector.retrieve_data(
-            self.traversal_node,
-            self.resources.policy,
-            self.resources.request,
-            formatted_input_data,
-        )
+        with self.timer.stage(PRE_PROCESS):
+            formatted_input_data: NodeInput
+            ungrouped_input_data: NodeInput
+            (
+                formatted_input_data,
+                ungrouped_input_data,
+            ) = self.consolidate_input_data(*inputs)
+        with self.timer.stage(CONNECTOR):
+            output: List[Row] = self.connector.retrieve_data(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                formatted_input_data,
+            )
         filtered_output: List[Row] = self.access_results_post_processing(
-            self.pre_process_input_data(*inputs, group_dependent_fields=False), output
+            ungrouped_input_data, output
         )
         self.log_end(ActionType.access)
         return filtered_output
@@ -536,21 +493,24 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             )
             return 0
 
-        formatted_input_data: NodeInput = self.pre_process_input_data(
-            *inputs, group_dependent_fields=True
-        )
+        with self.timer.stage(PRE_PROCESS):
+            formatted_input_data: NodeInput = self.pre_process_input_data(
+                *inputs, group_dependent_fields=True
+            )
 
-        output = self.connector.mask_data(
-            self.traversal_node,
-            self.resources.policy,
-            self.resources.request,
-            retrieved_data,
-            formatted_input_data,
-        )
+        with self.timer.stage(CONNECTOR):
+            output = self.connector.mask_data(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                retrieved_data,
+                formatted_input_data,
+            )
+        with self.timer.stage(CACHE):
+            self.resources.cache_erasure(
+                f"{self.key}", output
+            )  # Cache that the erasure was performed in case we need to restart
         self.log_end(ActionType.erasure)
-        self.resources.cache_erasure(
-            f"{self.key}", output
-        )  # Cache that the erasure was performed in case we need to restart
         return output
 
 
@@ -590,6 +550,65 @@ def update_mapping_from_cache(
         )
 
 
+def run_after(result: Any, *_upstream: Any) -> Any:
+    """Return the result of a task unchanged.
+
+    Used to make a task in the dask graph wait on additional upstream keys, (collections or
+    datasets this node must run `after`), without passing their output in as inputs."""
+    return result
+
+
+def add_after_dependencies(
+    dsk: Dict[CollectionAddress, Tuple[Any, ...]],
+    env: Dict[CollectionAddress, GraphTask],
+) -> None:
+    """Make each task in the `dsk` dictionary wait for any tasks it has been configured to run `after`.
+
+    Data dependencies are already encoded in the dask graph as task inputs, but collection and dataset
+    `after` constraints are not, so without this, nodes running concurrently could run out of order.
+    """
+    for address, task in env.items():
+        collection_after: Set[
+            CollectionAddress
+        ] = task.traversal_node.node.collection.after
+        dataset_after: Set[str] = task.traversal_node.node.dataset.after
+        upstream: List[CollectionAddress] = sorted(
+            other
+            for other in env
+            if other != address
+            and (other in collection_after or other.dataset in dataset_after)
+        )
+        if upstream:
+            dsk[address] = (run_after, dsk[address], *upstream)
+
+
+def set_upstream_dependencies(
+    dsk: Dict[CollectionAddress, Tuple[Any, ...]],
+    env: Dict[CollectionAddress, GraphTask],
+) -> None:
+    """Record on each task the collections it has to wait for in the final `dsk` dictionary, so they
+    can be stored with its timings and used to find the critical path through the graph."""
+    for address, task in env.items():
+        task.upstream = sorted(
+            dependency
+            for dependency in get_dependencies(dsk, address)
+            if dependency != ROOT_COLLECTION_ADDRESS
+        )
+
+
+def execute_graph(dsk: Dict[CollectionAddress, Tuple[Any, ...]]) -> Any:
+    """Run the dask graph through to the terminator node.
+
+    Any tasks whose upstream dependencies have completed are run concurrently on a pool of
+    `task_max_workers` threads, so the time taken approaches the longest path through the graph
+    rather than the sum of all tasks. Running nodes are additionally capped at
+    `task_max_workers_per_connection` per ConnectionConfig.
+    """
+    with ThreadPoolExecutor(max_workers=config.execution.task_max_workers) as pool:
+        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS, pool=pool))
+        return v.compute()
+
+
 def start_function(seed: List[Dict[str, Any]]) -> Callable[[], List[Dict[str, Any]]]:
     """Return a function for collections with no upstream dependencies, that just start
     with seed data.
@@ -611,7 +630,7 @@ async def run_access_request(
     session: Session,
 ) -> Dict[str, List[Row]]:
     """Run the access request"""
-    traversal: Traversal = Traversal(graph, identity)
+    traversal: Traversal = get_traversal(graph, identity)
     with TaskResources(
         privacy_request, policy, connection_configs, session
     ) as resources:
@@ -640,7 +659,9 @@ async def run_access_request(
         }
         dsk[ROOT_COLLECTION_ADDRESS] = (start_function([traversal.seed_data]),)
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *end_nodes)
+        add_after_dependencies(dsk, env)
         update_mapping_from_cache(dsk, resources, start_function)
+        set_upstream_dependencies(dsk, env)
 
         await fideslog_graph_rerun(
             prepare_rerun_graph_analytics_event(
@@ -649,8 +670,7 @@ async def run_access_request(
         )
         privacy_request.cache_access_graph(format_graph_for_caching(env, end_nodes))
 
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-        return v.compute()
+        return execute_graph(dsk)
 
 
 def get_cached_data_for_erasures(
@@ -663,7 +683,8 @@ def get_cached_data_for_erasures(
     """
     cache = get_cache()
     value_dict = cache.get_encoded_objects_by_prefix(
-        f"PLACEHOLDER_RESULTS__{privacy_request_id}"
+        f"PLACEHOLDER_RESULTS__{privacy_request_id}",
+        index=get_privacy_request_cache_index(privacy_request_id),
     )
     return {k.split("__")[-1]: v for k, v in value_dict.items()}
 
@@ -696,7 +717,7 @@ async def run_erasure(  # pylint: disable = too-many-arguments, too-many-locals
     session: Session,
 ) -> Dict[str, int]:
     """Run an erasure request"""
-    traversal: Traversal = Traversal(graph, identity)
+    traversal: Traversal = get_traversal(graph, identity)
     with TaskResources(
         privacy_request, policy, connection_configs, session
     ) as resources:
@@ -739,15 +760,15 @@ async def run_erasure(  # pylint: disable = too-many-arguments, too-many-locals
         }
         # terminator function waits for all keys
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *env.keys())
+        add_after_dependencies(dsk, env)
         update_erasure_mapping_from_cache(dsk, resources, start_function)
+        set_upstream_dependencies(dsk, env)
         await fideslog_graph_rerun(
             prepare_rerun_graph_analytics_event(
                 privacy_request, env, end_nodes, resources, ActionType.erasure
             )
         )
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-
-        update_cts: Tuple[int, ...] = v.compute()
+        update_cts: Tuple[int, ...] = execute_graph(dsk)
         # we combine the output of the termination function with the input keys to provide
         # a map of {collection_name: records_updated}:
         erasure_update_map: Dict[str, int] = dict(
@@ -780,18 +801,17 @@ def build_affected_field_logs(
         if not rule_categories:
             continue
 
-        collection_categories: Dict[
-            str, List[FieldPath]
-        ] = node.collection.field_paths_by_category  # type: ignore
         for rule_cat in rule_categories:
-            for collection_cat, field_paths in collection_categories.items():
-                if collection_cat.startswith(rule_cat):
-                    targeted_field_paths.update(
-                        {
-                            node.address.field_address(field_path): collection_cat
-                            for field_path in field_paths
-                        }
-                    )
+            for (
+                collection_cat,
+                field_paths,
+            ) in node.collection.field_paths_by_category_prefix(rule_cat).items():
+                targeted_field_paths.update(
+                    {
+                        node.address.field_address(field_path): collection_cat
+                        for field_path in field_paths
+                    }
+                )
 
     ret: List[Dict[str, Any]] = []
     for field_address, data_categories in targeted_field_paths.items():
@@ -0,0 +1,198 @@
+import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from fidesops.ops.graph.config import (
+    ROOT_COLLECTION_ADDRESS,
+    CollectionAddress,
+    FieldPath,
+)
+from fidesops.ops.graph.graph import Edge
+from fidesops.ops.util.collection_util import NodeInput, Row
+from fidesops.ops.util.saas_util import FIDESOPS_GROUPED_INPUTS
+
+logger = logging.getLogger(__name__)
+
+
+class _PathNode:
+    """A level of the foreign field paths read from an upstream collection.
+
+    `targets` are the indexes of the local fields fed by a path ending at this level, and `subtree_targets`
+    those fed by any path through this level, which all receive a scalar found here.
+    """
+
+    __slots__ = ("children", "targets", "subtree_targets")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _PathNode] = {}
+        self.targets: List[int] = []
+        self.subtree_targets: List[int] = []
+
+    def finalize(self) -> List[int]:
+        """Compute `subtree_targets` for this level and every level below it"""
+        self.subtree_targets = list(self.targets)
+        for child in self.children.values():
+            self.subtree_targets.extend(child.finalize())
+        return self.subtree_targets
+
+    def collect(self, value: Any, found: List[List[Any]]) -> None:
+        """Add the values along the paths through this level to `found`, indexed by target.
+
+        Equivalent to calling `consolidate_query_matches` on `value` for each path: arrays are flattened,
+        dicts are descended into along the paths, and scalars are matched to every path through this level.
+        """
+        if isinstance(value, list):
+            for elem in value:
+                self.collect(elem, found)
+        elif isinstance(value, dict):
+            for key, child in self.children.items():
+                if key in value:
+                    child.collect(value[key], found)
+        else:
+            for target in self.subtree_targets:
+                found[target].append(value)
+
+
+class _UniqueValues:
+    """Values in the order they were first added, without duplicates"""
+
+    __slots__ = ("values", "_seen")
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self._seen: Set[Any] = set()
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for value in values:
+            try:
+                if value in self._seen:
+                    continue
+                self._seen.add(value)
+            except TypeError:  # Unhashable values are kept as is
+                pass
+            self.values.append(value)
+
+
+class _CollectionInputs(NamedTuple):
+    """The paths read from an upstream collection, and the local fields they feed, by target index"""
+
+    tree: _PathNode
+    local_paths: List[str]
+    grouped: List[bool]
+
+    def collect(self, row: Any) -> List[List[Any]]:
+        """Return the values found in the row for each target"""
+        found: List[List[Any]] = [[] for _ in self.local_paths]
+        self.tree.collect(row, found)
+        return found
+
+
+class NodeInputPlan:
+    """
+    Consolidates the rows of the upstream collections of a node into its inputs.
+
+    The foreign field paths read from each upstream collection are compiled once into a tree, so each
+    upstream row is traversed a single time to extract the values for all of its edges. Both views of the
+    inputs are built from that traversal:
+
+    - grouped: values for fields that must stay linked together - the node's `grouped_inputs` - are kept per
+      upstream row under `fidesops_grouped_inputs`, and all other values are consolidated by local field.
+    - ungrouped: all values are consolidated by local field, and `fidesops_grouped_inputs` is empty.
+
+    Consolidated values are deduplicated, keeping the order they were first found in.
+    """
+
+    def __init__(
+        self,
+        input_keys: List[CollectionAddress],
+        incoming_edges_by_collection: Dict[CollectionAddress, List[Edge]],
+        grouped_fields: Set[str],
+        dependent_identity_fields: bool,
+    ):
+        self.input_keys = input_keys
+        self.dependent_identity_fields = dependent_identity_fields
+        self.inputs: Dict[CollectionAddress, _CollectionInputs] = {}
+        # local FieldPaths by string path, so they don't need to be parsed from the inputs again
+        self.field_paths: Dict[str, FieldPath] = {}
+
+        for collection_address, edges in incoming_edges_by_collection.items():
+            inputs = self.inputs[collection_address] = _CollectionInputs(
+                _PathNode(), [], []
+            )
+            for edge in edges:
+                node: _PathNode = inputs.tree
+                for level in edge.f1.field_path.levels:
+                    node = node.children.setdefault(level, _PathNode())
+                node.targets.append(len(inputs.local_paths))
+
+                local_path: str = edge.f2.field_path.string_path
+                inputs.local_paths.append(local_path)
+                inputs.grouped.append(local_path in grouped_fields)
+                self.field_paths[local_path] = edge.f2.field_path
+            inputs.tree.finalize()
+
+    def _seed_data(self, *data: List[Row]) -> Dict[str, List[Any]]:
+        """Return the identity values for the dependent inputs fed by the root collection"""
+        inputs: _CollectionInputs = self.inputs[ROOT_COLLECTION_ADDRESS]
+        found: List[List[Any]] = inputs.collect(
+            data[self.input_keys.index(ROOT_COLLECTION_ADDRESS)]
+        )
+        return {
+            local_path: found[target]
+            for target, local_path in enumerate(inputs.local_paths)
+            if inputs.grouped[target]
+        }
+
+    def consolidate(  # pylint: disable=R0914
+        self, *data: List[Row]
+    ) -> Tuple[NodeInput, NodeInput]:
+        """Return the grouped and ungrouped inputs for the given upstream rowsets, which are in input key order"""
+        grouped_values: Dict[str, _UniqueValues] = {}
+        ungrouped_values: Dict[str, _UniqueValues] = {}
+        grouped_rows: List[Dict[str, Any]] = []
+        # Identity values added to every group of dependent inputs, found on first use
+        seed_data: Optional[Dict[str, List[Any]]] = None
+
+        for collection_address, rowset in zip(self.input_keys, data):
+            inputs: _CollectionInputs = self.inputs[collection_address]
+            # Seed data that needs to be combined with other inputs is only added to their groups
+            skip_grouped: bool = (
+                self.dependent_identity_fields
+                and collection_address == ROOT_COLLECTION_ADDRESS
+            )
+            has_dependent_targets: bool = not skip_grouped and any(inputs.grouped)
+
+            logger.info("Consolidating incoming data from %s.", collection_address)
+            for row in rowset:
+                found: List[List[Any]] = inputs.collect(row)
+                for target, values in enumerate(found):
+                    if not values:
+                        continue
+                    local_path: str = inputs.local_paths[target]
+                    ungrouped_values.setdefault(local_path, _UniqueValues()).extend(
+                        values
+                    )
+                    if not skip_grouped and not inputs.grouped[target]:
+                        grouped_values.setdefault(local_path, _UniqueValues()).extend(
+                            values
+                        )
+
+                if has_dependent_targets:
+                    grouped_data: Dict[str, Any] = {
+                        local_path: found[target]
+                        for target, local_path in enumerate(inputs.local_paths)
+                        if inputs.grouped[target]
+                    }
+                    if self.dependent_identity_fields:
+                        if seed_data is None:
+                            seed_data = self._seed_data(*data)
+                        for local_path, values in seed_data.items():
+                            grouped_data[local_path] = list(values)
+                    grouped_rows.append(grouped_data)
+
+        grouped: NodeInput = {FIDESOPS_GROUPED_INPUTS: grouped_rows}
+        grouped.update({key: unique.values for key, unique in grouped_values.items()})
+        ungrouped: NodeInput = {FIDESOPS_GROUPED_INPUTS: []}
+        ungrouped.update(
+            {key: unique.values for key, unique in ungrouped_values.items()}
+        )
+        return grouped, ungrouped
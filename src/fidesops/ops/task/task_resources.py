@@ -1,9 +1,12 @@
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from fidesops.ops.common_exceptions import ConnectorNotFoundException
+from fidesops.ops.core.config import config
 from fidesops.ops.graph.config import CollectionAddress
 from fidesops.ops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.ops.models.policy import ActionType, Policy
@@ -30,6 +33,7 @@ from fidesops.ops.service.connectors import (
 )
 from fidesops.ops.util.cache import get_cache
 from fidesops.ops.util.collection_util import Row
+from fidesops.ops.util.encryption.secrets_util import MaskingSecretStore, SecretsUtil
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +43,17 @@ class Connections:
 
     def __init__(self) -> None:
         self.connections: Dict[str, BaseConnector] = {}
+        self._lock = threading.Lock()
 
     def get_connector(self, connection_config: ConnectionConfig) -> BaseConnector:
         """Return the connector corresponding to this config. Will return the existing
         connector or create one if it does not yet exist."""
         key = connection_config.key
-        if key not in self.connections:
-            connector = Connections.build_connector(connection_config)
-            self.connections[key] = connector
-        return self.connections[key]
+        with self._lock:
+            if key not in self.connections:
+                connector = Connections.build_connector(connection_config)
+                self.connections[key] = connector
+            return self.connections[key]
 
     @staticmethod
     def build_connector(  # pylint: disable=R0911
@@ -88,12 +94,23 @@ class Connections:
             connector.close()
 
 
-class TaskResources:
+def max_connection_workers(connection_config: ConnectionConfig) -> int:
+    """The number of graph nodes that may run against the connection at the same time.
+
+    A SaaSConnector holds the state of the request it's making, so SaaS connections
+    run one graph node at a time."""
+    if connection_config.connection_type == ConnectionType.saas:
+        return 1
+    return config.execution.task_max_workers_per_connection
+
+
+class TaskResources:  # pylint: disable=too-many-instance-attributes
     """Shared information and environment for all nodes of a given task.
     This includes
      - the privacy request
      - the policy
      - redis connection
+     - the masking secrets of the privacy request
      -  configurations to any outside resources the task will require to run
     """
 
@@ -107,12 +124,30 @@ class TaskResources:
         self.request = request
         self.policy = policy
         self.cache = get_cache()
+        # Masking strategies read the privacy request's secrets from here while it's running
+        self.masking_secrets = MaskingSecretStore(request.id)
+        SecretsUtil.register_secret_store(self.masking_secrets)
         # tbd populate connection configurations.
         self.connection_configs: Dict[str, ConnectionConfig] = {
             c.key: c for c in connection_configs
         }
         self.connections = Connections()
         self.session = session
+        # Caps the number of graph nodes that may run against the same connection at once
+        self.connection_semaphores: Dict[str, threading.BoundedSemaphore] = {
+            key: threading.BoundedSemaphore(max_connection_workers(connection_config))
+            for key, connection_config in self.connection_configs.items()
+        }
+        # Sessions are not thread-safe, so when graph nodes run concurrently each worker
+        # thread writes its execution logs through its own session
+        self._thread_local = threading.local()
+        self._thread_sessions: List[Session] = []
+        self._thread_sessions_lock = threading.Lock()
+        if config.execution.task_max_workers > 1:
+            # Load the policy's rules up front so worker threads don't lazy-load them
+            # through the shared session
+            for rule in self.policy.rules:
+                rule.targets  # pylint: disable=pointless-statement
 
     def __enter__(self) -> "TaskResources":
         """Support 'with' usage for closing resources"""
@@ -126,17 +161,21 @@ class TaskResources:
         """Cache raw results from node. Object will be
         stored in redis under 'PLACEHOLDER_RESULTS__PRIVACY_REQUEST_ID__TYPE__COLLECTION_ADDRESS"""
         self.cache.set_encoded_object(
-            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}", value
+            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}",
+            value,
+            index=self.request.cache_index,
         )
 
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be stored in redis under 'REQUEST_ID__TYPE__ADDRESS'"""
-        self.cache.set_encoded_object(f"{self.request.id}__{key}", value)
+        self.cache.set_encoded_object(
+            f"{self.request.id}__{key}", value, index=self.request.cache_index
+        )
 
     def get_all_cached_objects(self) -> Dict[str, Optional[List[Row]]]:
         """Retrieve the access results of all steps (cache_object)"""
         value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__access_request"
+            f"{self.request.id}__access_request", index=self.request.cache_index
         )
         # extract request id to return a map of address:value
         return {k.split("__")[-1]: v for k, v in value_dict.items()}
@@ -146,13 +185,15 @@ class TaskResources:
         'REQUEST_ID__erasure_request__ADDRESS
         '"""
         self.cache.set_encoded_object(
-            f"{self.request.id}__erasure_request__{key}", value
+            f"{self.request.id}__erasure_request__{key}",
+            value,
+            index=self.request.cache_index,
         )
 
     def get_all_cached_erasures(self) -> Dict[str, int]:
         """Retrieve which collections have been masked and their row counts(cache_erasure)"""
         value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__erasure_request"
+            f"{self.request.id}__erasure_request", index=self.request.cache_index
         )
         # extract request id to return a map of address:value
         return {k.split("__")[-1]: v for k, v in value_dict.items()}  # type: ignore
@@ -164,9 +205,10 @@ class TaskResources:
         action_type: ActionType,
         status: ExecutionLogStatus,
         message: str = None,
+        profile: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """Store in application db. Return the created or written-to id field value."""
-        db = self.session
+        db = self.get_session()
 
         ExecutionLog.create(
             db=db,
@@ -178,9 +220,35 @@ class TaskResources:
                 "status": status,
                 "privacy_request_id": self.request.id,
                 "message": message,
+                "profile": profile,
             },
         )
 
+    def get_session(self) -> Session:
+        """Return the session to use from the current thread.
+
+        If graph nodes are run one at a time, this is the session this TaskResources
+        was created with. Otherwise, each worker thread gets its own session bound to the
+        same engine."""
+        if config.execution.task_max_workers <= 1:
+            return self.session
+
+        session: Optional[Session] = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = sessionmaker(bind=self.session.get_bind())()
+            self._thread_local.session = session
+            with self._thread_sessions_lock:
+                self._thread_sessions.append(session)
+        return session
+
+    def connection_slot(self, key: FidesOpsKey) -> ContextManager:
+        """Context manager that blocks until fewer than `task_max_workers_per_connection`
+        graph nodes are running against the given ConnectionConfig."""
+        semaphore: Optional[
+            threading.BoundedSemaphore
+        ] = self.connection_semaphores.get(key)
+        return semaphore if semaphore else nullcontext()
+
     def get_connector(self, key: FidesOpsKey) -> Any:
         """Create or return the client corresponding to the given ConnectionConfig key"""
         if key in self.connection_configs:
@@ -190,4 +258,7 @@ class TaskResources:
     def close(self) -> None:
         """Close any held resources"""
         logger.debug("Closing all task resources for %s", self.request.id)
+        SecretsUtil.unregister_secret_store(self.masking_secrets)
         self.connections.close()
+        for session in self._thread_sessions:
+            session.close()
@@ -37,6 +37,13 @@ def _create_celery(config_path: str = config.execution.celery_config_path) -> Ce
         # Defaults for the celery config
         "broker_url": config.redis.connection_url,
         "result_backend": config.redis.connection_url,
+        # Share the Redis connection pool limits and health checks of the application cache
+        "broker_transport_options": {
+            "max_connections": config.redis.max_connections,
+            "health_check_interval": config.redis.health_check_interval,
+        },
+        "redis_max_connections": config.redis.max_connections,
+        "redis_backend_health_check_interval": config.redis.health_check_interval,
         # Fidesops requires this to route emails to separate queues
         "task_create_missing_queues": True,
     }
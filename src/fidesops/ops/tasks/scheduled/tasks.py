@@ -1,19 +1,35 @@
 import logging
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 from apscheduler.jobstores.base import JobLookupError
 from fideslib.db.session import get_db_session
 
 from fidesops.ops.core.config import config
+from fidesops.ops.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
 from fidesops.ops.models.storage import StorageConfig
 from fidesops.ops.schemas.shared_schemas import FidesOpsKey
 from fidesops.ops.schemas.storage.storage import StorageDetails, StorageType
 from fidesops.ops.service.privacy_request.onetrust_service import OneTrustService
 from fidesops.ops.tasks.scheduled.scheduler import scheduler
+from fidesops.ops.util.cache import purge_privacy_request_caches
 
 logger = logging.getLogger(__name__)
 
 ONETRUST_INTAKE_TASK = "onetrust_intake"
+CACHE_PURGE_TASK = "cache_purge"
+
+# Nothing more is cached for privacy requests once they reach these statuses
+PURGEABLE_PRIVACY_REQUEST_STATUSES = [
+    PrivacyRequestStatus.complete,
+    PrivacyRequestStatus.canceled,
+    PrivacyRequestStatus.denied,
+]
+# Each purge also covers requests that finished shortly before the previous purge started,
+# in case their status was committed after that purge looked them up
+CACHE_PURGE_WINDOW_MARGIN = timedelta(minutes=5)
+
+_last_cache_purge: Optional[datetime] = None
 
 
 def initiate_scheduled_request_intake() -> None:
@@ -52,3 +68,61 @@ def initiate_scheduled_request_intake() -> None:
 def _intake_onetrust_requests(config_key: FidesOpsKey) -> None:
     """Begins onetrust request intake"""
     OneTrustService.intake_onetrust_requests(config_key)
+
+
+def initiate_scheduled_cache_purge() -> None:
+    """Initiates scheduler to periodically purge the cache of finished privacy requests"""
+    interval: int = config.redis.cache_purge_interval_seconds
+    if interval > 0:
+        logger.info("Initiating cache purge every %s seconds.", interval)
+        scheduler.add_job(
+            func=_purge_privacy_request_caches,
+            id=CACHE_PURGE_TASK,
+            # Skip any purges missed while a previous purge was running
+            coalesce=True,
+            replace_existing=True,
+            trigger="interval",
+            seconds=interval,
+        )
+    else:
+        try:
+            scheduler.remove_job(job_id=CACHE_PURGE_TASK)
+        except JobLookupError:
+            pass
+
+
+def _purge_privacy_request_caches() -> None:
+    """Deletes everything cached for privacy requests that finished since the previous purge.
+
+    The first purge looks back over the cache TTL, since anything cached for requests that
+    finished before then has already expired."""
+    global _last_cache_purge  # pylint: disable=W0603
+    started: datetime = datetime.utcnow()
+    finished_since: datetime = started - timedelta(
+        seconds=config.redis.default_ttl_seconds
+    )
+    if _last_cache_purge is not None:
+        finished_since = max(
+            finished_since, _last_cache_purge - CACHE_PURGE_WINDOW_MARGIN
+        )
+
+    SessionLocal = get_db_session(config)
+    db = SessionLocal()
+    try:
+        privacy_request_ids: List[str] = [
+            privacy_request_id
+            for (privacy_request_id,) in db.query(PrivacyRequest.id).filter(
+                PrivacyRequest.status.in_(PURGEABLE_PRIVACY_REQUEST_STATUSES),
+                PrivacyRequest.updated_at >= finished_since,
+            )
+        ]
+    finally:
+        db.close()
+
+    deleted: int = purge_privacy_request_caches(privacy_request_ids)
+    _last_cache_purge = started
+    logger.info(
+        "Purged %s cached keys for %s finished privacy requests.",
+        deleted,
+        len(privacy_request_ids),
+    )
@@ -1,10 +1,14 @@
 import base64
 import logging
 import pickle
-from typing import Any, Dict, List, Optional, Union
+import zlib
+from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
-from redis import Redis
+from redis import BlockingConnectionPool, Redis, SSLConnection
 from redis.client import Script  # type: ignore
+from redis.exceptions import NoScriptError, RedisError
 
 from fidesops.ops import common_exceptions
 from fidesops.ops.core.config import config
@@ -19,6 +23,71 @@ RedisValue = Union[bytes, float, int, str]
 
 _connection = None
 
+# Added to every index on creation, so an index exists even before any keys are added to it
+INDEX_SENTINEL = "__index__"
+
+
+class ObjectCodec(ABC):
+    """Serializes objects stored with `FidesopsRedis.set_encoded_object`.
+
+    Encoded values are tagged with the codec's version, so values written with an older codec
+    can still be decoded after the default changes. As the cache connection decodes responses
+    to strings, codecs must produce ASCII-safe output.
+    """
+
+    version: str
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Serialize the object"""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Deserialize an object serialized with `encode`"""
+
+
+class Base64PickleCodec(ObjectCodec):
+    """The original encoding of base64-encoded pickles. Values it writes aren't tagged with a version."""
+
+    version = ""
+
+    def encode(self, obj: Any) -> bytes:
+        return base64.b64encode(pickle.dumps(obj))
+
+    def decode(self, data: bytes) -> Any:
+        return pickle.loads(base64.b64decode(data))
+
+
+class CompressedPickleCodec(ObjectCodec):
+    """Pickles with the highest protocol, compressing pickles larger than `compression_threshold` bytes
+    with zlib before base64-encoding them. Large access results typically compress to a fraction of their size.
+    """
+
+    version = "2"
+    compression_threshold: int = 1024
+    compression_level: int = 1
+
+    def encode(self, obj: Any) -> bytes:
+        data: bytes = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.compression_threshold:
+            return b"z" + base64.b64encode(zlib.compress(data, self.compression_level))
+        return b"p" + base64.b64encode(data)
+
+    def decode(self, data: bytes) -> Any:
+        payload: bytes = base64.b64decode(data[1:])
+        if data[:1] == b"z":
+            payload = zlib.decompress(payload)
+        return pickle.loads(payload)
+
+
+# The separator between the codec version and the encoded value. Base64 never contains it,
+# so untagged values written by Base64PickleCodec can't be mistaken for tagged ones.
+CODEC_VERSION_SEPARATOR = b":"
+CODECS: Dict[str, ObjectCodec] = {
+    codec.version: codec for codec in [Base64PickleCodec(), CompressedPickleCodec()]
+}
+DEFAULT_CODEC: ObjectCodec = CODECS[CompressedPickleCodec.version]
+
 
 class FidesopsRedis(Redis):
     """
@@ -26,16 +95,95 @@ class FidesopsRedis(Redis):
     should never be instantiated on its own.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Adds keys to an index, only if the index has been created, and extends the index's TTL
+        self._add_to_index: Script = self.register_script(
+            "if redis.call('exists', KEYS[1]) == 1 then "
+            "redis.call('sadd', KEYS[1], unpack(ARGV, 2)) "
+            "redis.call('expire', KEYS[1], ARGV[1]) "
+            "end"
+        )
+
     def set_with_autoexpire(
-        self, key: str, value: RedisValue, expire_time: int = None
+        self,
+        key: str,
+        value: RedisValue,
+        expire_time: int = None,
+        index: Optional[str] = None,
     ) -> Optional[bool]:
-        """Call the connection class' default set method with ex= our default TTL"""
+        """Call the connection class' default set method with ex= our default TTL.
+
+        If an index is given, the key is added to it in the same round trip."""
+        if not expire_time:
+            expire_time = config.redis.default_ttl_seconds
+        if index is None:
+            return self.set(key, value, ex=expire_time)
+        return self.set_many_with_autoexpire({key: value}, expire_time, index)[0]
+
+    def set_many_with_autoexpire(
+        self,
+        mapping: Dict[str, RedisValue],
+        expire_time: int = None,
+        index: Optional[str] = None,
+    ) -> List[Optional[bool]]:
+        """Set each of the values with ex= our default TTL in a single round trip, adding
+        the keys to the index if one is given"""
         if not expire_time:
             expire_time = config.redis.default_ttl_seconds
-        return self.set(key, value, ex=expire_time)
+        pipe = self.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=expire_time)
+        if index is None or not mapping:
+            return pipe.execute()
+
+        index_args: List[Any] = [
+            max(expire_time, config.redis.default_ttl_seconds),
+            *mapping,
+        ]
+        # Calling the script on the pipeline would check it's loaded with a blocking SCRIPT EXISTS
+        # first, so it's called by its SHA and only loaded if the server doesn't have it
+        pipe.evalsha(self._add_to_index.sha, 1, index, *index_args)
+        results: List[Any] = pipe.execute(raise_on_error=False)
+        if isinstance(results[-1], NoScriptError):
+            results[-1] = self._add_to_index(keys=[index], args=index_args)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results[: len(mapping)]
+
+    def create_index(self, index: str) -> None:
+        """Start an index of keys, such as the keys cached for a privacy request.
+
+        Keys are only added to indexes that have been created, so that an index is known to hold every
+        key cached under it. Lookups against an index that doesn't exist fall back to scanning the keyspace.
+        """
+        pipe = self.pipeline(transaction=False)
+        pipe.sadd(index, INDEX_SENTINEL)
+        pipe.expire(index, config.redis.default_ttl_seconds)
+        pipe.execute()
+
+    def get_indexed_keys(self, index: str) -> Optional[Set[str]]:
+        """Return the keys added to the index, or None if the index doesn't exist.
+        Keys that have since expired or been deleted may still be included."""
+        keys: Set[str] = self.smembers(index)
+        if not keys:
+            return None
+        keys.discard(INDEX_SENTINEL)
+        return keys
+
+    def get_keys_by_prefix(
+        self, prefix: str, chunk_size: int = 1000, index: Optional[str] = None
+    ) -> List[str]:
+        """Retrieve all keys that match a given prefix.
+
+        If an index is given, the keys are looked up in the index rather than by scanning the keyspace."""
+        if index is not None:
+            indexed_keys: Optional[Set[str]] = self.get_indexed_keys(index)
+            if indexed_keys is not None:
+                pattern = f"{prefix}*"
+                return [key for key in indexed_keys if fnmatchcase(key, pattern)]
 
-    def get_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> List[str]:
-        """Retrieve all keys that match a given prefix."""
         cursor: Any = "0"
         out = []
         while cursor != 0:
@@ -45,78 +193,139 @@ class FidesopsRedis(Redis):
             out.extend(keys)
         return out
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
+    def delete_keys(self, keys: Iterable[str], chunk_size: int = 1000) -> int:
+        """Delete the keys in batches of `chunk_size`, returning how many were deleted.
+
+        Keys are unlinked rather than deleted, so Redis reclaims the memory of large values in the background."""
+        deleted = 0
+        batch: List[str] = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) == chunk_size:
+                deleted += self.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += self.unlink(*batch)
+        return deleted
+
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> int:
+        """Delete all keys starting with a given prefix, scanning the keyspace incrementally
+        so Redis isn't blocked for the whole scan"""
+        return self.delete_keys(
+            self.scan_iter(match=f"{prefix}*", count=chunk_size), chunk_size
         )
-        s()
 
     def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
         dictionary. Note that if a key does not exist in redis it will be returned as None"""
+        if not keys:
+            return {}
         values = self.mget(keys)
         return {x[0]: x[1] for x in zip(keys, values)}
 
-    def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
+    def set_encoded_object(
+        self, key: str, obj: Any, index: Optional[str] = None
+    ) -> Optional[bool]:
         """Set an object in redis in an encoded form. This object should be retrieved via
         get_objects_by_prefix or processed with decode_obj."""
-        return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
+        return self.set_with_autoexpire(
+            f"EN_{key}", FidesopsRedis.encode_obj(obj), index=index
+        )
 
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
         val = super().get(key)
         return self.decode_obj(val) if val else None
 
-    def get_encoded_objects_by_prefix(self, prefix: str) -> Dict[str, Optional[Any]]:
+    def get_encoded_objects_by_prefix(
+        self, prefix: str, index: Optional[str] = None
+    ) -> Dict[str, Optional[Any]]:
         """Return all objects stored under a given prefix. This method
         assumes these objects have been stored encoded using set_object"""
-        keys = self.get_keys_by_prefix(f"EN_{prefix}")
+        keys = self.get_keys_by_prefix(f"EN_{prefix}", index=index)
         encoded_object_dict = self.get_values(keys)
         return {
             key: FidesopsRedis.decode_obj(value)
             for key, value in encoded_object_dict.items()
+            # Skip keys that have expired or been deleted since they were found
+            if value is not None
         }
 
     @staticmethod
-    def encode_obj(obj: Any) -> bytes:
-        """Encode an object to a base64 string that can be stored in Redis"""
-        return base64.b64encode(pickle.dumps(obj))
+    def encode_obj(obj: Any, codec: ObjectCodec = DEFAULT_CODEC) -> bytes:
+        """Encode an object to a string that can be stored in Redis, tagged with the codec's version"""
+        if not codec.version:
+            return codec.encode(obj)
+        return codec.version.encode() + CODEC_VERSION_SEPARATOR + codec.encode(obj)
 
     @staticmethod
-    def decode_obj(bs: Optional[bytes]) -> Any:
-        """Decode an object from its base64 representation.
+    def decode_obj(bs: Optional[Union[bytes, str]]) -> Any:
+        """Decode an object from its encoded representation, using the codec it was encoded with.
 
         Since Redis may not contain a value
         for a given key it's possible we may try to decode an empty object."""
-        if bs:
-            return pickle.loads(base64.b64decode(bs))
-        return None
+        if not bs:
+            return None
+        data: bytes = bs.encode() if isinstance(bs, str) else bs
+        version, separator, encoded = data.partition(CODEC_VERSION_SEPARATOR)
+        if not separator:
+            return CODECS[Base64PickleCodec.version].decode(data)
+        return CODECS[version.decode()].decode(encoded)
 
 
 def get_cache() -> FidesopsRedis:
-    """Return a singleton connection to our Redis cache"""
+    """Return a singleton connection to our Redis cache.
+
+    Connections are pooled, up to `max_connections`, waiting up to `connection_pool_timeout` seconds
+    for one to be free when they're all in use. The pool checks a connection before reusing it once it
+    has been idle for `health_check_interval` seconds, so the cache is only pinged when the connection
+    is first created rather than on every call."""
     global _connection  # pylint: disable=W0603
     if _connection is None:
-        _connection = FidesopsRedis(
-            charset=config.redis.charset,
+        ssl_kwargs: Dict[str, Any] = (
+            {
+                "connection_class": SSLConnection,
+                "ssl_cert_reqs": config.redis.ssl_cert_reqs,
+            }
+            if config.redis.ssl
+            else {}
+        )
+        connection_pool = BlockingConnectionPool(
+            max_connections=config.redis.max_connections,
+            timeout=config.redis.connection_pool_timeout,
+            encoding=config.redis.charset,
             decode_responses=config.redis.decode_responses,
             host=config.redis.host,
             port=config.redis.port,
             db=config.redis.db_index,
             password=config.redis.password,
-            ssl=config.redis.ssl,
-            ssl_cert_reqs=config.redis.ssl_cert_reqs,
+            health_check_interval=config.redis.health_check_interval,
+            **ssl_kwargs,
         )
+        connection = FidesopsRedis(connection_pool=connection_pool)
+        _ping(connection)
+        _connection = connection
+
+    return _connection
+
 
-    connected = _connection.ping()
+def check_cache_connection() -> None:
+    """Ping the cache, raising a RedisConnectionError if it can't be reached"""
+    _ping(get_cache())
+
+
+def _ping(connection: FidesopsRedis) -> None:
+    try:
+        connected = connection.ping()
+    except RedisError as exc:
+        raise common_exceptions.RedisConnectionError(
+            f"Unable to establish Redis connection: {exc}. Fidesops is unable to accept PrivacyRequsts."
+        ) from exc
     if not connected:
         raise common_exceptions.RedisConnectionError(
             "Unable to establish Redis connection. Fidesops is unable to accept PrivacyRequsts."
         )
 
-    return _connection
-
 
 def get_identity_cache_key(privacy_request_id: str, identity_attribute: str) -> str:
     """Return the key at which to save this PrivacyRequest's identity for the passed in attribute"""
@@ -136,21 +345,68 @@ def get_encryption_cache_key(privacy_request_id: str, encryption_attr: str) -> s
     return f"id-{privacy_request_id}-encryption-{encryption_attr}"
 
 
+def get_masking_secret_cache_prefix(privacy_request_id: str) -> str:
+    """Return the prefix of the keys at which this PrivacyRequest's masking secrets are saved"""
+    return f"id-{privacy_request_id}-masking-secret-"
+
+
 def get_masking_secret_cache_key(
     privacy_request_id: str, masking_strategy: str, secret_type: SecretType
 ) -> str:
     """Return the key at which to save this PrivacyRequest's masking secret attribute"""
-    return (
-        f"id-{privacy_request_id}-masking-secret-{masking_strategy}-{secret_type.value}"
-    )
+    return f"{get_masking_secret_cache_prefix(privacy_request_id)}{masking_strategy}-{secret_type.value}"
+
+
+def get_privacy_request_cache_index(privacy_request_id: str) -> str:
+    """Return the key of the index of everything cached for this PrivacyRequest"""
+    return f"id-{privacy_request_id}-cache-index"
 
 
 def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> List[Any]:
-    """Returns all cache keys related to this privacy request's cached identities"""
+    """Returns all cache keys related to this privacy request.
+
+    These are read from the privacy request's cache index where there is one, falling back to
+    scanning the keyspace for privacy requests cached before indexing."""
+    cache: FidesopsRedis = get_cache()
+    index: str = get_privacy_request_cache_index(privacy_request_id)
+    indexed_keys: Optional[Set[str]] = cache.get_indexed_keys(index)
+    if indexed_keys is not None:
+        # The async task id is cached without a TTL and isn't indexed
+        return [
+            *indexed_keys,
+            index,
+            get_async_task_tracking_cache_key(privacy_request_id),
+        ]
+    return cache.get_keys_by_prefix(
+        f"{privacy_request_id}-"
+    ) + cache.get_keys_by_prefix(f"id-{privacy_request_id}-")
+
+
+def purge_privacy_request_caches(
+    privacy_request_ids: List[str], chunk_size: int = 1000
+) -> int:
+    """Delete everything cached for the given privacy requests, returning how many keys were deleted.
+
+    Only privacy requests with a cache index are purged, so the keyspace is never scanned.
+    Anything cached for privacy requests without an index is left to expire."""
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"{privacy_request_id}-*") + cache.keys(
-        f"id-{privacy_request_id}-*"
-    )
+    deleted = 0
+    for i in range(0, len(privacy_request_ids), chunk_size):
+        ids: List[str] = privacy_request_ids[i : i + chunk_size]
+        pipe = cache.pipeline(transaction=False)
+        for privacy_request_id in ids:
+            pipe.smembers(get_privacy_request_cache_index(privacy_request_id))
+
+        keys: List[str] = []
+        for privacy_request_id, indexed_keys in zip(ids, pipe.execute()):
+            if not indexed_keys:
+                continue
+            indexed_keys.discard(INDEX_SENTINEL)
+            keys.extend(indexed_keys)
+            keys.append(get_privacy_request_cache_index(privacy_request_id))
+            keys.append(get_async_task_tracking_cache_key(privacy_request_id))
+        deleted += cache.delete_keys(keys, chunk_size)
+    return deleted
 
 
 def get_async_task_tracking_cache_key(privacy_request_id: str) -> str:
@@ -52,3 +52,11 @@ def filter_nonempty_values(d: Optional[Dict[Any, Any]]) -> Dict[Any, Any]:
     if d:
         return {e[0]: e[1] for e in d.items() if e[1]}
     return {}
+
+
+def unique_rows(rows: List[Row]) -> List[Row]:
+    """Returns the rows with repeated rows removed, keeping the first of each in order"""
+    unique: Dict[str, Row] = {}
+    for row in rows:
+        unique.setdefault(repr(sorted(row.items())), row)
+    return list(unique.values())
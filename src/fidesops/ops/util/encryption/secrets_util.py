@@ -1,18 +1,73 @@
 import logging
 import secrets
-from typing import Dict, List, Optional, TypeVar
+import threading
+from typing import Any, Dict, List, Optional, TypeVar
 
 from fidesops.ops.schemas.masking.masking_secrets import (
     MaskingSecretCache,
     MaskingSecretMeta,
     SecretType,
 )
-from fidesops.ops.util.cache import get_cache, get_masking_secret_cache_key
+from fidesops.ops.util.cache import (
+    FidesopsRedis,
+    get_cache,
+    get_masking_secret_cache_key,
+    get_masking_secret_cache_prefix,
+    get_privacy_request_cache_index,
+)
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
+class MaskingSecretStore:
+    """
+    In-process store of the masking secrets cached for a privacy request.
+
+    All of the privacy request's secrets are read from the cache together the first time one is needed,
+    so masking each value doesn't make another round trip to the cache.
+    """
+
+    def __init__(self, privacy_request_id: str) -> None:
+        self.privacy_request_id = privacy_request_id
+        self._lock = threading.Lock()
+        self._secrets: Optional[Dict[str, Any]] = None
+
+    def get_secret(
+        self, secret_type: SecretType, masking_secret_meta: MaskingSecretMeta[T]
+    ) -> Optional[T]:
+        """Return the cached secret, loading all of the privacy request's secrets if they haven't been yet"""
+        key: str = get_masking_secret_cache_key(
+            privacy_request_id=self.privacy_request_id,
+            masking_strategy=masking_secret_meta.masking_strategy,
+            secret_type=secret_type,
+        )
+        with self._lock:
+            if self._secrets is None:
+                self._secrets = self._load()
+            if key not in self._secrets:
+                # Secrets cached since the store was loaded
+                self._secrets[key] = get_cache().get_encoded_by_key(key)
+            return self._secrets[key]
+
+    def _load(self) -> Dict[str, Any]:
+        cache: FidesopsRedis = get_cache()
+        keys: List[str] = cache.get_keys_by_prefix(
+            get_masking_secret_cache_prefix(self.privacy_request_id),
+            index=get_privacy_request_cache_index(self.privacy_request_id),
+        )
+        return {
+            key: FidesopsRedis.decode_obj(value)
+            for key, value in cache.get_values(keys).items()
+            if value is not None
+        }
+
+
+# The masking secret stores of the privacy requests being run in this process, keyed by privacy request id
+_masking_secret_stores: Dict[str, MaskingSecretStore] = {}
+_masking_secret_stores_lock = threading.Lock()
+
+
 class SecretsUtil:
     @staticmethod
     def get_or_generate_secret(
@@ -21,8 +76,15 @@ class SecretsUtil:
         masking_secret_meta: MaskingSecretMeta[T],
     ) -> Optional[T]:
         if privacy_request_id is not None:
-            secret = SecretsUtil._get_secret_from_cache(
-                privacy_request_id, secret_type, masking_secret_meta
+            store: Optional[MaskingSecretStore] = _masking_secret_stores.get(
+                privacy_request_id
+            )
+            secret = (
+                store.get_secret(secret_type, masking_secret_meta)
+                if store
+                else SecretsUtil._get_secret_from_cache(
+                    privacy_request_id, secret_type, masking_secret_meta
+                )
             )
             if not secret:
                 logger.warning(
@@ -37,6 +99,19 @@ class SecretsUtil:
             masking_secret_meta.secret_length
         )
 
+    @staticmethod
+    def register_secret_store(store: MaskingSecretStore) -> None:
+        """Read the privacy request's masking secrets from the given store, until it's unregistered"""
+        with _masking_secret_stores_lock:
+            _masking_secret_stores[store.privacy_request_id] = store
+
+    @staticmethod
+    def unregister_secret_store(store: MaskingSecretStore) -> None:
+        """Stop reading the privacy request's masking secrets from the given store"""
+        with _masking_secret_stores_lock:
+            if _masking_secret_stores.get(store.privacy_request_id) is store:
+                del _masking_secret_stores[store.privacy_request_id]
+
     @staticmethod
     def _get_secret_from_cache(
         privacy_request_id: str,
@@ -0,0 +1,172 @@
+import codecs
+import json
+from typing import Any, Generator, Iterable, Iterator, List, Optional, Union
+
+import pydash
+
+PathKey = Union[str, int]
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+_JSON_DECODER = json.JSONDecoder()
+
+
+class JSONItemStream:
+    """
+    Parses a JSON document from chunks of bytes, yielding the items found at data_path one at a time.
+
+    If the value at data_path is an array, each of its elements is yielded. Any other value is yielded
+    by itself, unless it's missing, null or empty, in which case there are no items. Only one item is
+    held at a time, so the memory used is bounded by the largest item rather than the whole document.
+
+    Once the items have been consumed, `skeleton` holds the rest of the document, with the array at
+    data_path reduced to its last element. It can stand in for the document wherever only the values
+    around the items are needed, for instance to find the next page.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        data_path: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding or "utf-8")()
+        self._path: List[PathKey] = pydash.to_path(data_path) if data_path else []
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+        self.skeleton: Any = None
+
+    def __iter__(self) -> Iterator[Any]:
+        self.skeleton = yield from self._read(self._path)
+        if self._peek():
+            raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+
+    def _read(self, path: List[PathKey]) -> Generator[Any, None, Any]:
+        """Yields the items at the given path below the next value, returning the skeleton of that value"""
+        char = self._peek()
+        if not path:
+            if char != "[":
+                value = self._decode()
+                if value:
+                    yield value
+                return value
+            last: List[Any] = []
+            for item in self._elements():
+                yield item
+                last = [item]
+            return last
+
+        key, remaining = path[0], path[1:]
+        if char == "{":
+            obj = {}
+            for name in self._members():
+                if name == str(key):
+                    obj[name] = yield from self._read(remaining)
+                else:
+                    obj[name] = self._decode()
+            return obj
+        if char == "[" and str(key).isdigit():
+            array = []
+            for index, _ in enumerate(self._element_positions()):
+                if index == int(key):
+                    array.append((yield from self._read(remaining)))
+                else:
+                    array.append(self._decode())
+            return array
+        return self._decode()
+
+    def _elements(self) -> Iterator[Any]:
+        """Decodes the elements of the next array one at a time"""
+        for _ in self._element_positions():
+            yield self._decode()
+
+    def _element_positions(self) -> Iterator[None]:
+        """Steps through the next array, stopping before each element, which must be consumed by the caller"""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self._peek() == ",":
+                self._pos += 1
+            else:
+                self._expect("]")
+                return
+
+    def _members(self) -> Iterator[str]:
+        """Steps through the next object, stopping before each value, which must be consumed by the caller"""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            name = self._decode()
+            self._expect(":")
+            yield name
+            if self._peek() == ",":
+                self._pos += 1
+            else:
+                self._expect("}")
+                return
+
+    def _decode(self) -> Any:
+        """Decodes the next value, reading more of the document until it's complete"""
+        self._peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number at the end of the buffer may continue in the next chunk
+            if self._exhausted or (
+                end < len(self._buffer) and self._buffer[end] not in _NUMBER_CHARS
+            ):
+                self._pos = end
+                return value
+            self._fill()
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def _peek(self) -> str:
+        """Returns the next non-whitespace character, or an empty string at the end of the document"""
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _fill(self) -> bool:
+        """
+        Reads more of the document into the buffer, dropping what has been consumed. The unconsumed
+        part of the buffer is at least doubled, so a value spanning many chunks is decoded in a
+        linear number of attempts. Returns False if the document has been read in full.
+        """
+        if self._exhausted:
+            return False
+        pending = [self._buffer[self._pos :]]
+        target = max(len(pending[0]), 1)
+        size = 0
+        while size < target:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                pending.append(self._decoder.decode(b"", final=True))
+                break
+            text = self._decoder.decode(chunk)
+            pending.append(text)
+            size += len(text)
+        self._buffer = "".join(pending)
+        self._pos = 0
+        return size > 0 or len(pending[-1]) > 0
@@ -65,11 +65,12 @@ def load_dataset_with_replacement(
 
 def merge_fields(target: Field, source: Field) -> Field:
     """Replaces source references and identities if they are available from the target"""
+    update: Dict[str, Any] = {}
     if source.references is not None:
-        target.references = source.references
+        update["references"] = source.references
     if source.identity is not None:
-        target.identity = source.identity
-    return target
+        update["identity"] = source.identity
+    return target.copy(update=update)
 
 
 def extract_fields(aggregate: Dict, collections: List[Collection]) -> None:
@@ -994,6 +994,27 @@ class TestPutConnectionConfigSecrets:
             json.loads(resp.text)["detail"][0]["msg"] == "value is not a valid integer"
         )
 
+    @mock.patch(
+        "fidesops.ops.api.v1.endpoints.connection_endpoints.engine_registry.invalidate"
+    )
+    def test_put_connection_config_secrets_invalidates_engine(
+        self,
+        mock_invalidate: Mock,
+        url,
+        api_client: TestClient,
+        generate_auth_header,
+        connection_config,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[CONNECTION_CREATE_OR_UPDATE])
+        payload = {"host": "localhost", "port": "1234", "dbname": "my_test_db"}
+        resp = api_client.put(
+            url + "?verify=False",
+            headers=auth_header,
+            json=payload,
+        )
+        assert resp.status_code == 200
+        mock_invalidate.assert_called_once_with(connection_config.key)
+
     def test_put_connection_config_secrets(
         self,
         url,
@@ -47,6 +47,7 @@ from fidesops.ops.api.v1.urn_registry import (
     PRIVACY_REQUEST_VERIFY_IDENTITY,
     PRIVACY_REQUESTS,
     REQUEST_PREVIEW,
+    REQUEST_PROFILE,
     V1_URL_PREFIX,
 )
 from fidesops.ops.core.config import config
@@ -1562,6 +1563,121 @@ class TestGetExecutionLogs:
         assert resp == expected_resp
 
 
+class TestGetRequestProfile:
+    @pytest.fixture(scope="function")
+    def url(self, db, privacy_request):
+        return V1_URL_PREFIX + REQUEST_PROFILE.format(
+            privacy_request_id=privacy_request.id
+        )
+
+    @pytest.fixture(scope="function")
+    def profiled_execution_logs(self, db, privacy_request):
+        def create_log(collection_name, action_type, profile, status="complete"):
+            return ExecutionLog.create(
+                db=db,
+                data={
+                    "dataset_name": "my-postgres-db",
+                    "collection_name": collection_name,
+                    "action_type": action_type,
+                    "status": status,
+                    "privacy_request_id": privacy_request.id,
+                    "profile": profile,
+                },
+            )
+
+        logs = [
+            create_log("customer", ActionType.access, None, status="in_processing"),
+            create_log(
+                "customer",
+                ActionType.access,
+                {"total": 1.0, "stages": {"connector": 0.9}, "upstream": []},
+            ),
+            create_log(
+                "orders",
+                ActionType.access,
+                {
+                    "total": 3.0,
+                    "stages": {"connector": 2.5, "cache": 0.5},
+                    "upstream": ["my-postgres-db:customer"],
+                },
+            ),
+            create_log(
+                "address",
+                ActionType.access,
+                {
+                    "total": 0.5,
+                    "stages": {"connector": 0.5},
+                    "upstream": ["my-postgres-db:customer"],
+                },
+            ),
+            create_log(
+                "orders",
+                ActionType.erasure,
+                {"total": 2.0, "stages": {"connector": 2.0}, "upstream": []},
+            ),
+        ]
+        yield logs
+        for log in logs:
+            log.delete(db)
+
+    def test_get_request_profile_unauthenticated(self, api_client: TestClient, url):
+        response = api_client.get(url, headers={})
+        assert 401 == response.status_code
+
+    def test_get_request_profile_wrong_scope(
+        self, api_client: TestClient, generate_auth_header, url
+    ):
+        auth_header = generate_auth_header(scopes=[STORAGE_CREATE_OR_UPDATE])
+        response = api_client.get(url, headers=auth_header)
+        assert 403 == response.status_code
+
+    def test_get_request_profile_invalid_privacy_request_id(
+        self, api_client: TestClient, generate_auth_header
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(
+            V1_URL_PREFIX
+            + REQUEST_PROFILE.format(privacy_request_id="invalid_privacy_request_id"),
+            headers=auth_header,
+        )
+        assert 404 == response.status_code
+
+    def test_get_request_profile(
+        self,
+        api_client: TestClient,
+        generate_auth_header,
+        url,
+        profiled_execution_logs,
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(url, headers=auth_header)
+        assert 200 == response.status_code
+        resp = response.json()
+
+        assert len(resp["collections"]) == 4
+        assert resp["collections"][0] == {
+            "dataset_name": "my-postgres-db",
+            "collection_name": "customer",
+            "action_type": "access",
+            "status": "complete",
+            "total": 1.0,
+            "stages": {"connector": 0.9},
+            "upstream": [],
+        }
+        assert resp["critical_paths"] == [
+            {
+                "action_type": "access",
+                "duration": 4.0,
+                "collections": ["my-postgres-db:customer", "my-postgres-db:orders"],
+            },
+            {
+                "action_type": "erasure",
+                "duration": 2.0,
+                "collections": ["my-postgres-db:orders"],
+            },
+        ]
+
+
 class TestRequestPreview:
     @pytest.fixture(scope="function")
     def url(self, db, privacy_request):
@@ -25,6 +25,9 @@ from fidesops.ops.core.config import config
 from fidesops.ops.db.base import Base
 from fidesops.ops.db.database import init_db
 from fidesops.ops.models.privacy_request import generate_request_callback_jwe
+from fidesops.ops.service.authentication.oauth2_token_cache import oauth2_token_cache
+from fidesops.ops.service.connectors.engine_registry import engine_registry
+from fidesops.ops.service.connectors.saas.session_pool import session_pool
 from fidesops.ops.tasks.scheduled.scheduler import scheduler
 from fidesops.ops.util.cache import get_cache
 
@@ -99,6 +102,8 @@ def db() -> Generator:
     yield the_session
     # Teardown below...
     the_session.close()
+    engine_registry.clear()
+    session_pool.clear()
     engine.dispose()
     logger.debug("Dropping database at: %s", engine.url)
     # We don't need to perform any extra checks before dropping the DB
@@ -135,6 +140,13 @@ def clear_db_tables(db):
     delete_data(Base.metadata.sorted_tables)
 
 
+@pytest.fixture(autouse=True)
+def clear_oauth2_token_cache():
+    """Drop OAuth2 tokens cached for connection configs created by previous tests"""
+    yield
+    oauth2_token_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def cache() -> Generator:
     yield get_cache()
@@ -891,6 +891,7 @@ def _create_privacy_request_for_policy(
     )
     email_identity = "test@example.com"
     identity_kwargs = {"email": email_identity}
+    pr.create_cache_index()
     pr.cache_identity(identity_kwargs)
     pr.persist_identity(
         db=db,
@@ -146,6 +146,32 @@ def field(dataresources: List[Dataset], *address: str) -> ScalarField:
     return df
 
 
+def update_field(dataresources: List[Dataset], *address: str, **changes: Any) -> None:
+    """Test util to replace a field with a copy that has the given changes - can update a nested field
+    one level deep"""
+    dr: Dataset = next(dr for dr in dataresources if dr.name == address[0])
+    index, ds = next(
+        (i, ds) for i, ds in enumerate(dr.collections) if ds.name == address[1]
+    )
+
+    def updated(df: Field, names: Tuple[str, ...]) -> Field:
+        if len(names) == 1:
+            return df.copy(update=changes)
+        sub_field: Field = df.fields[names[1]]
+        return df.copy(
+            update={"fields": {**df.fields, names[1]: updated(sub_field, names[1:])}}
+        )
+
+    dr.collections[index] = ds.copy(
+        update={
+            "fields": [
+                updated(df, address[2:]) if df.name == address[2] else df
+                for df in ds.fields
+            ]
+        }
+    )
+
+
 def collection(dataresources: List[Dataset], address: CollectionAddress) -> Collection:
     dr: Dataset = next(dr for dr in dataresources if dr.name == address.dataset)
     return next(ds for ds in dr.collections if ds.name == address.collection)
@@ -216,7 +242,7 @@ def generate_binary_tree_resources(
 
     queue = [root]
     resources = [root]
-    field(resources, "root", "ds", "f1").identity = "email"
+    update_field(resources, "root", "ds", "f1", identity="email")
     level = 1
     while queue:
         next_node = queue.pop()
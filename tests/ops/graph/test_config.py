@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pydantic
 import pytest
 
@@ -235,6 +237,64 @@ class TestCollection:
             ],  # Applies to a nested field
         }
 
+    def test_field_paths_by_category_prefix(self):
+        ds = Collection(
+            name="t3",
+            fields=[
+                ScalarField(name="f1", data_categories=["user.contact.email"]),
+                ScalarField(name="f2", data_categories=["user.contact.address.city"]),
+                ScalarField(name="f3", data_categories=["system.operations"]),
+            ],
+        )
+
+        assert ds.field_paths_by_category_prefix("user.contact") == {
+            "user.contact.email": [FieldPath("f1")],
+            "user.contact.address.city": [FieldPath("f2")],
+        }
+        assert ds.field_paths_by_category_prefix(
+            "user.contact"
+        ) is ds.field_paths_by_category_prefix("user.contact")
+        assert ds.field_paths_by_category_prefix("user.financial") == {}
+
+    def test_indexes_built_once(self):
+        with mock.patch.object(
+            Collection,
+            "recursively_collect_matches",
+            autospec=True,
+            side_effect=Collection.recursively_collect_matches,
+        ) as collect:
+            ds = Collection(
+                name="t3",
+                fields=[
+                    ScalarField(name="id", primary_key=True),
+                    ObjectField(
+                        name="f1",
+                        fields={"f2": ScalarField(name="f2")},
+                    ),
+                ],
+            )
+            assert ds.field(FieldPath("f1", "f2")) == ScalarField(name="f2")
+            assert ds.field(FieldPath("f3")) is None
+            assert list(ds.primary_key_field_paths) == [FieldPath("id")]
+            assert list(ds.top_level_field_dict) == [FieldPath("id"), FieldPath("f1")]
+            ds.references()
+            ds.identities()
+            assert collect.call_count == 1
+
+        with pytest.raises(TypeError):
+            ds.field_dict[FieldPath("f3")] = ScalarField(name="f3")
+
+        # Fields can't be changed after they're indexed, only replaced in a copy
+        with pytest.raises(TypeError):
+            ds.fields[0].primary_key = False
+        with pytest.raises(TypeError):
+            ds.fields = []
+        updated = ds.copy(
+            update={"fields": [ds.fields[0].copy(update={"primary_key": False})]}
+        )
+        assert updated.primary_key_field_paths == {}
+        assert list(ds.primary_key_field_paths) == [FieldPath("id")]
+
 
 class TestField:
     def test_generate_field(self) -> None:
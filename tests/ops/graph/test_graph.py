@@ -4,6 +4,7 @@ from fidesops.ops.core.config import config
 from fidesops.ops.graph.config import *
 from fidesops.ops.graph.traversal import *
 from fidesops.ops.models.policy import ActionType
+from fidesops.ops.task.execution_profile import NodeTimer
 from fidesops.ops.task.graph_task import retry
 from fidesops.ops.task.task_resources import TaskResources
 from tests.ops.task.traversal_data import integration_db_graph
@@ -82,6 +83,7 @@ def test_retry_decorator(privacy_request, policy, db):
             self.retry_logged = 0
             self.end_called_with = ()
             self.resources = TaskResources(privacy_request, policy, [], db)
+            self.timer = NodeTimer()
 
         def log_end(self, action_type: ActionType, exc: Optional[str] = None):
             self.end_called_with = (action_type, exc)
@@ -17,7 +17,7 @@ def test_graph_creation() -> None:
     field(t, "dr_2", "ds_2", "f1").references.append(
         (FieldAddress("dr_3", "ds_3", "f1"), "to")
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "x"
+    update_field(t, "dr_1", "ds_1", "f1", identity="x")
     graph = DatasetGraph(*t)
     assert set(graph.nodes.keys()) == {
         CollectionAddress("dr_1", "ds_1"),
@@ -40,7 +40,7 @@ def test_extract_seed_nodes() -> None:
     field(t, "dr_1", "ds_1", "f1").references.append(
         (FieldAddress("dr_3", "ds_3", "f1"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "x"
+    update_field(t, "dr_1", "ds_1", "f1", identity="x")
     graph: DatasetGraph = DatasetGraph(*t)
 
     assert set(graph.nodes.keys()) == {
@@ -76,7 +76,7 @@ def test_catch_unreachable_node_collection_before() -> None:
     field(t, "dr_1", "ds_1", "f1").references.append(
         (FieldAddress("dr_2", "ds_2", "f1"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     field(t, "dr_2", "ds_2", "f1").references.append(
         (FieldAddress("dr_3", "ds_3", "f1"), None)
     )
@@ -100,7 +100,7 @@ def test_catch_unreachable_node_dataresource_before() -> None:
     field(t, "dr_1", "ds_1", "f1").references.append(
         (FieldAddress("dr_2", "ds_2", "f1"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     field(t, "dr_2", "ds_2", "f1").references.append(
         (FieldAddress("dr_3", "ds_3", "f1"), None)
     )
@@ -119,7 +119,7 @@ def test_catch_unreachable_node_mixed_before() -> None:
     field(t, "dr_1", "ds_1", "f1").references.append(
         (FieldAddress("dr_2", "ds_2", "f1"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     field(t, "dr_2", "ds_2", "f1").references.append(
         (FieldAddress("dr_3", "ds_3", "f1"), None)
     )
@@ -145,7 +145,7 @@ def test_catch_unreachable_node_no_link() -> None:
         (FieldAddress("dr_3", "ds_3", "f1"), None)
     )
     # no links to traversal_node 4, 5
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
 
     with pytest.raises(TraversalError):
         generate_traversal({"email": "a"}, *t)
@@ -156,7 +156,7 @@ def test_catch_invalid_reference_error() -> None:
     field(t, "dr_1", "ds_1", "f1").references.append(
         (FieldAddress("I_dont_exist", "x", "y"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
 
     with pytest.raises(ValidationError):
         generate_traversal({"email": "a"}, *t)
@@ -167,7 +167,7 @@ def test_self_reference_error() -> None:
     field(t, "dr_1", "ds_1", "f1").references.append(
         (FieldAddress("dr_1", "ds_1", "f1"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
 
     with pytest.raises(ValidationError):
         generate_traversal({"email": "a"}, *t)
@@ -181,7 +181,7 @@ def test_self_reference_error() -> None:
 def test_fully_connected() -> None:
     """generate some fully connected graphs and assure that we generate a valid traversal"""
     t = generate_fully_connected_resources(25)
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     generate_traversal({"email": "X"}, *t)  # should generate exception on unreachable
 
 
@@ -266,7 +266,7 @@ def test_traversal_ordering() -> None:
     field(t, "dr_3", "ds_3", "f3").references.append(
         (FieldAddress("dr_2", "ds_2", "f3"), "to")
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     with pytest.raises(TraversalError):
         _ = Traversal(DatasetGraph(*t), {"email": "X"})
 
@@ -370,7 +370,7 @@ def test_circular_reference() -> None:
     field(t, "dr_3", "ds_3", "f3").references.append(
         (FieldAddress("dr_1", "ds_1", "f3"), "to")
     )
-    field(t, "dr_1", "ds_1", "f2").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f2", identity="email")
     traversal = Traversal(DatasetGraph(*t), {"email": "X"})
     traversal_map, terminators = traversal.traversal_map()
     assert traversal_map == {
@@ -410,7 +410,7 @@ def test_multiple_field_links() -> None:
     field(t, "dr_1", "ds_1", "f3").references.append(
         (FieldAddress("dr_2", "ds_2", "f3"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     traversal = Traversal(DatasetGraph(*t), {"email": "X"})
 
     assert incoming_edges(traversal, CollectionAddress("dr_1", "ds_1")) == {
@@ -448,7 +448,7 @@ def test_tree_splay() -> None:
     field(t, "dr_1", "ds_1", "f1").references.append(
         (FieldAddress("dr_5", "ds_5", "f1"), "to")
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     traversal = Traversal(DatasetGraph(*t), {"email": "X"})
 
     assert incoming_edges(traversal, CollectionAddress("dr_1", "ds_1")) == {
@@ -589,7 +589,7 @@ def test_tree_linear() -> None:
     field(t, "dr_4", "ds_4", "f1").references.append(
         (FieldAddress("dr_5", "ds_5", "f1"), None)
     )
-    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
     traversal = Traversal(DatasetGraph(*t), {"email": "X"})
 
     assert set(incoming_edges(traversal, CollectionAddress("dr_1", "ds_1"))) == {
@@ -633,9 +633,9 @@ def test_tree_linear() -> None:
 def test_tree_binary_tree() -> None:
     """test of tree with all nodes in a chain"""
     t = generate_binary_tree_resources(4, 3)
-    field(t, "root", "ds", "f1").identity = "email"
-    field(t, "root.0.1.0", "ds.0.1.0", "f1").identity = "ssn"
-    field(t, "root.1.1", "ds.1.1", "f1").identity = "user_id"
+    update_field(t, "root", "ds", "f1", identity="email")
+    update_field(t, "root.0.1.0", "ds.0.1.0", "f1", identity="ssn")
+    update_field(t, "root.1.1", "ds.1.1", "f1", identity="user_id")
     assert generate_traversal({"email": "X"}, *t)
     assert generate_traversal({"ssn": "X"}, *t)
     assert generate_traversal({"user_id": "X"}, *t)
@@ -643,14 +643,14 @@ def test_tree_binary_tree() -> None:
 
 def test_after_collection() -> None:
     t1 = generate_fully_connected_resources(5)
-    field(t1, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t1, "dr_1", "ds_1", "f1", identity="email")
     collection(t1, CollectionAddress("dr_2", "ds_2")).after.add(
         CollectionAddress("dr_5", "ds_5")
     )
     j1 = generate_traversal({"email": "1"}, *t1)
 
     t2 = generate_fully_connected_resources(5)
-    field(t2, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t2, "dr_1", "ds_1", "f1", identity="email")
     collection(t2, CollectionAddress("dr_5", "ds_5")).after.add(
         CollectionAddress("dr_2", "ds_2")
     )
@@ -661,12 +661,12 @@ def test_after_collection() -> None:
 
 def test_after_dataresource() -> None:
     t1 = generate_fully_connected_resources(5)
-    field(t1, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t1, "dr_1", "ds_1", "f1", identity="email")
     dataresource(t1, "dr_2").after.add("dr_5")
     j1 = generate_traversal({"email": "1"}, *t1)
 
     t2 = generate_fully_connected_resources(5)
-    field(t2, "dr_1", "ds_1", "f1").identity = "email"
+    update_field(t2, "dr_1", "ds_1", "f1", identity="email")
     dataresource(t2, "dr_5").after.add("dr_2")
     j2 = generate_traversal({"email": "1"}, *t2)
 
@@ -675,10 +675,10 @@ def test_after_dataresource() -> None:
 
 def test_different_seed_alters_traversal() -> None:
     t1 = generate_fully_connected_resources(5)
-    field(t1, "dr_1", "ds_1", "f1").identity = "email"
-    field(t1, "dr_2", "ds_2", "f1").identity = "user_id"
-    field(t1, "dr_3", "ds_3", "f1").identity = "ssn"
-    field(t1, "dr_4", "ds_4", "f1").identity = "email"
+    update_field(t1, "dr_1", "ds_1", "f1", identity="email")
+    update_field(t1, "dr_2", "ds_2", "f1", identity="user_id")
+    update_field(t1, "dr_3", "ds_3", "f1", identity="ssn")
+    update_field(t1, "dr_4", "ds_4", "f1", identity="email")
     graph = DatasetGraph(*t1)
     # the number of the start nodes (that is, the children of the virtul
     # root traversal_node) in a traversal will = the # of nodes whose identities
@@ -693,3 +693,89 @@ def test_different_seed_alters_traversal() -> None:
         len(Traversal(graph, {"ssn": "1", "email": 1, "user_id": 1}).root_node.children)
         == 4
     )
+
+
+def test_after_blocks_queued_node() -> None:
+    t = generate_graph_resources(3)
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
+    field(t, "dr_1", "ds_1", "f1").references.append(
+        (FieldAddress("dr_2", "ds_2", "f1"), None)
+    )
+    field(t, "dr_1", "ds_1", "f1").references.append(
+        (FieldAddress("dr_3", "ds_3", "f1"), None)
+    )
+    collection(t, CollectionAddress("dr_2", "ds_2")).after.add(
+        CollectionAddress("dr_3", "ds_3")
+    )
+    traversal = Traversal(DatasetGraph(*t), {"email": "1"})
+
+    assert generate_traversal_order(traversal) == {
+        ROOT_COLLECTION_ADDRESS: [0],
+        CollectionAddress("dr_1", "ds_1"): [1],
+        CollectionAddress("dr_3", "ds_3"): [2],
+        CollectionAddress("dr_2", "ds_2"): [3],
+    }
+
+
+def test_traverse_replays_plan() -> None:
+    t = generate_fully_connected_resources(5)
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
+    traversal = Traversal(DatasetGraph(*t), {"email": "1"})
+    parents = {
+        address: {k: list(v) for k, v in tn.parents.items()}
+        for address, tn in traversal.traversal_node_dict.items()
+    }
+
+    first_order = generate_traversal_order(traversal)
+    assert generate_traversal_order(traversal) == first_order
+    assert traversal.traverse({}, lambda tn, env: None) == traversal.end_nodes
+
+    # traversing again doesn't re-link nodes
+    assert parents == {
+        address: tn.parents for address, tn in traversal.traversal_node_dict.items()
+    }
+
+
+def test_plan_large_graph() -> None:
+    t = generate_binary_tree_resources(10)
+    traversal = Traversal(DatasetGraph(*t), {"email": "1"})
+
+    assert len(traversal.plan) == len(t) + 1
+    assert set(traversal.end_nodes) == {
+        CollectionAddress(dr.name, dr.collections[0].name)
+        for dr in t
+        if not field(t, dr.name, dr.collections[0].name, "f1").references
+    }
+
+
+def test_get_traversal_reuses_plan_for_same_identity_keys() -> None:
+    t = generate_fully_connected_resources(5)
+    update_field(t, "dr_1", "ds_1", "f1", identity="email")
+    update_field(t, "dr_2", "ds_2", "f1", identity="user_id")
+    graph = DatasetGraph(*t)
+
+    first = get_traversal(graph, {"email": "1"})
+    second = get_traversal(graph, {"email": "2"})
+    assert first.seed_data == {"email": "1"}
+    assert second.seed_data == {"email": "2"}
+    assert second.traversal_node_dict is first.traversal_node_dict
+    assert second.plan is first.plan
+
+    with_user_id = get_traversal(graph, {"email": "1", "user_id": "a"})
+    assert with_user_id.plan is not first.plan
+    assert len(with_user_id.root_node.children) == 2
+
+    # A new version of the graph is planned from scratch
+    assert get_traversal(DatasetGraph(*t), {"email": "1"}).plan is not first.plan
+
+
+def test_incoming_edges_updated_when_parent_linked() -> None:
+    parent = TraversalNode(generate_node("a", "b", "c"))
+    child = TraversalNode(generate_node("d", "e", "f"))
+    assert child.incoming_edges() == set()
+    assert child.query_field_paths == set()
+
+    edge = Edge(FieldAddress("a", "b", "c"), FieldAddress("d", "e", "f"))
+    parent.add_child(child, edge)
+    assert child.incoming_edges() == {edge}
+    assert child.query_field_paths == {FieldPath("f")}
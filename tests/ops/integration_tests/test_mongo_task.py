@@ -7,6 +7,7 @@ from unittest.mock import Mock
 import pytest
 from bson import ObjectId
 
+from fidesops.ops.core.config import config
 from fidesops.ops.graph.config import Collection, Dataset, FieldAddress, ScalarField
 from fidesops.ops.graph.data_type import (
     IntTypeConverter,
@@ -25,7 +26,7 @@ from fidesops.ops.task import graph_task
 from fidesops.ops.task.filter_results import filter_data_categories
 from fidesops.ops.task.graph_task import get_cached_data_for_erasures
 
-from ..graph.graph_test_util import assert_rows_match, erasure_policy, field
+from ..graph.graph_test_util import assert_rows_match, erasure_policy, update_field
 from ..task.traversal_data import (
     combined_mongo_postgresql_graph,
     integration_db_graph,
@@ -55,53 +56,94 @@ async def test_combined_erasure_task(
         integration_postgres_config, integration_mongodb_config
     )
 
-    field([postgres_dataset], "postgres_example", "address", "city").data_categories = [
-        "A"
-    ]
-    field(
-        [postgres_dataset], "postgres_example", "address", "state"
-    ).data_categories = ["B"]
-    field([postgres_dataset], "postgres_example", "address", "zip").data_categories = [
-        "C"
-    ]
-    field(
-        [postgres_dataset], "postgres_example", "customer", "name"
-    ).data_categories = ["A"]
-    field([mongo_dataset], "mongo_test", "address", "city").data_categories = ["A"]
-    field([mongo_dataset], "mongo_test", "address", "state").data_categories = ["B"]
-    field([mongo_dataset], "mongo_test", "address", "zip").data_categories = ["C"]
-    field(
-        [mongo_dataset], "mongo_test", "customer_details", "workplace_info", "position"
-    ).data_categories = ["A"]
-    field(
-        [mongo_dataset], "mongo_test", "customer_details", "emergency_contacts", "phone"
-    ).data_categories = ["B"]
-    field(
-        [mongo_dataset], "mongo_test", "customer_details", "children"
-    ).data_categories = ["B"]
-    field(
-        [mongo_dataset], "mongo_test", "internal_customer_profile", "derived_interests"
-    ).data_categories = ["B"]
-    field([mongo_dataset], "mongo_test", "employee", "email").data_categories = ["B"]
-    field(
+    update_field(
+        [postgres_dataset], "postgres_example", "address", "city", data_categories=["A"]
+    )
+    update_field(
+        [postgres_dataset],
+        "postgres_example",
+        "address",
+        "state",
+        data_categories=["B"],
+    )
+    update_field(
+        [postgres_dataset], "postgres_example", "address", "zip", data_categories=["C"]
+    )
+    update_field(
+        [postgres_dataset],
+        "postgres_example",
+        "customer",
+        "name",
+        data_categories=["A"],
+    )
+    update_field(
+        [mongo_dataset], "mongo_test", "address", "city", data_categories=["A"]
+    )
+    update_field(
+        [mongo_dataset], "mongo_test", "address", "state", data_categories=["B"]
+    )
+    update_field([mongo_dataset], "mongo_test", "address", "zip", data_categories=["C"])
+    update_field(
+        [mongo_dataset],
+        "mongo_test",
+        "customer_details",
+        "workplace_info",
+        "position",
+        data_categories=["A"],
+    )
+    update_field(
+        [mongo_dataset],
+        "mongo_test",
+        "customer_details",
+        "emergency_contacts",
+        "phone",
+        data_categories=["B"],
+    )
+    update_field(
+        [mongo_dataset],
+        "mongo_test",
+        "customer_details",
+        "children",
+        data_categories=["B"],
+    )
+    update_field(
+        [mongo_dataset],
+        "mongo_test",
+        "internal_customer_profile",
+        "derived_interests",
+        data_categories=["B"],
+    )
+    update_field(
+        [mongo_dataset], "mongo_test", "employee", "email", data_categories=["B"]
+    )
+    update_field(
         [mongo_dataset],
         "mongo_test",
         "customer_feedback",
         "customer_information",
         "phone",
-    ).data_categories = ["A"]
+        data_categories=["A"],
+    )
 
-    field(
-        [mongo_dataset], "mongo_test", "conversations", "thread", "chat_name"
-    ).data_categories = ["B"]
-    field(
+    update_field(
+        [mongo_dataset],
+        "mongo_test",
+        "conversations",
+        "thread",
+        "chat_name",
+        data_categories=["B"],
+    )
+    update_field(
         [mongo_dataset],
         "mongo_test",
         "flights",
         "passenger_information",
         "passenger_ids",
-    ).data_categories = ["A"]
-    field([mongo_dataset], "mongo_test", "aircraft", "planes").data_categories = ["A"]
+        data_categories=["A"],
+    )
+    update_field(
+        [mongo_dataset], "mongo_test", "aircraft", "planes", data_categories=["A"]
+    )
 
     graph = DatasetGraph(mongo_dataset, postgres_dataset)
 
@@ -263,10 +305,11 @@ async def test_mongo_erasure_task(db, mongo_inserts, integration_mongodb_config)
     dataset, graph = integration_db_mongo_graph(
         "mongo_test", integration_mongodb_config.key
     )
-    field([dataset], "mongo_test", "address", "city").data_categories = ["A"]
-    field([dataset], "mongo_test", "address", "state").data_categories = ["B"]
-    field([dataset], "mongo_test", "address", "zip").data_categories = ["C"]
-    field([dataset], "mongo_test", "customer", "name").data_categories = ["A"]
+    update_field([dataset], "mongo_test", "address", "city", data_categories=["A"])
+    update_field([dataset], "mongo_test", "address", "state", data_categories=["B"])
+    update_field([dataset], "mongo_test", "address", "zip", data_categories=["C"])
+    update_field([dataset], "mongo_test", "customer", "name", data_categories=["A"])
+    graph = DatasetGraph(dataset)
 
     await graph_task.run_access_request(
         privacy_request,
@@ -293,6 +336,46 @@ async def test_mongo_erasure_task(db, mongo_inserts, integration_mongodb_config)
     }
 
 
+@pytest.mark.integration_mongodb
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_mongo_erasure_task_across_bulk_writes(
+    db, mongo_inserts, integration_mongodb_config
+):
+    """Modified counts are summed across every bulk write of a collection"""
+    policy = erasure_policy("A")
+    seed_email = mongo_inserts["customer"][0]["email"]
+    privacy_request = PrivacyRequest(
+        id=f"test_mongo_erasure_task_{random.randint(0, 1000)}"
+    )
+
+    dataset, graph = integration_db_mongo_graph(
+        "mongo_test", integration_mongodb_config.key
+    )
+    update_field([dataset], "mongo_test", "address", "city", data_categories=["A"])
+    graph = DatasetGraph(dataset)
+
+    await graph_task.run_access_request(
+        privacy_request,
+        policy,
+        graph,
+        [integration_mongodb_config],
+        {"email": seed_email},
+        db,
+    )
+    with mock.patch.object(config.execution, "mongo_update_batch_size", 1):
+        v = await graph_task.run_erasure(
+            privacy_request,
+            policy,
+            graph,
+            [integration_mongodb_config],
+            {"email": seed_email},
+            get_cached_data_for_erasures(privacy_request.id),
+            db,
+        )
+    assert v["mongo_test:address"] == 2
+
+
 @pytest.mark.integration_mongodb
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -722,16 +805,22 @@ async def test_return_all_elements_config_erasure(
         integration_postgres_config, integration_mongodb_config
     )
 
-    field(
-        [mongo_dataset], "mongo_test", "rewards", "owner", "phone"
-    ).data_categories = ["A"]
-    field(
+    update_field(
+        [mongo_dataset],
+        "mongo_test",
+        "rewards",
+        "owner",
+        "phone",
+        data_categories=["A"],
+    )
+    update_field(
         [mongo_dataset],
         "mongo_test",
         "internal_customer_profile",
         "customer_identifiers",
         "derived_phone",
-    ).data_categories = ["B"]
+        data_categories=["B"],
+    )
 
     graph = DatasetGraph(mongo_dataset, postgres_dataset)
 
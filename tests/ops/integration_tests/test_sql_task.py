@@ -32,8 +32,8 @@ from fidesops.ops.task.graph_task import get_cached_data_for_erasures
 from ..graph.graph_test_util import (
     assert_rows_match,
     erasure_policy,
-    field,
     records_matching_fields,
+    update_field,
 )
 from ..task.traversal_data import (
     integration_db_dataset,
@@ -70,13 +70,19 @@ async def test_sql_erasure_ignores_collections_without_pk(
     )  # makes an erasure policy with two data categories to match against
     dataset = integration_db_dataset("postgres_example", "postgres_example")
 
-    field([dataset], "postgres_example", "address", "id").primary_key = False
+    update_field([dataset], "postgres_example", "address", "id", primary_key=False)
 
     # set categories: A,B will be marked erasable, C will not
-    field([dataset], "postgres_example", "address", "city").data_categories = ["A"]
-    field([dataset], "postgres_example", "address", "state").data_categories = ["B"]
-    field([dataset], "postgres_example", "address", "zip").data_categories = ["C"]
-    field([dataset], "postgres_example", "customer", "name").data_categories = ["A"]
+    update_field(
+        [dataset], "postgres_example", "address", "city", data_categories=["A"]
+    )
+    update_field(
+        [dataset], "postgres_example", "address", "state", data_categories=["B"]
+    )
+    update_field([dataset], "postgres_example", "address", "zip", data_categories=["C"])
+    update_field(
+        [dataset], "postgres_example", "customer", "name", data_categories=["A"]
+    )
 
     graph = DatasetGraph(dataset)
     privacy_request = PrivacyRequest(id=str(uuid4()))
@@ -238,12 +244,18 @@ async def test_sql_erasure_task(db, postgres_inserts, integration_postgres_confi
 
     policy = erasure_policy("A", "B")
     dataset = integration_db_dataset("postgres_example", "postgres_example")
-    field([dataset], "postgres_example", "address", "id").primary_key = True
+    update_field([dataset], "postgres_example", "address", "id", primary_key=True)
     # set categories: A,B will be marked erasable, C will not
-    field([dataset], "postgres_example", "address", "city").data_categories = ["A"]
-    field([dataset], "postgres_example", "address", "state").data_categories = ["B"]
-    field([dataset], "postgres_example", "address", "zip").data_categories = ["C"]
-    field([dataset], "postgres_example", "customer", "name").data_categories = ["A"]
+    update_field(
+        [dataset], "postgres_example", "address", "city", data_categories=["A"]
+    )
+    update_field(
+        [dataset], "postgres_example", "address", "state", data_categories=["B"]
+    )
+    update_field([dataset], "postgres_example", "address", "zip", data_categories=["C"])
+    update_field(
+        [dataset], "postgres_example", "customer", "name", data_categories=["A"]
+    )
     graph = DatasetGraph(dataset)
     privacy_request = PrivacyRequest(id=str(uuid4()))
     await graph_task.run_access_request(
@@ -360,6 +372,67 @@ async def test_postgres_access_request_task(
     )
 
 
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_postgres_access_request_task_chunked_queries(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+) -> None:
+    """Querying inputs in chunks returns the same rows as querying them all at once"""
+    graph = integration_db_graph("postgres_example")
+    results = []
+    for batch_size in [config.execution.sql_query_batch_size, 1]:
+        with mock.patch.object(config.execution, "sql_query_batch_size", batch_size):
+            results.append(
+                await graph_task.run_access_request(
+                    PrivacyRequest(id=str(uuid4())),
+                    policy,
+                    graph,
+                    [integration_postgres_config],
+                    {"email": "customer-1@example.com"},
+                    db,
+                )
+            )
+
+    unchunked, chunked = results
+    assert len(chunked["postgres_example:address"]) == 2
+    for collection, rows in unchunked.items():
+        assert sorted(chunked[collection], key=lambda row: row["id"]) == sorted(
+            rows, key=lambda row: row["id"]
+        )
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_postgres_access_request_task_chunked_queries_without_primary_key(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+) -> None:
+    """A row matching more than one chunk is returned once, even without a primary key"""
+    dataset = integration_db_dataset("postgres_example", "postgres_example")
+    update_field([dataset], "postgres_example", "customer", "id", primary_key=False)
+    update_field([dataset], "postgres_example", "customer", "name", identity="name")
+    graph = DatasetGraph(dataset)
+
+    with mock.patch.object(config.execution, "sql_query_batch_size", 1):
+        results = await graph_task.run_access_request(
+            PrivacyRequest(id=str(uuid4())),
+            policy,
+            graph,
+            [integration_postgres_config],
+            {"email": "customer-1@example.com", "name": "John Customer"},
+            db,
+        )
+
+    assert [row["id"] for row in results["postgres_example:customer"]] == [1]
+
+
 @pytest.mark.integration_postgres
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -418,7 +491,10 @@ async def test_postgres_privacy_requests_against_non_default_schema(
     target.data_category = "user"
     target.save(db)
     # Update data category on customer name
-    field([dataset], database_name, "customer", "name").data_categories = ["user.name"]
+    update_field(
+        [dataset], database_name, "customer", "name", data_categories=["user.name"]
+    )
+    graph = DatasetGraph(dataset)
 
     erasure_results = await graph_task.run_erasure(
         privacy_request,
@@ -1281,9 +1357,15 @@ async def test_timescale_erasure_request_task(
     dataset = integration_db_dataset(database_name, timescale_connection_config.key)
 
     # Set some data categories on fields that will be targeted by the policy above
-    field([dataset], database_name, "customer", "name").data_categories = ["user.name"]
-    field([dataset], database_name, "address", "street").data_categories = ["user"]
-    field([dataset], database_name, "payment_card", "ccn").data_categories = ["user"]
+    update_field(
+        [dataset], database_name, "customer", "name", data_categories=["user.name"]
+    )
+    update_field(
+        [dataset], database_name, "address", "street", data_categories=["user"]
+    )
+    update_field(
+        [dataset], database_name, "payment_card", "ccn", data_categories=["user"]
+    )
 
     graph = DatasetGraph(dataset)
 
@@ -1443,9 +1525,14 @@ async def test_timescale_query_and_mask_hypertable(
     target.data_category = "user"
     target.save(db)
     # Update data category on responsible field
-    field(
-        [dataset], database_name, "onsite_personnel", "responsible"
-    ).data_categories = ["user.contact.email"]
+    update_field(
+        [dataset],
+        database_name,
+        "onsite_personnel",
+        "responsible",
+        data_categories=["user.contact.email"],
+    )
+    graph = DatasetGraph(dataset)
 
     # Run an erasure on the hypertable targeting the responsible field
     v = await graph_task.run_erasure(
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 from typing import List
+from unittest import mock
 from uuid import uuid4
 
 import pytest
@@ -232,6 +233,30 @@ def test_delete_privacy_request_removes_cached_data(
     assert cache.get(key) is None
 
 
+def test_cached_data_read_from_cache_index(
+    cache: FidesopsRedis, privacy_request: PrivacyRequest
+) -> None:
+    privacy_request.cache_manual_input(
+        CollectionAddress("postgres_example", "customer"), [{"id": 1}]
+    )
+    assert cache.sismember(
+        privacy_request.cache_index,
+        f"EN_MANUAL_INPUT__{privacy_request.id}__postgres_example:customer",
+    )
+
+    with mock.patch.object(FidesopsRedis, "scan") as scan, mock.patch.object(
+        FidesopsRedis, "keys"
+    ) as keys:
+        assert privacy_request.get_cached_identity_data() == {
+            "email": "test@example.com"
+        }
+        assert privacy_request.get_manual_input(
+            CollectionAddress("postgres_example", "customer")
+        ) == [{"id": 1}]
+        assert not scan.called
+        assert not keys.called
+
+
 class TestPrivacyRequestTriggerWebhooks:
     def test_trigger_one_way_policy_webhook(
         self,
@@ -0,0 +1,210 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+from requests import PreparedRequest, Request
+from sqlalchemy.orm import Session
+
+from fidesops.ops.service.authentication.authentication_strategy import (
+    AuthenticationStrategy,
+)
+from fidesops.ops.service.authentication.oauth2_token_cache import (
+    CachedToken,
+    oauth2_token_cache,
+)
+
+
+def authorization_header(auth_strategy, connection_config) -> str:
+    req: PreparedRequest = Request(method="POST", url="https://localhost").prepare()
+    return auth_strategy.add_authentication(req, connection_config).headers[
+        "Authorization"
+    ]
+
+
+class TestCachedToken:
+    def test_matches(self):
+        token = CachedToken("new_access", None, "access")
+        assert token.matches("new_access")
+        assert token.matches("access")
+        assert not token.matches("other")
+        assert not token.matches(None)
+        assert not CachedToken("access", None).matches(None)
+
+    def test_is_expired(self):
+        assert not CachedToken("access", None).is_expired()
+        assert CachedToken("access", 0).is_expired()
+        assert not CachedToken("access", int(time.time()) + 60).is_expired()
+
+
+@mock.patch("fidesops.ops.models.connectionconfig.ConnectionConfig.update")
+@mock.patch(
+    "fidesops.ops.service.authentication.authentication_strategy_oauth2_base.OAuth2AuthenticationStrategyBase._call_token_request"
+)
+class TestOAuth2TokenCache:
+    @pytest.fixture(scope="function")
+    def auth_strategy(self, oauth2_authorization_code_configuration):
+        return AuthenticationStrategy.get_strategy(
+            "oauth2_authorization_code", oauth2_authorization_code_configuration
+        )
+
+    def test_refreshed_token_reused(
+        self,
+        mock_token_request: Mock,
+        mock_connection_config_update: Mock,
+        auth_strategy,
+        oauth2_authorization_code_connection_config,
+    ):
+        mock_token_request.return_value = {"access_token": "new_access"}
+        oauth2_authorization_code_connection_config.secrets["expires_at"] = 0
+
+        # the secrets aren't updated since ConnectionConfig.update is mocked, as for a
+        # connection config loaded before the token was refreshed
+        for _ in range(3):
+            assert (
+                authorization_header(
+                    auth_strategy, oauth2_authorization_code_connection_config
+                )
+                == "Bearer new_access"
+            )
+        mock_token_request.assert_called_once()
+        mock_connection_config_update.assert_called_once()
+
+    def test_concurrent_refresh(
+        self,
+        mock_token_request: Mock,
+        mock_connection_config_update: Mock,
+        auth_strategy,
+        oauth2_authorization_code_connection_config,
+    ):
+        def token_request(*_):
+            time.sleep(0.2)
+            return {"access_token": "new_access"}
+
+        mock_token_request.side_effect = token_request
+        oauth2_authorization_code_connection_config.secrets["expires_at"] = 0
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            headers = list(
+                executor.map(
+                    lambda _: authorization_header(
+                        auth_strategy, oauth2_authorization_code_connection_config
+                    ),
+                    range(5),
+                )
+            )
+        assert headers == ["Bearer new_access"] * 5
+        mock_token_request.assert_called_once()
+        mock_connection_config_update.assert_called_once()
+
+    def test_current_token_used_during_refresh(
+        self,
+        mock_token_request: Mock,
+        mock_connection_config_update: Mock,
+        auth_strategy,
+        oauth2_authorization_code_connection_config,
+    ):
+        mock_token_request.return_value = {"access_token": "new_access"}
+        connection_config = oauth2_authorization_code_connection_config
+        # close to expiring but still valid
+        connection_config.secrets["expires_at"] = int(
+            (datetime.utcnow() + timedelta(minutes=5)).timestamp()
+        )
+        oauth2_token_cache.set(
+            connection_config.key,
+            CachedToken("access", connection_config.secrets["expires_at"]),
+        )
+
+        refresh_lock: threading.Lock = oauth2_token_cache.refresh_lock(
+            connection_config.key
+        )
+        with refresh_lock:
+            assert (
+                authorization_header(auth_strategy, connection_config)
+                == "Bearer access"
+            )
+        mock_token_request.assert_not_called()
+
+        assert (
+            authorization_header(auth_strategy, connection_config)
+            == "Bearer new_access"
+        )
+        mock_token_request.assert_called_once()
+
+    def test_stored_token_replaces_cached_token(
+        self,
+        mock_token_request: Mock,
+        mock_connection_config_update: Mock,
+        auth_strategy,
+        oauth2_authorization_code_connection_config,
+    ):
+        connection_config = oauth2_authorization_code_connection_config
+        connection_config.secrets["expires_at"] = (
+            datetime.utcnow() + timedelta(days=1)
+        ).timestamp()
+        assert authorization_header(auth_strategy, connection_config) == "Bearer access"
+
+        # e.g. the connection was authorized again through the API
+        connection_config.secrets["access_token"] = "reauthorized_access"
+        assert (
+            authorization_header(auth_strategy, connection_config)
+            == "Bearer reauthorized_access"
+        )
+        mock_token_request.assert_not_called()
+        mock_connection_config_update.assert_not_called()
+
+    def test_older_stored_token_doesnt_replace_cached_token(
+        self,
+        mock_token_request: Mock,
+        mock_connection_config_update: Mock,
+        auth_strategy,
+        oauth2_authorization_code_connection_config,
+    ):
+        connection_config = oauth2_authorization_code_connection_config
+        now = int(time.time())
+        oauth2_token_cache.set(
+            connection_config.key,
+            CachedToken("new_access", now + 7200, "refreshed_access"),
+        )
+
+        # loaded before the token was refreshed more than once
+        connection_config.secrets["expires_at"] = now + 3600
+        assert (
+            authorization_header(auth_strategy, connection_config)
+            == "Bearer new_access"
+        )
+        mock_token_request.assert_not_called()
+
+
+@mock.patch(
+    "fidesops.ops.service.authentication.authentication_strategy_oauth2_base.OAuth2AuthenticationStrategyBase._call_token_request"
+)
+def test_refreshed_token_saved_with_own_session(
+    mock_token_request: Mock,
+    db: Session,
+    oauth2_authorization_code_configuration,
+    oauth2_authorization_code_connection_config,
+):
+    mock_token_request.return_value = {"access_token": "new_access"}
+    connection_config = oauth2_authorization_code_connection_config
+    connection_config.secrets = {**connection_config.secrets, "expires_at": 0}
+    connection_config.save(db)
+
+    auth_strategy = AuthenticationStrategy.get_strategy(
+        "oauth2_authorization_code", oauth2_authorization_code_configuration
+    )
+    # the session the connection config was loaded with may be used by other threads
+    with mock.patch.object(db, "commit") as commit:
+        assert (
+            authorization_header(auth_strategy, connection_config)
+            == "Bearer new_access"
+        )
+    commit.assert_not_called()
+    assert connection_config.secrets["access_token"] == "new_access"
+    assert connection_config not in db.dirty
+
+    db.expire(connection_config)
+    assert connection_config.secrets["access_token"] == "new_access"
@@ -10,8 +10,12 @@ from fidesops.ops.common_exceptions import (
     ClientUnsuccessfulException,
     ConnectionException,
 )
+from fidesops.ops.core.config import config
 from fidesops.ops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.ops.schemas.saas.shared_schemas import HTTPMethod, SaaSRequestParams
+from fidesops.ops.service.authentication.authentication_strategy import (
+    AuthenticationStrategy,
+)
 from fidesops.ops.service.connectors.saas.authenticated_client import (
     AuthenticatedClient,
     get_retry_after,
@@ -95,6 +99,44 @@ class TestAuthenticatedClient:
             test_authenticated_client.send(test_saas_request)
         assert send.call_count == 1
 
+    def test_client_sends_with_timeouts(
+        self, send, test_authenticated_client, test_saas_request
+    ):
+        test_response = Response()
+        test_response.status_code = 200
+        send.return_value = test_response
+        test_authenticated_client.send(test_saas_request)
+        assert send.call_args.kwargs["timeout"] == (
+            config.execution.saas_connect_timeout,
+            config.execution.saas_read_timeout,
+        )
+
+        test_authenticated_client.client_config.read_timeout = 300
+        test_authenticated_client.send(test_saas_request)
+        assert send.call_args.kwargs["timeout"] == (
+            config.execution.saas_connect_timeout,
+            300,
+        )
+
+    def test_session_shared_between_clients(
+        self, send, test_authenticated_client, test_connection_config
+    ):
+        client = AuthenticatedClient("https://test_uri", test_connection_config)
+        assert client.session is test_authenticated_client.session
+
+    def test_auth_strategy_built_once(
+        self, send, test_authenticated_client, test_saas_request
+    ):
+        send().ok = True
+        with mock.patch(
+            "fidesops.ops.service.authentication.authentication_strategy.AuthenticationStrategy.get_strategy",
+            wraps=AuthenticationStrategy.get_strategy,
+        ) as get_strategy:
+            test_authenticated_client.send(test_saas_request)
+            test_authenticated_client.send(test_saas_request)
+        get_strategy.assert_called_once()
+        assert send.call_args.args[0].headers["Authorization"] == "Bearer test_token"
+
 
 @pytest.mark.unit_saas
 class TestRetryAfterHeaderParsing:
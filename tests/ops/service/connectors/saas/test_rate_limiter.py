@@ -0,0 +1,130 @@
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from fidesops.ops.common_exceptions import RateLimitExceededException
+from fidesops.ops.core.config import config
+from fidesops.ops.schemas.saas.saas_config import RateLimit, RateLimitPeriod
+from fidesops.ops.schemas.saas.shared_schemas import HTTPMethod, SaaSRequestParams
+from fidesops.ops.service.connectors import get_connector
+from fidesops.ops.service.connectors.saas.authenticated_client import (
+    AuthenticatedClient,
+)
+from fidesops.ops.service.connectors.saas.rate_limiter import (
+    RateLimitBucket,
+    get_rate_limit_cache_key,
+)
+from fidesops.ops.util.cache import get_cache
+
+
+@pytest.mark.unit_saas
+class TestRateLimit:
+    def test_defaults(self):
+        rate_limit = RateLimit(rate=120, period="minute")
+        assert rate_limit.period == RateLimitPeriod.minute
+        assert rate_limit.requests_per_second == 2
+        assert rate_limit.capacity == 120
+
+        assert RateLimit(rate=5, burst=1).requests_per_second == 5
+        assert RateLimit(rate=5, burst=1).capacity == 1
+
+
+@pytest.mark.unit_saas
+class TestRateLimitBucket:
+    @pytest.fixture(scope="function")
+    def bucket_key(self):
+        key = f"rate_limit__test_{uuid4()}"
+        yield key
+        get_cache().delete(key)
+
+    @mock.patch("fidesops.ops.service.connectors.saas.rate_limiter.time.sleep")
+    def test_acquire_within_burst(self, sleep, bucket_key):
+        bucket = RateLimitBucket(bucket_key, RateLimit(rate=1, burst=3))
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        sleep.assert_not_called()
+
+    @mock.patch("fidesops.ops.service.connectors.saas.rate_limiter.time.sleep")
+    def test_acquire_waits_for_tokens(self, sleep, bucket_key):
+        bucket = RateLimitBucket(bucket_key, RateLimit(rate=1, period="minute"))
+        assert bucket.acquire() == 0
+
+        # Each waiting request reserves the next token, so waits grow by the refill time
+        first_wait = bucket.acquire()
+        second_wait = bucket.acquire()
+        assert 55 < first_wait <= 60
+        assert 115 < second_wait <= 120
+        assert [call.args[0] for call in sleep.call_args_list] == [
+            first_wait,
+            second_wait,
+        ]
+
+    @mock.patch("fidesops.ops.service.connectors.saas.rate_limiter.time.sleep")
+    def test_wait_over_max_wait_raises(self, sleep, bucket_key):
+        bucket = RateLimitBucket(bucket_key, RateLimit(rate=1, period="minute"))
+        assert bucket.acquire() == 0
+
+        with mock.patch.object(config.execution, "saas_rate_limit_max_wait", 30):
+            with pytest.raises(RateLimitExceededException):
+                bucket.acquire()
+        sleep.assert_not_called()
+
+        # The token wasn't taken, so the next request waits for the first refill only
+        assert 55 < bucket.acquire() <= 60
+
+    def test_client_doesnt_retry_rate_limit_exceeded(
+        self, saas_example_connection_config
+    ):
+        client = AuthenticatedClient("https://test_uri", saas_example_connection_config)
+        client.rate_limit_bucket = mock.Mock()
+        client.rate_limit_bucket.acquire.side_effect = RateLimitExceededException(
+            "Rate limit exceeded"
+        )
+        with mock.patch.object(client.session, "send") as send:
+            with pytest.raises(RateLimitExceededException):
+                client.send(SaaSRequestParams(method=HTTPMethod.GET, path="/"))
+        send.assert_not_called()
+        client.rate_limit_bucket.acquire.assert_called_once()
+
+    @mock.patch("fidesops.ops.service.connectors.saas.rate_limiter.time.sleep")
+    def test_bucket_shared_by_key(self, sleep, bucket_key):
+        rate_limit = RateLimit(rate=1, period="minute")
+        assert RateLimitBucket(bucket_key, rate_limit).acquire() == 0
+        assert RateLimitBucket(bucket_key, rate_limit).acquire() > 0
+
+
+@pytest.mark.unit_saas
+class TestSaaSConnectorRateLimit:
+    def test_rate_limit_bucket(self, saas_example_connection_config):
+        connector = get_connector(saas_example_connection_config)
+        assert connector.get_rate_limit_bucket("messages") is None
+
+        connector.saas_config.rate_limit = RateLimit(rate=10)
+        connector.endpoints["conversations"].rate_limit = RateLimit(rate=1)
+
+        bucket = connector.get_rate_limit_bucket()
+        assert bucket.key == get_rate_limit_cache_key(
+            saas_example_connection_config.key
+        )
+        assert bucket.rate_limit.rate == 10
+        assert connector.get_rate_limit_bucket("messages").key == bucket.key
+
+        endpoint_bucket = connector.get_rate_limit_bucket("conversations")
+        assert endpoint_bucket.key == get_rate_limit_cache_key(
+            saas_example_connection_config.key, "conversations"
+        )
+        assert endpoint_bucket.rate_limit.rate == 1
+
+        request = connector.endpoints["conversations"].requests["read"]
+        client = connector.create_client_from_request(request, "conversations")
+        assert client.rate_limit_bucket.key == endpoint_bucket.key
+
+    def test_client_acquires_token_for_each_request(
+        self, saas_example_connection_config
+    ):
+        client = AuthenticatedClient("https://test_uri", saas_example_connection_config)
+        client.rate_limit_bucket = mock.Mock()
+        with mock.patch.object(client.session, "send") as send:
+            send.return_value.ok = True
+            client.send(SaaSRequestParams(method=HTTPMethod.GET, path="/"))
+        client.rate_limit_bucket.acquire.assert_called_once()
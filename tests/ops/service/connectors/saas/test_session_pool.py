@@ -0,0 +1,64 @@
+from http.client import HTTPMessage
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from requests import Request
+from requests.cookies import extract_cookies_to_jar
+
+from fidesops.ops.core.config import config
+from fidesops.ops.service.connectors.saas.session_pool import SessionPool
+
+
+@pytest.mark.unit_saas
+class TestSessionPool:
+    @pytest.fixture(scope="function")
+    def pool(self):
+        pool = SessionPool()
+        yield pool
+        pool.clear()
+
+    def test_session_reused_for_same_connection_and_uri(self, pool):
+        session = pool.get("stripe_connector", "https://api.stripe.com")
+        assert pool.get("stripe_connector", "https://api.stripe.com") is session
+        assert pool.get("stripe_connector", "https://files.stripe.com") is not session
+        assert pool.get("other_connector", "https://api.stripe.com") is not session
+
+    def test_connection_limit(self, pool):
+        session = pool.get("stripe_connector", "https://api.stripe.com")
+        adapter = session.get_adapter("https://api.stripe.com")
+        assert adapter._pool_maxsize == config.execution.saas_max_connections_per_host
+
+    def test_cookies_not_kept(self, pool):
+        session = pool.get("stripe_connector", "https://api.stripe.com")
+        headers = HTTPMessage()
+        headers["Set-Cookie"] = "session_id=abc; Path=/"
+        # as done by Session.send for each response
+        extract_cookies_to_jar(
+            session.cookies,
+            Request("GET", "https://api.stripe.com/v1/customers").prepare(),
+            SimpleNamespace(_original_response=SimpleNamespace(msg=headers)),
+        )
+        assert len(session.cookies) == 0
+
+    def test_invalidate(self, pool):
+        session = pool.get("stripe_connector", "https://api.stripe.com")
+        other_session = pool.get("other_connector", "https://api.stripe.com")
+        with mock.patch.object(session, "close") as close:
+            pool.invalidate("stripe_connector")
+            close.assert_called_once()
+        assert pool.get("stripe_connector", "https://api.stripe.com") is not session
+        assert pool.get("other_connector", "https://api.stripe.com") is other_session
+
+    def test_idle_session_closed(self, pool):
+        session = pool.get("stripe_connector", "https://api.stripe.com")
+        idle_timeout = config.execution.connector_idle_timeout
+        with mock.patch(
+            "fidesops.ops.service.connectors.saas.session_pool.time.monotonic"
+        ) as monotonic, mock.patch.object(session, "close") as close:
+            monotonic.return_value = 10**9
+            pool.get("other_connector", "https://api.stripe.com")
+            close.assert_called_once()
+
+            monotonic.return_value = 10**9 + idle_timeout
+            assert pool.get("stripe_connector", "https://api.stripe.com") is not session
@@ -0,0 +1,111 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from fidesops.ops.core.config import config
+from fidesops.ops.service.connectors.engine_registry import EngineRegistry
+from fidesops.ops.service.connectors.sql_connector import PostgreSQLConnector
+
+
+class TestEngineRegistry:
+    @pytest.fixture(scope="function")
+    def registry(self):
+        registry = EngineRegistry()
+        yield registry
+        registry.clear()
+
+    @pytest.fixture(scope="function")
+    def create(self):
+        return mock.Mock(
+            side_effect=lambda: create_engine("sqlite://", poolclass=QueuePool)
+        )
+
+    def test_engine_reused_while_secrets_unchanged(
+        self, registry, create, connection_config
+    ):
+        engine = registry.get(connection_config, create)
+        assert registry.get(connection_config, create) is engine
+        assert create.call_count == 1
+
+    def test_secrets_change_rebuilds_engine(
+        self, db, registry, create, connection_config
+    ):
+        engine = registry.get(connection_config, create)
+
+        connection_config.secrets = {**connection_config.secrets, "port": 1234}
+        connection_config.save(db)
+
+        with mock.patch.object(engine, "dispose") as dispose:
+            assert registry.get(connection_config, create) is not engine
+            dispose.assert_called_once()
+        assert create.call_count == 2
+
+    def test_invalidate(self, registry, create, connection_config):
+        engine = registry.get(connection_config, create)
+        with mock.patch.object(engine, "dispose") as dispose:
+            registry.invalidate(connection_config.key)
+            dispose.assert_called_once()
+        assert registry.get(connection_config, create) is not engine
+
+    def test_idle_engine_disposed(
+        self, registry, create, connection_config, read_connection_config
+    ):
+        engine = registry.get(connection_config, create)
+        idle_timeout = config.execution.connector_idle_timeout
+        with mock.patch(
+            "fidesops.ops.service.connectors.engine_registry.time.monotonic"
+        ) as monotonic, mock.patch.object(engine, "dispose") as dispose:
+            monotonic.return_value = 10**9
+            registry.get(read_connection_config, create)
+            dispose.assert_called_once()
+
+            monotonic.return_value = 10**9 + idle_timeout
+            assert registry.get(connection_config, create) is not engine
+
+    def test_engine_in_use_not_disposed(
+        self, registry, create, connection_config, read_connection_config
+    ):
+        engine = registry.get(connection_config, create)
+        idle_timeout = config.execution.connector_idle_timeout
+        with mock.patch(
+            "fidesops.ops.service.connectors.engine_registry.time.monotonic"
+        ) as monotonic, mock.patch.object(engine, "dispose") as dispose:
+            monotonic.return_value = 0
+            with engine.connect():
+                # e.g. a long running query
+                monotonic.return_value = idle_timeout + 1
+                registry.get(read_connection_config, create)
+                dispose.assert_not_called()
+            assert registry.get(connection_config, create) is engine
+
+    def test_checkout_marks_engine_used(
+        self, registry, create, connection_config, read_connection_config
+    ):
+        engine = registry.get(connection_config, create)
+        idle_timeout = config.execution.connector_idle_timeout
+        with mock.patch(
+            "fidesops.ops.service.connectors.engine_registry.time.monotonic"
+        ) as monotonic, mock.patch.object(engine, "dispose") as dispose:
+            monotonic.return_value = 10**9
+            with engine.connect():
+                pass
+            monotonic.return_value = 10**9 + idle_timeout
+            registry.get(read_connection_config, create)
+            dispose.assert_not_called()
+            assert registry.get(connection_config, create) is engine
+
+
+class TestSQLConnectorEngine:
+    def test_engine_shared_between_connectors(self, connection_config):
+        connector = PostgreSQLConnector(connection_config)
+        engine = connector.client()
+        connector.close()
+
+        assert PostgreSQLConnector(connection_config).client() is engine
+
+    def test_engine_pool_options(self, connection_config):
+        engine = PostgreSQLConnector(connection_config).client()
+        assert engine.pool.size() == config.execution.connector_pool_size
+        assert engine.pool._pre_ping == config.execution.connector_pool_pre_ping
@@ -1,7 +1,10 @@
 from typing import Any, Dict, Set
+from unittest import mock
 
 import pytest
+from sqlalchemy import Table, create_engine, text
 
+from fidesops.ops.core.config import config as fides_config
 from fidesops.ops.graph.config import (
     CollectionAddress,
     FieldAddress,
@@ -17,9 +20,12 @@ from fidesops.ops.schemas.dataset import FidesopsDataset
 from fidesops.ops.schemas.masking.masking_configuration import HashMaskingConfiguration
 from fidesops.ops.schemas.masking.masking_secrets import MaskingSecretCache, SecretType
 from fidesops.ops.service.connectors.query_config import (
+    BigQueryQueryConfig,
+    MicrosoftSQLServerQueryConfig,
     MongoQueryConfig,
     SQLQueryConfig,
 )
+from fidesops.ops.service.masking.strategy.masking_strategy import MaskingStrategy
 from fidesops.ops.service.masking.strategy.masking_strategy_hash import (
     HashMaskingStrategy,
 )
@@ -166,6 +172,51 @@ class TestSQLQueryConfig:
             == "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE customer_id = :customer_id"
         )
 
+    @mock.patch.object(fides_config.execution, "sql_query_batch_size", 2)
+    def test_generate_queries_chunks_input(self):
+        config = SQLQueryConfig(payment_card_node)
+
+        assert config.chunk_input_data(
+            {"id": ["A", "B", "A", "C"], "customer_id": ["V"], "ignore_me": ["X"]}
+        ) == [{"id": ["A", "B"]}, {"id": ["C"], "customer_id": ["V"]}]
+
+        queries = config.generate_queries(
+            {"id": ["A", "B", "A", "C"], "customer_id": ["V"], "ignore_me": ["X"]}
+        )
+        assert [str(query) for query in queries] == [
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id IN :id",
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id = :id OR customer_id = :customer_id",
+        ]
+        assert set(queries[0]._bindparams["id"].value) == {"A", "B"}
+
+        assert config.generate_queries({"ignore_me": ["X"]}) == []
+
+    @mock.patch.object(fides_config.execution, "sql_query_batch_size", 3)
+    def test_generate_queries_without_tuples_chunks_input(self):
+        config = MicrosoftSQLServerQueryConfig(payment_card_node)
+
+        queries = config.generate_queries({"id": [str(i) for i in range(5)]})
+        assert [str(query) for query in queries] == [
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id IN (:id_in_stmt_generated_0, :id_in_stmt_generated_1, :id_in_stmt_generated_2)",
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id IN (:id_in_stmt_generated_0, :id_in_stmt_generated_1)",
+        ]
+
+    def test_batch_sizes_from_config(self):
+        with mock.patch.object(fides_config.execution, "sql_query_batch_size", 5000):
+            assert SQLQueryConfig(payment_card_node).query_batch_size == 5000
+            # capped under SQL Server's parameter limit
+            assert (
+                MicrosoftSQLServerQueryConfig(payment_card_node).query_batch_size
+                == 2000
+            )
+        with mock.patch.object(fides_config.execution, "sql_update_batch_size", 50):
+            assert SQLQueryConfig(payment_card_node).update_batch_size == 50
+        with mock.patch.object(fides_config.execution, "sql_update_batch_size", 5000):
+            assert (
+                MicrosoftSQLServerQueryConfig(payment_card_node).update_batch_size
+                == 2000
+            )
+
     def test_update_rule_target_fields(
         self, erasure_policy, example_datasets, connection_config
     ):
@@ -224,6 +275,101 @@ class TestSQLQueryConfig:
         assert text_clause._bindparams["name"].key == "name"
         assert text_clause._bindparams["name"].value is None  # Null masking strategy
 
+    def test_generate_update_stmts_batches_identical_masked_values(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": "John Customer",
+                "address_id": 1,
+                "id": i,
+            }
+            for i in [1, 2, 3, 3]
+        ]
+        text_clauses = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request
+        )
+        assert len(text_clauses) == 1
+        assert (
+            text_clauses[0].text
+            == """UPDATE customer SET name = :name WHERE id IN :id"""
+        )
+        assert text_clauses[0]._bindparams["name"].value is None
+        assert text_clauses[0]._bindparams["id"].expanding
+        assert text_clauses[0]._bindparams["id"].value == [1, 2, 3]
+
+        with mock.patch.object(fides_config.execution, "sql_update_batch_size", 2):
+            text_clauses = config.generate_update_stmts(
+                rows, erasure_policy, privacy_request
+            )
+        assert [text_clause.text for text_clause in text_clauses] == [
+            """UPDATE customer SET name = :name WHERE id IN :id""",
+            """UPDATE customer SET name = :name WHERE id = :id""",
+        ]
+        assert text_clauses[0]._bindparams["id"].value == [1, 2]
+        assert text_clauses[1]._bindparams["id"].value == 3
+
+    def test_update_value_maps_masks_each_field_once(
+        self, erasure_policy_string_rewrite_long, example_datasets, connection_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {"email": f"customer-{i}@example.com", "name": f"Customer {i}", "id": i}
+            for i in range(3)
+        ]
+        rows.append({"email": "customer-3@example.com", "id": 3})
+
+        with mock.patch(
+            "fidesops.ops.service.connectors.query_config.MaskingStrategy.get_strategy",
+            wraps=MaskingStrategy.get_strategy,
+        ) as get_strategy:
+            value_maps = config.update_value_maps(
+                rows, erasure_policy_string_rewrite_long, privacy_request
+            )
+            config.update_value_maps(
+                rows, erasure_policy_string_rewrite_long, privacy_request
+            )
+            assert get_strategy.call_count == 1
+
+        # Truncated to the field's length, and only set on the rows with the field
+        assert value_maps == [
+            {"name": "some rewrite value that is very long and"},
+            {"name": "some rewrite value that is very long and"},
+            {"name": "some rewrite value that is very long and"},
+            {},
+        ]
+
+        strategy = config.get_masking_strategy(
+            erasure_policy_string_rewrite_long.rules[0]
+        )
+        with mock.patch.object(strategy, "mask", wraps=strategy.mask) as mask:
+            config.update_value_maps(
+                rows, erasure_policy_string_rewrite_long, privacy_request
+            )
+            mask.assert_called_once_with(
+                ["Customer 0", "Customer 1", "Customer 2"], privacy_request.id
+            )
+
     def test_generate_update_stmt_length_truncation(
         self,
         erasure_policy_string_rewrite_long,
@@ -352,6 +498,110 @@ class TestSQLQueryConfig:
         )  # String rewrite masking strategy
 
 
+class TestBigQueryQueryConfig:
+    @pytest.fixture(scope="function")
+    def customer_node(self, example_datasets, connection_config):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+        return traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+    @pytest.fixture(scope="function")
+    def client(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.execute(
+                text("CREATE TABLE customer (id INTEGER PRIMARY KEY, name VARCHAR)")
+            )
+            for i in range(1, 4):
+                connection.execute(
+                    text("INSERT INTO customer (id, name) VALUES (:id, 'Customer')"),
+                    {"id": i},
+                )
+        yield engine
+        engine.dispose()
+
+    def test_generate_updates_reflects_table_once(
+        self, customer_node, client, erasure_policy
+    ):
+        config = BigQueryQueryConfig(customer_node)
+        rows = [
+            {"email": f"customer-{i}@example.com", "name": "Customer", "id": i}
+            for i in range(1, 4)
+        ]
+        with mock.patch(
+            "fidesops.ops.service.connectors.query_config.Table", wraps=Table
+        ) as table:
+            updates = config.generate_updates(
+                rows, erasure_policy, privacy_request, client
+            )
+            assert table.call_count == 1
+
+        assert len(updates) == 1
+        with client.connect() as connection:
+            assert connection.execute(updates[0]).rowcount == 3
+            assert connection.execute(text("SELECT name FROM customer")).fetchall() == [
+                (None,),
+                (None,),
+                (None,),
+            ]
+
+    def test_generate_updates_distinct_values(
+        self, customer_node, client, erasure_policy
+    ):
+        config = BigQueryQueryConfig(customer_node)
+        rows = [
+            {"email": f"customer-{i}@example.com", "name": "Customer", "id": i}
+            for i in range(1, 4)
+        ]
+        # e.g. hashed values
+        masked = [{"name": "masked-1"}, {"name": None}, {"name": "masked-3"}]
+        with mock.patch.object(config, "update_value_maps", return_value=masked):
+            with mock.patch.object(fides_config.execution, "sql_update_batch_size", 2):
+                updates = config.generate_updates(
+                    rows, erasure_policy, privacy_request, client
+                )
+
+        assert len(updates) == 2
+        with client.connect() as connection:
+            assert [connection.execute(update).rowcount for update in updates] == [
+                2,
+                1,
+            ]
+            assert connection.execute(
+                text("SELECT id, name FROM customer ORDER BY id")
+            ).fetchall() == [(1, "masked-1"), (2, None), (3, "masked-3")]
+
+    def test_generate_update(self, customer_node, client, erasure_policy):
+        config = BigQueryQueryConfig(customer_node)
+        update = config.generate_update(
+            {"email": "customer-1@example.com", "name": "Customer", "id": 1},
+            erasure_policy,
+            privacy_request,
+            client,
+        )
+        with client.connect() as connection:
+            assert connection.execute(update).rowcount == 1
+
+    def test_generate_updates_without_primary_key(
+        self, customer_node, client, erasure_policy
+    ):
+        config = BigQueryQueryConfig(customer_node)
+        with mock.patch(
+            "fidesops.ops.service.connectors.query_config.Table", wraps=Table
+        ) as table:
+            assert (
+                config.generate_updates(
+                    [{"name": "Customer"}], erasure_policy, privacy_request, client
+                )
+                == []
+            )
+            assert table.call_count == 0
+
+
 class TestMongoQueryConfig:
     @pytest.fixture(scope="function")
     def combined_traversal(self, connection_config, integration_mongodb_config):
@@ -1,14 +1,23 @@
+import io
 import json
+import threading
+import time
+from typing import Any
+from unittest import mock
 
 import pytest
 from requests import Response
 from sqlalchemy.orm import Session
 from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
 
-from fidesops.ops.schemas.saas.saas_config import SaaSRequest
-from fidesops.ops.schemas.saas.shared_schemas import HTTPMethod
+from fidesops.ops.common_exceptions import FidesopsException, PostProcessingException
+from fidesops.ops.schemas.saas.saas_config import ClientConfig, SaaSRequest
+from fidesops.ops.schemas.saas.shared_schemas import HTTPMethod, SaaSRequestParams
 from fidesops.ops.service.connectors import get_connector
-from fidesops.ops.service.connectors.saas_connector import SaaSConnector
+from fidesops.ops.service.connectors.saas_connector import (
+    SaaSConnector,
+    run_concurrently,
+)
 
 
 @pytest.mark.unit_saas
@@ -118,6 +127,171 @@ class TestSaasConnector:
         assert response_body == unwrapped
 
 
+@pytest.mark.unit_saas
+class TestConcurrentRequests:
+    def test_results_in_order(self):
+        def slow_double(item):
+            time.sleep(0.01 * (5 - item))
+            return item * 2
+
+        assert run_concurrently(slow_double, [1, 2, 3, 4], 4) == [2, 4, 6, 8]
+        assert run_concurrently(slow_double, [1, 2, 3, 4], 1) == [2, 4, 6, 8]
+
+    def test_concurrency_bounded(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def track(item):
+            with lock:
+                running.append(item)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(item)
+            return item
+
+        assert run_concurrently(track, list(range(10)), 3) == list(range(10))
+        assert 1 < max(max_running) <= 3
+
+    def test_first_error_in_order_raised(self):
+        def fail_odd(item):
+            if item % 2:
+                time.sleep(0.01 * (5 - item))
+                raise ValueError(item)
+            return item
+
+        with pytest.raises(ValueError) as exc:
+            run_concurrently(fail_odd, [0, 1, 2, 3], 4)
+        assert exc.value.args == (1,)
+
+    def test_max_concurrent_requests(self, saas_example_connection_config):
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        saas_request = SaaSRequest(method=HTTPMethod.GET, path="/test")
+        assert connector.get_max_concurrent_requests(saas_request) == 1
+
+        connector.saas_config.client_config.max_concurrent_requests = 5
+        assert connector.get_max_concurrent_requests(saas_request) == 5
+
+        saas_request.client_config = ClientConfig(
+            protocol="https", host="localhost", max_concurrent_requests=2
+        )
+        assert connector.get_max_concurrent_requests(saas_request) == 2
+
+
+@pytest.mark.unit_saas
+class TestStreamedResponse:
+    @pytest.fixture(scope="function")
+    def saas_request(self) -> SaaSRequest:
+        return SaaSRequest(
+            method=HTTPMethod.GET,
+            path="/conversations",
+            query_params=[{"name": "after", "value": "<after>"}],
+            data_path="data.conversations",
+            stream_response=True,
+            postprocessors=[
+                {
+                    "strategy": "filter",
+                    "configuration": {"field": "status", "value": "open"},
+                }
+            ],
+            pagination={
+                "strategy": "cursor",
+                "configuration": {"cursor_param": "after", "field": "id"},
+            },
+        )
+
+    @staticmethod
+    def streamed_response(body: Any) -> Response:
+        response = Response()
+        response.status_code = HTTP_200_OK
+        response.raw = io.BytesIO(json.dumps(body).encode())
+        return response
+
+    @mock.patch("fidesops.ops.service.connectors.saas_connector.STREAM_CHUNK_SIZE", 8)
+    @mock.patch(
+        "fidesops.ops.service.connectors.saas_connector.AuthenticatedClient.send"
+    )
+    def test_streamed_response(
+        self, send, saas_request, saas_example_connection_config
+    ):
+        conversations = [
+            {"id": 1, "status": "open"},
+            {"id": 2, "status": "closed"},
+            {"id": 3, "status": "open"},
+            {"id": 4, "status": "closed"},
+        ]
+        send.return_value = self.streamed_response(
+            {"data": {"conversations": conversations, "total": 4}}
+        )
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        prepared_request = SaaSRequestParams(
+            method=HTTPMethod.GET, path="/conversations", query_params={}
+        )
+
+        rows, next_request = connector.execute_prepared_request(
+            prepared_request, {}, saas_request
+        )
+        assert send.call_args.args[2] is True
+        assert rows == [conversations[0], conversations[2]]
+        # the cursor is read from the last conversation, not the last row
+        assert next_request.query_params == {"after": 4}
+
+        send.return_value = self.streamed_response({"data": {"conversations": []}})
+        rows, next_request = connector.execute_prepared_request(
+            prepared_request, {}, saas_request
+        )
+        assert rows == []
+        assert next_request is None
+
+    @mock.patch(
+        "fidesops.ops.service.connectors.saas_connector.AuthenticatedClient.send"
+    )
+    def test_streamed_response_invalid_json(
+        self, send, saas_request, saas_example_connection_config
+    ):
+        send.return_value = self.streamed_response({})
+        send.return_value.raw = io.BytesIO(b'{"data": {"conversations": [{"id": 1}')
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        prepared_request = SaaSRequestParams(
+            method=HTTPMethod.GET, path="/conversations", query_params={}
+        )
+        with pytest.raises(FidesopsException) as exc:
+            connector.execute_prepared_request(prepared_request, {}, saas_request)
+        assert str(exc.value) == "Unable to parse JSON response from /conversations"
+
+    @mock.patch(
+        "fidesops.ops.service.connectors.saas_connector.AuthenticatedClient.send"
+    )
+    def test_streamed_response_ignored_error(
+        self, send, saas_request, saas_example_connection_config
+    ):
+        send.return_value = self.streamed_response({"error": "not found"})
+        send.return_value.status_code = HTTP_404_NOT_FOUND
+        saas_request.ignore_errors = True
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        prepared_request = SaaSRequestParams(
+            method=HTTPMethod.GET, path="/conversations", query_params={}
+        )
+        rows, next_request = connector.execute_prepared_request(
+            prepared_request, {}, saas_request
+        )
+        assert rows == []
+        assert next_request is None
+        assert send.return_value.raw.closed
+
+    def test_streamed_items_match_response_data(self, saas_example_connection_config):
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        for data in ([{"id": 1}, {}], [{"id": 1}, None], [{"id": 1}, "text"]):
+            try:
+                expected = connector.process_response_data(data, {}, None)
+            except PostProcessingException:
+                with pytest.raises(PostProcessingException):
+                    connector.process_response_items(data, {}, None)
+            else:
+                assert connector.process_response_items(data, {}, None) == expected
+
+
 @pytest.mark.integration_saas
 @pytest.mark.integration_segment
 class TestSaaSConnectorMethods:
@@ -0,0 +1,89 @@
+from unittest import mock
+
+import pytest
+
+from fidesops.ops.graph.config import CollectionAddress
+from fidesops.ops.service.dataset_graph_cache import (
+    DatasetGraphCache,
+    build_dataset_graph,
+    get_graph_version,
+)
+
+
+class TestDatasetGraphCache:
+    @pytest.fixture(scope="function")
+    def cache(self):
+        return DatasetGraphCache()
+
+    def test_graph_reused_while_configs_unchanged(self, db, dataset_config, cache):
+        with mock.patch(
+            "fidesops.ops.service.dataset_graph_cache.build_dataset_graph",
+            wraps=build_dataset_graph,
+        ) as build:
+            graph = cache.get(db)
+            assert cache.get(db) is graph
+            assert build.call_count == 1
+
+    def test_graph_contains_dataset_collections(self, db, dataset_config, cache):
+        graph = cache.get(db)
+        assert (
+            CollectionAddress("postgres_example_subscriptions_dataset", "subscriptions")
+            in graph.nodes
+        )
+
+    def test_dataset_update_rebuilds_graph(self, db, dataset_config, cache):
+        graph = cache.get(db)
+
+        dataset = dict(dataset_config.dataset)
+        dataset["collections"] = dataset["collections"] + [
+            {
+                "name": "newsletters",
+                "fields": [{"name": "id", "data_categories": ["system.operations"]}],
+            }
+        ]
+        dataset_config.update(db=db, data={"dataset": dataset})
+
+        updated_graph = cache.get(db)
+        assert updated_graph is not graph
+        assert (
+            CollectionAddress("postgres_example_subscriptions_dataset", "newsletters")
+            in updated_graph.nodes
+        )
+
+    def test_dataset_delete_rebuilds_graph(
+        self, db, connection_config, dataset_config, cache
+    ):
+        address = CollectionAddress(
+            "postgres_example_subscriptions_dataset", "subscriptions"
+        )
+        assert address in cache.get(db).nodes
+
+        version = get_graph_version(db)
+        dataset_config.delete(db)
+        assert get_graph_version(db) != version
+        assert address not in cache.get(db).nodes
+
+    def test_connection_secrets_update_keeps_graph(
+        self, db, connection_config, dataset_config, cache
+    ):
+        graph = cache.get(db)
+        # e.g. a refreshed OAuth2 token
+        connection_config.update(
+            db=db, data={"secrets": {**connection_config.secrets, "port": 5433}}
+        )
+        assert cache.get(db) is graph
+
+    def test_saas_config_update_rebuilds_graph(
+        self, db, connection_config, dataset_config, cache
+    ):
+        version = get_graph_version(db)
+        connection_config.update(db=db, data={"saas_config": {"fides_key": "other"}})
+        assert get_graph_version(db) != version
+        graph = cache.get(db)
+        connection_config.update(db=db, data={"key": "updated_connection_key"})
+        assert cache.get(db) is not graph
+
+    def test_clear(self, db, dataset_config, cache):
+        graph = cache.get(db)
+        cache.clear()
+        assert cache.get(db) is not graph
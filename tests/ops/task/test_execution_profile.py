@@ -0,0 +1,66 @@
+from fidesops.ops.graph.config import CollectionAddress
+from fidesops.ops.task.execution_profile import (
+    CONNECTOR,
+    PRE_PROCESS,
+    NodeTimer,
+    find_critical_path,
+)
+
+
+class TestNodeTimer:
+    def test_profile(self):
+        timer = NodeTimer()
+        timer.start()
+        with timer.stage(PRE_PROCESS):
+            pass
+        with timer.stage(CONNECTOR):
+            pass
+        with timer.stage(CONNECTOR):
+            pass
+
+        profile = timer.profile([CollectionAddress("postgres", "customer")])
+        assert set(profile["stages"].keys()) == {PRE_PROCESS, CONNECTOR}
+        assert profile["total"] >= sum(profile["stages"].values())
+        assert profile["upstream"] == ["postgres:customer"]
+
+    def test_stage_timed_on_exception(self):
+        timer = NodeTimer()
+        timer.start()
+        try:
+            with timer.stage(CONNECTOR):
+                raise ValueError()
+        except ValueError:
+            pass
+        assert CONNECTOR in timer.profile([])["stages"]
+
+    def test_start_resets_stages(self):
+        timer = NodeTimer()
+        timer.start()
+        with timer.stage(CONNECTOR):
+            pass
+        timer.start()
+        assert timer.profile([])["stages"] == {}
+
+
+class TestFindCriticalPath:
+    def test_no_profiles(self):
+        assert find_critical_path({}) == (0.0, [])
+
+    def test_longest_chain_by_time(self):
+        profiles = {
+            "a:customer": {"total": 1.0, "upstream": []},
+            "a:orders": {"total": 5.0, "upstream": ["a:customer"]},
+            "a:address": {"total": 1.0, "upstream": ["a:customer"]},
+            "a:payment": {"total": 1.0, "upstream": ["a:orders", "a:address"]},
+            "b:login": {"total": 6.0, "upstream": []},
+        }
+        assert find_critical_path(profiles) == (
+            7.0,
+            ["a:customer", "a:orders", "a:payment"],
+        )
+
+    def test_upstream_without_profile_takes_no_time(self):
+        profiles = {
+            "a:orders": {"total": 2.0, "upstream": ["a:customer"]},
+        }
+        assert find_critical_path(profiles) == (2.0, ["a:orders"])
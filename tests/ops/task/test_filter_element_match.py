@@ -4,8 +4,11 @@ import pytest
 
 from fidesops.ops.graph.config import FieldPath
 from fidesops.ops.task.filter_element_match import (
+    ElementMatchedRows,
     _expand_array_paths_to_preserve,
     _remove_paths_from_row,
+    apply_element_match_mask,
+    build_element_match_mask,
     filter_element_match,
 )
 from fidesops.ops.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX
@@ -462,3 +465,61 @@ class TestExpandArrayPathsToPreserve:
             "F.1.2": [0],
             "F.1.2.0": [1, 2],
         }
+
+
+class TestElementMatchedRows:
+    """Views derived from the element match mask are the same as filtering the rows in place"""
+
+    @pytest.fixture(scope="function")
+    def query_paths(self):
+        return {
+            FieldPath("F"): ["a"],
+            FieldPath("snacks"): ["pizza"],
+            FieldPath("thread", "comment"): ["com_0002"],
+        }
+
+    @pytest.mark.parametrize("delete_elements", [True, False])
+    def test_apply_element_match_mask(self, sample_data, query_paths, delete_elements):
+        original = copy.deepcopy(sample_data)
+        mask = build_element_match_mask(sample_data, query_paths)
+
+        assert apply_element_match_mask(
+            sample_data, mask, delete_elements
+        ) == filter_element_match(
+            copy.deepcopy(sample_data), query_paths, delete_elements
+        )
+        assert sample_data == original
+
+    def test_unmasked_data_not_copied(self, sample_data, query_paths):
+        mask = build_element_match_mask(sample_data, query_paths)
+        filtered = apply_element_match_mask(sample_data, mask)
+
+        assert filtered is not sample_data
+        assert filtered["F"] is not sample_data["F"]
+        assert filtered["upgrades"] is sample_data["upgrades"]
+        assert apply_element_match_mask(sample_data, {}) is sample_data
+
+    def test_access_and_erasure_rows(self):
+        rows = [
+            {"A": ["b", "c", "d"], "E": {"F": [{"G": 1}, {"G": 2}]}},
+            {"A": ["c"], "E": {"F": []}},
+        ]
+        matched_rows = ElementMatchedRows.build(
+            rows, {FieldPath("A"): ["c"], FieldPath("E", "F", "G"): [2]}
+        )
+
+        assert matched_rows.access_rows() == [
+            {"A": ["c"], "E": {"F": [{"G": 2}]}},
+            {"A": ["c"], "E": {"F": []}},
+        ]
+        assert matched_rows.erasure_rows() == [
+            {
+                "A": [FIDESOPS_DO_NOT_MASK_INDEX, "c", FIDESOPS_DO_NOT_MASK_INDEX],
+                "E": {"F": [FIDESOPS_DO_NOT_MASK_INDEX, {"G": 2}]},
+            },
+            {"A": ["c"], "E": {"F": []}},
+        ]
+        assert matched_rows.rows[0] == {
+            "A": ["b", "c", "d"],
+            "E": {"F": [{"G": 1}, {"G": 2}]},
+        }
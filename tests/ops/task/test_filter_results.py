@@ -5,6 +5,7 @@ from bson import ObjectId
 
 from fidesops.ops.graph.config import CollectionAddress, FieldPath
 from fidesops.ops.task.filter_results import (
+    FieldPathExtractor,
     filter_data_categories,
     remove_empty_containers,
     select_and_save_field,
@@ -423,6 +424,69 @@ def test_remove_empty_containers():
     assert results == {"A": [[{"B": "C"}, {"B": "D"}, {"B": "G"}]]}
 
 
+def test_field_path_extractor():
+    """The compiled extractor selects the same data as select_and_save_field followed by remove_empty_containers"""
+    row = {
+        "A": "a",
+        "B": None,
+        "C": ["d", [], "f"],
+        "D": {"E": {"F": "f", "G": {}}, "H": [{"I": "i", "J": "j"}, {"J": "k"}]},
+        "K": [[{"L": [1, 2], "M": "m"}, {"L": [], "M": "n"}], [{"M": "o"}]],
+        "N": [{"O": {"P": "p"}}, {"O": {}}],
+        "Q": "q",
+    }
+    path_sets = [
+        [FieldPath("A")],
+        [FieldPath("A"), FieldPath("B"), FieldPath("C")],
+        [FieldPath("D", "E", "F"), FieldPath("D", "E", "G"), FieldPath("D", "H", "I")],
+        [FieldPath("D"), FieldPath("D", "H", "J")],
+        [FieldPath("K", "L"), FieldPath("K", "M")],
+        [FieldPath("K", "L")],
+        [FieldPath("N", "O"), FieldPath("N", "O", "P")],
+        [FieldPath("A", "Z"), FieldPath("Z")],
+        [],
+    ]
+    for field_paths in path_sets:
+        expected = {}
+        for field_path in field_paths:
+            select_and_save_field(expected, row, field_path)
+        remove_empty_containers(expected)
+
+        assert FieldPathExtractor(field_paths).extract(row) == expected
+
+
+def test_filter_data_categories_reuses_extractors():
+    access_request_results = {
+        "postgres_example:customer": [{"email": "customer@example.com", "id": 1}],
+        "postgres_example:employee": [{"email": "employee@example.com", "id": 2}],
+    }
+    data_category_fields = {
+        CollectionAddress("postgres_example", "customer"): {
+            "user.contact.email": [FieldPath("email")],
+            "system.operations": [FieldPath("id")],
+        },
+        CollectionAddress("postgres_example", "employee"): {
+            "user.contact.email": [FieldPath("email")],
+        },
+    }
+    extractors = {}
+
+    assert filter_data_categories(
+        access_request_results, {"user.contact"}, data_category_fields, extractors
+    ) == {
+        "postgres_example:customer": [{"email": "customer@example.com"}],
+        "postgres_example:employee": [{"email": "employee@example.com"}],
+    }
+    assert list(extractors) == [frozenset({FieldPath("email")})]
+    extractor = extractors[frozenset({FieldPath("email")})]
+
+    filter_data_categories(
+        access_request_results, {"user"}, data_category_fields, extractors
+    )
+    assert len(extractors) == 1
+    assert extractors[frozenset({FieldPath("email")})] is extractor
+
+
 def test_filter_data_categories():
     """Test different combinations of data categories to ensure the access_request_results are filtered properly"""
     access_request_results = {
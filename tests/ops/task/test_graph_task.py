@@ -1,20 +1,39 @@
+import time
+
 import dask
 import pytest
 from bson import ObjectId
 
-from fidesops.ops.graph.config import CollectionAddress, FieldPath
-from fidesops.ops.graph.graph import DatasetGraph
+from fidesops.ops.core.config import config
+from fidesops.ops.graph.config import (
+    ROOT_COLLECTION_ADDRESS,
+    TERMINATOR_ADDRESS,
+    CollectionAddress,
+    FieldPath,
+)
+from fidesops.ops.graph.graph import DatasetGraph, Node
 from fidesops.ops.graph.traversal import Traversal
 from fidesops.ops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.ops.models.policy import ActionType, Policy, Rule, RuleTarget
 from fidesops.ops.task.graph_task import (
     EMPTY_REQUEST,
     TaskResources,
+    add_after_dependencies,
     build_affected_field_logs,
     collect_queries,
+    execute_graph,
+    run_after,
+    set_upstream_dependencies,
+    start_function,
 )
 
-from ..graph.graph_test_util import MockMongoTask, MockSqlTask, erasure_policy, field
+from ..graph.graph_test_util import (
+    MockMongoTask,
+    MockSqlTask,
+    collection,
+    erasure_policy,
+    update_field,
+)
 from .traversal_data import (
     combined_mongo_postgresql_graph,
     sample_traversal,
@@ -270,11 +289,12 @@ class TestPreProcessInputData:
         ]
 
         identity_output = [{"email": "email@gmail.com"}]
-        # Typical output - project ids and organization ids would be completely independent from each other
+        # Typical output - project ids and organization ids would be completely independent from each other,
+        # and duplicate values are removed
         assert task.pre_process_input_data(identity_output, project_output) == {
             "email": ["email@gmail.com"],
             "project": ["abcde", "fghij", "klmno"],
-            "organization": ["12345", "54321", "54321"],
+            "organization": ["12345", "54321"],
             "fidesops_grouped_inputs": [],
         }
 
@@ -443,6 +463,119 @@ def test_mongo_dry_run_queries(db) -> None:
     )
 
 
+class TestAddAfterDependencies:
+    def test_add_after_dependencies(self, db) -> None:
+        traversal = sample_traversal()
+        resources = TaskResources(EMPTY_REQUEST, Policy(), connection_configs, db)
+        env = {
+            address: MockSqlTask(tn, resources)
+            for address, tn in traversal.traversal_node_dict.items()
+        }
+        dsk = {k: (t.access_request, *t.input_keys) for k, t in env.items()}
+
+        add_after_dependencies(dsk, env)
+
+        customer = CollectionAddress("mysql", "Customer")
+        order = CollectionAddress("postgres", "Order")
+        for address in [
+            CollectionAddress("mysql", "Address"),
+            CollectionAddress("mssql", "Address"),
+        ]:
+            task = env[address]
+            assert dsk[address] == (
+                run_after,
+                (task.access_request, *task.input_keys),
+                customer,
+                order,
+            )
+
+        # Nodes without "after" constraints are unchanged
+        assert dsk[customer] == (
+            env[customer].access_request,
+            *env[customer].input_keys,
+        )
+
+    def test_add_dataset_after_dependencies(self, db) -> None:
+        traversal = sample_traversal()
+        resources = TaskResources(EMPTY_REQUEST, Policy(), connection_configs, db)
+        env = {
+            address: MockSqlTask(tn, resources)
+            for address, tn in traversal.traversal_node_dict.items()
+        }
+        user = CollectionAddress("mysql", "User")
+        env[user].traversal_node.node.dataset.after.add("postgres")
+        dsk = {k: (t.access_request,) for k, t in env.items()}
+
+        add_after_dependencies(dsk, env)
+
+        assert dsk[user] == (
+            run_after,
+            (env[user].access_request,),
+            CollectionAddress("postgres", "Order"),
+        )
+
+
+class TestSetUpstreamDependencies:
+    def test_set_upstream_dependencies(self, db) -> None:
+        traversal = sample_traversal()
+        resources = TaskResources(EMPTY_REQUEST, Policy(), connection_configs, db)
+        env = {
+            address: MockSqlTask(tn, resources)
+            for address, tn in traversal.traversal_node_dict.items()
+            if address != ROOT_COLLECTION_ADDRESS
+        }
+        dsk = {k: (t.access_request, *t.input_keys) for k, t in env.items()}
+        dsk[ROOT_COLLECTION_ADDRESS] = (start_function([traversal.seed_data]),)
+        add_after_dependencies(dsk, env)
+
+        set_upstream_dependencies(dsk, env)
+
+        address = env[CollectionAddress("mysql", "Address")]
+        assert address.upstream == sorted(
+            {
+                *address.input_keys,
+                CollectionAddress("mysql", "Customer"),
+                CollectionAddress("postgres", "Order"),
+            }
+        )
+        # The root collection is never recorded as upstream
+        for task in env.values():
+            assert ROOT_COLLECTION_ADDRESS not in task.upstream
+
+
+class TestExecuteGraph:
+    @pytest.fixture(scope="function")
+    def max_workers(self):
+        original_value = config.execution.task_max_workers
+        config.execution.task_max_workers = 3
+        yield
+        config.execution.task_max_workers = original_value
+
+    def test_execute_graph_runs_independent_nodes_concurrently(self, max_workers):
+        first = CollectionAddress("a", "first")
+        second = CollectionAddress("a", "second")
+        third = CollectionAddress("a", "third")
+        completed = []
+
+        def node(name, *_inputs):
+            time.sleep(0.2)
+            completed.append(name)
+            return [name]
+
+        dsk = {
+            first: (node, "first"),
+            second: (run_after, (node, "second"), first),
+            third: (node, "third"),
+            TERMINATOR_ADDRESS: (lambda *values: values, first, second, third),
+        }
+
+        start = time.time()
+        assert execute_graph(dsk) == (["first"], ["second"], ["third"])
+        # first and third run in parallel, second waits for first
+        assert time.time() - start < 0.6
+        assert completed.index("second") > completed.index("first")
+
+
 class TestBuildAffectedFieldLogs:
     @pytest.fixture(scope="function")
     def node_fixture(self):
@@ -453,21 +586,23 @@ class TestBuildAffectedFieldLogs:
         ]
         dataset = postgres_order_node.node.dataset
 
-        field([dataset], "postgres", "Order", "customer_id").data_categories = ["A"]
-        field([dataset], "postgres", "Order", "shipping_address_id").data_categories = [
-            "B"
-        ]
-        field([dataset], "postgres", "Order", "order_id").data_categories = ["B"]
-        field([dataset], "postgres", "Order", "billing_address_id").data_categories = [
-            "C"
-        ]
-        return postgres_order_node
+        update_field(
+            [dataset], "postgres", "Order", "customer_id", data_categories=["A"]
+        )
+        update_field(
+            [dataset], "postgres", "Order", "shipping_address_id", data_categories=["B"]
+        )
+        update_field([dataset], "postgres", "Order", "order_id", data_categories=["B"])
+        update_field(
+            [dataset], "postgres", "Order", "billing_address_id", data_categories=["C"]
+        )
+        return Node(dataset, collection([dataset], postgres_order_node.address))
 
     def test_build_affected_field_logs(self, node_fixture):
         policy = erasure_policy("A", "B")
 
         formatted_for_logs = build_affected_field_logs(
-            node_fixture.node, policy, action_type=ActionType.erasure
+            node_fixture, policy, action_type=ActionType.erasure
         )
 
         # Only fields for data categories A and B which were specified on the Policy, made it to the logs for this node
@@ -492,7 +627,7 @@ class TestBuildAffectedFieldLogs:
     def test_build_affected_field_logs_no_data_categories_on_policy(self, node_fixture):
         no_categories_policy = erasure_policy()
         formatted_for_logs = build_affected_field_logs(
-            node_fixture.node,
+            node_fixture,
             no_categories_policy,
             action_type=ActionType.erasure,
         )
@@ -502,7 +637,7 @@ class TestBuildAffectedFieldLogs:
     def test_build_affected_field_logs_no_matching_data_categories(self, node_fixture):
         d_categories_policy = erasure_policy("D")
         formatted_for_logs = build_affected_field_logs(
-            node_fixture.node,
+            node_fixture,
             d_categories_policy,
             action_type=ActionType.erasure,
         )
@@ -514,7 +649,7 @@ class TestBuildAffectedFieldLogs:
     ):
         policy = erasure_policy("A", "B")
         formatted_for_logs = build_affected_field_logs(
-            node_fixture.node,
+            node_fixture,
             policy,
             action_type=ActionType.access,
         )
@@ -544,7 +679,7 @@ class TestBuildAffectedFieldLogs:
         ]
 
         formatted_for_logs = build_affected_field_logs(
-            node_fixture.node, policy, action_type=ActionType.erasure
+            node_fixture, policy, action_type=ActionType.erasure
         )
 
         # No duplication of the matching customer_id field, even though multiple rules targeted data category A
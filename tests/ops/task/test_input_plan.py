@@ -0,0 +1,119 @@
+from fidesops.ops.graph.config import (
+    ROOT_COLLECTION_ADDRESS,
+    CollectionAddress,
+    FieldPath,
+)
+from fidesops.ops.graph.graph import Edge
+from fidesops.ops.task.consolidate_query_matches import consolidate_query_matches
+from fidesops.ops.task.input_plan import NodeInputPlan
+
+customer = CollectionAddress("postgres", "customer")
+orders = CollectionAddress("postgres", "orders")
+node = CollectionAddress("postgres", "payment")
+
+
+def edge(upstream: CollectionAddress, foreign: FieldPath, local: str) -> Edge:
+    return Edge(
+        upstream.field_address(foreign), node.field_address(FieldPath.parse(local))
+    )
+
+
+def test_consolidate_matches_consolidate_query_matches():
+    paths = [
+        FieldPath("id"),
+        FieldPath("contact", "email"),
+        FieldPath("contact", "phone", "number"),
+        FieldPath("addresses", "city"),
+        FieldPath("tags"),
+        FieldPath("missing", "value"),
+    ]
+    rows = [
+        {
+            "id": 1,
+            "contact": {"email": "a@example.com", "phone": "555-5555"},
+            "addresses": [{"city": "Lima"}, {"city": "Oslo", "zip": "0150"}, []],
+            "tags": [["x", "y"], "z"],
+        },
+        {"id": None, "contact": {"phone": {"number": ["1", "2"]}}, "tags": {}},
+    ]
+    plan = NodeInputPlan(
+        [customer],
+        {
+            customer: [
+                edge(customer, path, f"local_{i}") for i, path in enumerate(paths)
+            ]
+        },
+        set(),
+        False,
+    )
+
+    for row in rows:
+        _, ungrouped = plan.consolidate([row])
+        for i, path in enumerate(paths):
+            expected = consolidate_query_matches(row, path)
+            assert ungrouped.get(f"local_{i}", []) == expected
+
+
+def test_consolidate_deduplicates_values():
+    plan = NodeInputPlan(
+        [customer, orders],
+        {
+            customer: [edge(customer, FieldPath("id"), "customer_id")],
+            orders: [
+                edge(orders, FieldPath("customer_id"), "customer_id"),
+                edge(orders, FieldPath("id"), "order_id"),
+            ],
+        },
+        set(),
+        False,
+    )
+    grouped, ungrouped = plan.consolidate(
+        [{"id": 1}, {"id": 2}],
+        [{"id": 10, "customer_id": 2}, {"id": 11, "customer_id": 3}],
+    )
+    assert ungrouped == {
+        "fidesops_grouped_inputs": [],
+        "customer_id": [1, 2, 3],
+        "order_id": [10, 11],
+    }
+    assert grouped == ungrouped
+    assert plan.field_paths["customer_id"] == FieldPath("customer_id")
+
+
+def test_consolidate_grouped_and_ungrouped():
+    plan = NodeInputPlan(
+        [ROOT_COLLECTION_ADDRESS, orders],
+        {
+            ROOT_COLLECTION_ADDRESS: [
+                edge(ROOT_COLLECTION_ADDRESS, FieldPath("email"), "email")
+            ],
+            orders: [
+                edge(orders, FieldPath("id"), "order_id"),
+                edge(orders, FieldPath("shipping", "id"), "shipping_id"),
+                edge(orders, FieldPath("total"), "total"),
+            ],
+        },
+        {"email", "order_id", "shipping_id"},
+        True,
+    )
+    grouped, ungrouped = plan.consolidate(
+        [{"email": "customer@example.com"}],
+        [
+            {"id": 1, "shipping": {"id": "a"}, "total": 5},
+            {"id": 2, "shipping": {"id": "a"}, "total": 5},
+        ],
+    )
+    assert grouped == {
+        "fidesops_grouped_inputs": [
+            {"order_id": [1], "shipping_id": ["a"], "email": ["customer@example.com"]},
+            {"order_id": [2], "shipping_id": ["a"], "email": ["customer@example.com"]},
+        ],
+        "total": [5],
+    }
+    assert ungrouped == {
+        "fidesops_grouped_inputs": [],
+        "email": ["customer@example.com"],
+        "order_id": [1, 2],
+        "shipping_id": ["a"],
+        "total": [5],
+    }
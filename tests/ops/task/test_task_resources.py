@@ -1,4 +1,12 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fidesops.ops.core.config import config
 from fidesops.ops.task.task_resources import TaskResources
+from fidesops.ops.util.encryption import secrets_util
 
 
 class TestTaskResources:
@@ -42,3 +50,94 @@ class TestTaskResources:
             "manual_example:filing-cabinet": 2,
             "manual_example:storage-unit": 3,
         }
+
+    def test_masking_secret_store_registered_while_open(
+        self, db, privacy_request, policy
+    ):
+        with TaskResources(privacy_request, policy, [], db) as resources:
+            assert (
+                secrets_util._masking_secret_stores[privacy_request.id]
+                is resources.masking_secrets
+            )
+        assert privacy_request.id not in secrets_util._masking_secret_stores
+
+
+class TestConcurrentTaskResources:
+    @pytest.fixture(scope="function")
+    def max_workers(self):
+        original_values = (
+            config.execution.task_max_workers,
+            config.execution.task_max_workers_per_connection,
+        )
+        config.execution.task_max_workers = 4
+        config.execution.task_max_workers_per_connection = 2
+        yield
+        (
+            config.execution.task_max_workers,
+            config.execution.task_max_workers_per_connection,
+        ) = original_values
+
+    @staticmethod
+    def max_concurrent_slots(resources: TaskResources, key: str) -> int:
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def node(_):
+            with resources.connection_slot(key):
+                with lock:
+                    running.append(1)
+                    max_running.append(len(running))
+                time.sleep(0.05)
+                with lock:
+                    running.pop()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(node, range(6)))
+        return max(max_running)
+
+    def test_connection_slot(
+        self,
+        db,
+        privacy_request,
+        policy,
+        connection_config,
+        saas_example_connection_config,
+        max_workers,
+    ):
+        with TaskResources(
+            privacy_request,
+            policy,
+            [connection_config, saas_example_connection_config],
+            db,
+        ) as resources:
+            assert self.max_concurrent_slots(resources, connection_config.key) == 2
+            # SaaS connectors hold per-request state, so they're never shared
+            assert (
+                self.max_concurrent_slots(resources, saas_example_connection_config.key)
+                == 1
+            )
+            # unknown connections aren't capped
+            assert self.max_concurrent_slots(resources, "unknown") == 4
+
+    def test_get_session_per_thread(self, db, privacy_request, policy, max_workers):
+        with TaskResources(privacy_request, policy, [], db) as resources:
+            barrier = threading.Barrier(2)
+
+            def thread_sessions(_):
+                # so the two calls run on different worker threads
+                barrier.wait()
+                return resources.get_session(), resources.get_session()
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                sessions = list(pool.map(thread_sessions, range(2)))
+            (first, first_again), (second, second_again) = sessions
+            assert first is first_again
+            assert second is second_again
+            assert first is not second
+            assert db not in (first, second)
+            assert first.get_bind() is db.get_bind()
+
+    def test_get_session_single_worker(self, db, privacy_request, policy):
+        with TaskResources(privacy_request, policy, [], db) as resources:
+            assert resources.get_session() is db
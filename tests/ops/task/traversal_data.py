@@ -31,16 +31,24 @@ def integration_db_mongo_graph(
     db_name: str, connection_key: FidesOpsKey
 ) -> Tuple[Dataset, DatasetGraph]:
     dataset = integration_db_dataset(db_name, connection_key)
-    for coll in dataset.collections:
-        id_field = next(f for f in coll.fields if f.name == "id")
-        id_field.primary_key = False
-        coll.fields.append(
-            ScalarField(
-                name="_id",
-                data_type_converter=DataType.object_id.value,
-                primary_key=True,
-            )
+    dataset.collections = [
+        coll.copy(
+            update={
+                "fields": [
+                    f.copy(update={"primary_key": False}) if f.name == "id" else f
+                    for f in coll.fields
+                ]
+                + [
+                    ScalarField(
+                        name="_id",
+                        data_type_converter=DataType.object_id.value,
+                        primary_key=True,
+                    )
+                ]
+            }
         )
+        for coll in dataset.collections
+    ]
     return dataset, DatasetGraph(dataset)
 
 
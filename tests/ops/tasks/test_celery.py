@@ -20,6 +20,11 @@ def test_celery_default_config() -> None:
     assert celery_app.conf["result_backend"] == config.redis.connection_url
     assert celery_app.conf["event_queue_prefix"] == "fidesops_worker"
     assert celery_app.conf["task_default_queue"] == "fidesops"
+    assert celery_app.conf["redis_max_connections"] == config.redis.max_connections
+    assert celery_app.conf["broker_transport_options"] == {
+        "max_connections": config.redis.max_connections,
+        "health_check_interval": config.redis.health_check_interval,
+    }
 
 
 def test_celery_config_override() -> None:
@@ -1,16 +1,26 @@
+from datetime import datetime, timedelta
+
+import pytest
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
+from fidesops.ops.core.config import config
 from fidesops.ops.models.privacy_request import PrivacyRequestStatus
 from fidesops.ops.schemas.storage.storage import StorageDetails
 from fidesops.ops.service.privacy_request.request_runner_service import (
     initiate_paused_privacy_request_followup,
 )
+from fidesops.ops.tasks.scheduled import tasks
 from fidesops.ops.tasks.scheduled.scheduler import scheduler
 from fidesops.ops.tasks.scheduled.tasks import (
+    CACHE_PURGE_TASK,
     ONETRUST_INTAKE_TASK,
+    _purge_privacy_request_caches,
+    initiate_scheduled_cache_purge,
     initiate_scheduled_request_intake,
 )
+from fidesops.ops.util.cache import get_cache, get_identity_cache_key
 
 
 def test_initiate_scheduled_request_intake(storage_config_onetrust) -> None:
@@ -44,3 +54,73 @@ def test_initiate_scheduled_paused_privacy_request_followup(
     job = scheduler.get_job(job_id=privacy_request.id)
     assert job is not None
     assert isinstance(job.trigger, DateTrigger)
+
+
+def test_initiate_scheduled_cache_purge() -> None:
+    initiate_scheduled_cache_purge()
+    assert scheduler.running
+    job = scheduler.get_job(job_id=CACHE_PURGE_TASK)
+    assert job is not None
+    assert isinstance(job.trigger, IntervalTrigger)
+    assert (
+        job.trigger.interval.total_seconds()
+        == config.redis.cache_purge_interval_seconds
+    )
+
+
+def test_initiate_scheduled_cache_purge_disabled() -> None:
+    initiate_scheduled_cache_purge()
+    original_interval = config.redis.cache_purge_interval_seconds
+    config.redis.cache_purge_interval_seconds = 0
+    try:
+        initiate_scheduled_cache_purge()
+        assert scheduler.get_job(job_id=CACHE_PURGE_TASK) is None
+    finally:
+        config.redis.cache_purge_interval_seconds = original_interval
+
+
+@pytest.fixture(scope="function")
+def first_cache_purge(monkeypatch):
+    monkeypatch.setattr(tasks, "_last_cache_purge", None)
+
+
+def test_purge_privacy_request_caches(db, privacy_request, first_cache_purge) -> None:
+    cache = get_cache()
+    identity_key = get_identity_cache_key(privacy_request.id, "email")
+    privacy_request.create_cache_index()
+    cache.set_with_autoexpire(
+        identity_key, "customer-1@example.com", index=privacy_request.cache_index
+    )
+
+    _purge_privacy_request_caches()
+    assert cache.get(identity_key) == "customer-1@example.com"
+
+    privacy_request.status = PrivacyRequestStatus.complete
+    privacy_request.save(db=db)
+    _purge_privacy_request_caches()
+    assert cache.get(identity_key) is None
+    assert not cache.exists(privacy_request.cache_index)
+
+
+def test_purge_privacy_request_caches_since_last_purge(
+    db, privacy_request, first_cache_purge
+) -> None:
+    cache = get_cache()
+    identity_key = get_identity_cache_key(privacy_request.id, "email")
+    privacy_request.create_cache_index()
+    cache.set_with_autoexpire(
+        identity_key, "customer-1@example.com", index=privacy_request.cache_index
+    )
+    privacy_request.status = PrivacyRequestStatus.complete
+    privacy_request.save(db=db)
+
+    # finished well before the previous purge, so it was already purged
+    tasks._last_cache_purge = datetime.utcnow() + timedelta(hours=1)
+    _purge_privacy_request_caches()
+    assert cache.get(identity_key) == "customer-1@example.com"
+    assert tasks._last_cache_purge < datetime.utcnow() + timedelta(minutes=1)
+
+    # finished within the margin before the previous purge
+    tasks._last_cache_purge = datetime.utcnow() + timedelta(minutes=1)
+    _purge_privacy_request_caches()
+    assert cache.get(identity_key) is None
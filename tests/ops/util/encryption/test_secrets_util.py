@@ -11,7 +11,8 @@ from fidesops.ops.service.masking.strategy.masking_strategy_aes_encrypt import (
 from fidesops.ops.service.masking.strategy.masking_strategy_hmac import (
     HmacMaskingStrategy,
 )
-from fidesops.ops.util.encryption.secrets_util import SecretsUtil
+from fidesops.ops.util.cache import get_cache, get_masking_secret_cache_key
+from fidesops.ops.util.encryption.secrets_util import MaskingSecretStore, SecretsUtil
 
 from ...test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
 
@@ -90,3 +91,53 @@ def test_build_masking_secrets_for_cache() -> None:
         masking_meta
     )
     assert len(result) == 2
+
+
+def test_get_secret_from_secret_store() -> None:
+    masking_meta: Dict[
+        SecretType, MaskingSecretMeta
+    ] = HmacMaskingStrategy._build_masking_secret_meta()
+    for secret_type, secret in [(SecretType.key, "test_key"), (SecretType.salt, "s")]:
+        cache_secret(
+            MaskingSecretCache[str](
+                secret=secret,
+                masking_strategy=HmacMaskingStrategy.name,
+                secret_type=secret_type,
+            ),
+            request_id,
+        )
+
+    store = MaskingSecretStore(request_id)
+    SecretsUtil.register_secret_store(store)
+    try:
+        assert (
+            SecretsUtil.get_or_generate_secret(
+                request_id, SecretType.key, masking_meta[SecretType.key]
+            )
+            == "test_key"
+        )
+
+        # All of the request's secrets were loaded together, and are read from the store from now on
+        get_cache().delete(
+            *[
+                get_masking_secret_cache_key(
+                    request_id, HmacMaskingStrategy.name, secret_type
+                )
+                for secret_type in [SecretType.key, SecretType.salt]
+            ]
+        )
+        assert (
+            SecretsUtil.get_or_generate_secret(
+                request_id, SecretType.salt, masking_meta[SecretType.salt]
+            )
+            == "s"
+        )
+    finally:
+        SecretsUtil.unregister_secret_store(store)
+
+    assert (
+        SecretsUtil.get_or_generate_secret(
+            request_id, SecretType.key, masking_meta[SecretType.key]
+        )
+        is None
+    )
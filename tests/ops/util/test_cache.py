@@ -1,8 +1,25 @@
+import base64
+import pickle
 import random
+import threading
 from typing import Any, List
+from unittest import mock
 
+import pytest
+from redis.exceptions import ConnectionError as RedisClientConnectionError
+
+from fidesops.ops.common_exceptions import RedisConnectionError
 from fidesops.ops.core.config import config
-from fidesops.ops.util.cache import FidesopsRedis
+from fidesops.ops.util.cache import (
+    CODECS,
+    Base64PickleCodec,
+    FidesopsRedis,
+    check_cache_connection,
+    get_async_task_tracking_cache_key,
+    get_cache,
+    get_privacy_request_cache_index,
+    purge_privacy_request_caches,
+)
 
 from ..fixtures.application_fixtures import faker
 
@@ -12,6 +29,52 @@ def test_get_cache(cache: FidesopsRedis) -> None:
     assert callable(cache.set_with_autoexpire)
 
 
+def test_get_cache_pings_only_on_connect() -> None:
+    with mock.patch("fidesops.ops.util.cache._connection", None), mock.patch.object(
+        FidesopsRedis, "ping", return_value=True
+    ) as ping:
+        cache = get_cache()
+        assert get_cache() is cache
+        assert ping.call_count == 1
+
+        pool = cache.connection_pool
+        assert pool.max_connections == config.redis.max_connections
+        assert pool.timeout == config.redis.connection_pool_timeout
+        assert (
+            pool.connection_kwargs["health_check_interval"]
+            == config.redis.health_check_interval
+        )
+
+
+def test_get_cache_waits_for_free_connection() -> None:
+    with mock.patch("fidesops.ops.util.cache._connection", None), mock.patch.object(
+        config.redis, "max_connections", 1
+    ):
+        cache = get_cache()
+        pool = cache.connection_pool
+        in_use = pool.get_connection("_")
+        release = threading.Timer(0.2, pool.release, [in_use])
+        release.start()
+        # all connections are in use, so this waits for one to be released
+        assert cache.ping()
+        release.join()
+
+        in_use = pool.get_connection("_")
+        with mock.patch.object(pool, "timeout", 0.1):
+            with pytest.raises(RedisClientConnectionError):
+                cache.ping()
+        pool.release(in_use)
+        pool.disconnect()
+
+
+def test_check_cache_connection_unreachable(cache: FidesopsRedis) -> None:
+    with mock.patch.object(
+        cache, "ping", side_effect=RedisClientConnectionError("Connection refused")
+    ):
+        with pytest.raises(RedisConnectionError):
+            check_cache_connection()
+
+
 def test_cache_set_with_autoexpire(cache: FidesopsRedis) -> None:
     key = "a_key"
     value = "a_value"
@@ -54,6 +117,44 @@ def test_encode_decode() -> None:
     assert FidesopsRedis.decode_obj(None) is None
 
 
+def test_decode_legacy_encoded_obj() -> None:
+    test_obj = CacheTestObject(random.random(), faker.name())
+    legacy_encoded = base64.b64encode(pickle.dumps(test_obj))
+    assert FidesopsRedis.decode_obj(legacy_encoded) == test_obj
+    assert FidesopsRedis.decode_obj(legacy_encoded.decode()) == test_obj
+    assert (
+        FidesopsRedis.encode_obj(test_obj, codec=CODECS[Base64PickleCodec.version])
+        == legacy_encoded
+    )
+
+
+def test_encode_compresses_large_objects() -> None:
+    rows = [
+        {"id": i, "email": f"customer-{i}@example.com", "name": "John Customer"}
+        for i in range(1000)
+    ]
+    encoded = FidesopsRedis.encode_obj(rows)
+    assert encoded.startswith(b"2:z")
+    assert len(encoded) < len(base64.b64encode(pickle.dumps(rows))) / 4
+    assert FidesopsRedis.decode_obj(encoded) == rows
+
+    small = FidesopsRedis.encode_obj(rows[0])
+    assert small.startswith(b"2:p")
+    assert FidesopsRedis.decode_obj(small) == rows[0]
+
+
+def test_get_encoded_objects_by_prefix_mixed_codecs(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    cache.set_encoded_object(f"{prefix}new", {"id": 1})
+    cache.set_with_autoexpire(
+        f"EN_{prefix}legacy", base64.b64encode(pickle.dumps({"id": 2}))
+    )
+    assert cache.get_encoded_objects_by_prefix(prefix) == {
+        f"EN_{prefix}new": {"id": 1},
+        f"EN_{prefix}legacy": {"id": 2},
+    }
+
+
 def test_scan(cache: FidesopsRedis) -> List:
     test_key = random.random()
     prefix = f"redis_key_{test_key}_"
@@ -68,6 +169,117 @@ def test_scan(cache: FidesopsRedis) -> List:
     keys = cache.get_keys_by_prefix(f"EN_{prefix}", random.randint(10, 100))
     assert len(keys) == 100
 
-    cache.delete_keys_by_prefix(f"EN_{prefix}")
+    with mock.patch.object(cache, "keys") as keys_command:
+        assert cache.delete_keys_by_prefix(f"EN_{prefix}", chunk_size=30) == 100
+        assert not keys_command.called
     keys = cache.get_keys_by_prefix(f"EN_{prefix}")
     assert len(keys) == 0
+
+
+def test_delete_keys_in_batches(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    keys = [f"{prefix}{i}" for i in range(25)]
+    cache.set_many_with_autoexpire({key: "value" for key in keys})
+
+    with mock.patch.object(cache, "unlink", wraps=cache.unlink) as unlink:
+        assert cache.delete_keys(keys + [f"{prefix}missing"], chunk_size=10) == 25
+        assert unlink.call_count == 3
+    assert not cache.exists(*keys)
+
+
+def test_purge_privacy_request_caches(cache: FidesopsRedis) -> None:
+    indexed_id = f"pri_{random.random()}"
+    unindexed_id = f"pri_{random.random()}"
+    index = get_privacy_request_cache_index(indexed_id)
+    cache.create_index(index)
+    cache.set_many_with_autoexpire(
+        {f"id-{indexed_id}-identity-email": "a", f"id-{indexed_id}-drp-email": "b"},
+        index=index,
+    )
+    cache.set(get_async_task_tracking_cache_key(indexed_id), "task")
+    cache.set_with_autoexpire(f"id-{unindexed_id}-identity-email", "c")
+
+    with mock.patch.object(cache, "scan") as scan, mock.patch.object(
+        cache, "keys"
+    ) as keys_command:
+        assert purge_privacy_request_caches([indexed_id, unindexed_id]) == 4
+        assert not scan.called
+        assert not keys_command.called
+
+    assert cache.get_keys_by_prefix(f"id-{indexed_id}-") == []
+    # Requests cached before indexing are left to expire
+    assert cache.get(f"id-{unindexed_id}-identity-email") == "c"
+    cache.delete(f"id-{unindexed_id}-identity-email")
+
+
+class TestCacheIndex:
+    @pytest.fixture(scope="function")
+    def index(self, cache: FidesopsRedis):
+        index = f"test-index-{random.random()}"
+        cache.create_index(index)
+        yield index
+        cache.delete(index)
+
+    def test_indexed_keys_read_without_scan(self, cache: FidesopsRedis, index) -> None:
+        prefix = f"redis_key_{random.random()}_"
+        cache.set_encoded_object(f"{prefix}a", {"id": 1}, index=index)
+        cache.set_many_with_autoexpire(
+            {f"{prefix}b": "b", f"{prefix}c": "c", f"other_{prefix}": "d"},
+            index=index,
+        )
+        assert cache.ttl(index) > 0
+
+        with mock.patch.object(cache, "scan") as scan:
+            assert cache.get_encoded_objects_by_prefix(prefix, index=index) == {
+                f"EN_{prefix}a": {"id": 1}
+            }
+            assert sorted(cache.get_keys_by_prefix(prefix, index=index)) == [
+                f"{prefix}b",
+                f"{prefix}c",
+            ]
+            assert not scan.called
+
+    def test_keys_indexed_without_script_check(
+        self, cache: FidesopsRedis, index
+    ) -> None:
+        prefix = f"redis_key_{random.random()}_"
+        cache.set_many_with_autoexpire({f"{prefix}a": "a"}, index=index)
+        with mock.patch(
+            "redis.client.Pipeline.immediate_execute_command"
+        ) as immediate_execute:
+            assert cache.set_many_with_autoexpire(
+                {f"{prefix}b": "b", f"{prefix}c": "c"}, index=index
+            ) == [True, True]
+            assert not immediate_execute.called
+        assert sorted(cache.get_keys_by_prefix(prefix, index=index)) == [
+            f"{prefix}a",
+            f"{prefix}b",
+            f"{prefix}c",
+        ]
+
+    def test_keys_indexed_after_script_flush(self, cache: FidesopsRedis, index) -> None:
+        prefix = f"redis_key_{random.random()}_"
+        cache.script_flush()
+        assert cache.set_with_autoexpire(f"{prefix}a", "a", index=index)
+        assert cache.get_keys_by_prefix(prefix, index=index) == [f"{prefix}a"]
+
+    def test_deleted_keys_skipped(self, cache: FidesopsRedis, index) -> None:
+        prefix = f"redis_key_{random.random()}_"
+        cache.set_encoded_object(f"{prefix}a", 1, index=index)
+        cache.set_encoded_object(f"{prefix}b", 2, index=index)
+        cache.delete(f"EN_{prefix}a")
+
+        assert cache.get_encoded_objects_by_prefix(prefix, index=index) == {
+            f"EN_{prefix}b": 2
+        }
+
+    def test_index_not_created_falls_back_to_scan(self, cache: FidesopsRedis) -> None:
+        index = f"test-index-{random.random()}"
+        prefix = f"redis_key_{random.random()}_"
+        cache.set_encoded_object(f"{prefix}a", 1, index=index)
+
+        assert not cache.exists(index)
+        assert cache.get_indexed_keys(index) is None
+        assert cache.get_encoded_objects_by_prefix(prefix, index=index) == {
+            f"EN_{prefix}a": 1
+        }
@@ -5,6 +5,7 @@ from fidesops.ops.util.collection_util import (
     filter_nonempty_values,
     merge_dicts,
     partition,
+    unique_rows,
 )
 
 
@@ -47,3 +48,22 @@ def test_filter_nonempty_values() -> None:
     assert filter_nonempty_values({"B": None}) == {}
     assert filter_nonempty_values({}) == {}
     assert filter_nonempty_values(None) == {}
+
+
+def test_unique_rows() -> None:
+    rows = [
+        {"id": 1, "tags": ["a"]},
+        {"id": 2, "tags": ["b"]},
+        {"tags": ["a"], "id": 1},
+        {"id": 1, "tags": ["c"]},
+    ]
+    assert unique_rows(rows) == [
+        {"id": 1, "tags": ["a"]},
+        {"id": 2, "tags": ["b"]},
+        {"id": 1, "tags": ["c"]},
+    ]
+    assert unique_rows([{"id": None}, {"id": None, "tags": None}]) == [
+        {"id": None},
+        {"id": None, "tags": None},
+    ]
+    assert unique_rows([]) == []
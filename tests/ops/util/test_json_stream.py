@@ -0,0 +1,59 @@
+import json
+from typing import Any, List
+
+import pytest
+
+from fidesops.ops.util.json_stream import JSONItemStream
+
+
+def chunked(body: Any, size: int) -> List[bytes]:
+    raw = json.dumps(body, ensure_ascii=False, indent=2).encode()
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+def test_items_at_data_path(chunk_size):
+    body = {
+        "meta": {"next": "cursor"},
+        "data": {
+            "items": [{"id": 1, "name": "Zoë ☃"}, {"id": 22222}, 3.5e10, None, True]
+        },
+        "total": 5,
+    }
+    stream = JSONItemStream(chunked(body, chunk_size), "data.items")
+    assert list(stream) == body["data"]["items"]
+    assert stream.skeleton == {
+        "meta": {"next": "cursor"},
+        "data": {"items": [True]},
+        "total": 5,
+    }
+
+
+def test_top_level_array():
+    body = [{"id": i} for i in range(20)]
+    stream = JSONItemStream(chunked(body, 5))
+    assert list(stream) == body
+    assert stream.skeleton == [{"id": 19}]
+
+
+def test_array_index_in_data_path():
+    body = {"pages": [{"items": [1, 2]}, {"items": [3, 4]}]}
+    assert list(JSONItemStream(chunked(body, 4), "pages.1.items")) == [3, 4]
+    assert list(JSONItemStream(chunked(body, 4), "pages[0].items")) == [1, 2]
+
+
+def test_value_at_data_path():
+    body = {"data": {"user": {"id": 1}}, "null": None, "empty": {}, "list": []}
+    assert list(JSONItemStream(chunked(body, 4), "data.user")) == [{"id": 1}]
+    assert list(JSONItemStream(chunked(body, 4), "null")) == []
+    assert list(JSONItemStream(chunked(body, 4), "empty")) == []
+    assert list(JSONItemStream(chunked(body, 4), "list")) == []
+    assert list(JSONItemStream(chunked(body, 4), "missing.path")) == []
+
+
+@pytest.mark.parametrize(
+    "raw", [b"", b'{"data": [1, 2', b'{"data": [1]} {}', b'{"data": [1 2]}']
+)
+def test_invalid_json(raw):
+    with pytest.raises(json.JSONDecodeError):
+        list(JSONItemStream([raw], "data"))